@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+from corsheaders.defaults import default_headers
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -34,7 +35,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -112,6 +115,25 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# ⚡ Media is content-addressed: one copy per SHA-256, hashed while the
+# upload streams in (core/storage.py). `manage.py gc_media` frees orphans.
+STORAGES = {
+    'default': {'BACKEND': 'core.storage.ContentAddressedStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+FILE_UPLOAD_HANDLERS = [
+    'core.storage.HashingMemoryFileUploadHandler',
+    'core.storage.HashingTemporaryFileUploadHandler',
+]
+
+# ⚡ Let the front proxy send video files (core/media.py): 'nginx' answers
+# with X-Accel-Redirect to MEDIA_ACCEL_PREFIX + name (an `internal` location
+# aliased to MEDIA_ROOT), 'apache' with X-Sendfile. Empty streams from Django.
+MEDIA_SENDFILE = os.getenv('MEDIA_SENDFILE', '')
+MEDIA_ACCEL_PREFIX = os.getenv('MEDIA_ACCEL_PREFIX', '/protected-media/')
+# Lifetime (seconds) of the signed ?token= in video stream URLs - one video each
+MEDIA_STREAM_TOKEN_MAX_AGE = int(os.getenv('MEDIA_STREAM_TOKEN_MAX_AGE', '21600'))
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'core.User'
@@ -122,6 +144,10 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# ⚡ Resumable uploads (core/uploads.py) send and read these
+CORS_ALLOW_HEADERS = (*default_headers, 'upload-offset', 'upload-checksum')
+CORS_EXPOSE_HEADERS = ['Upload-Offset', 'Location', 'Server-Timing']
+
 # ⚡ REPLACE YOUR REST_FRAMEWORK WITH THIS OPTIMIZED VERSION
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -130,6 +156,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # ⚡ orjson-backed when installed; the browsable API only while debugging
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
     # ⚡ ADD THESE 3 LINES BELOW
@@ -140,6 +171,89 @@ REST_FRAMEWORK = {
     ],
 }
 
+# ⚡ Background Excel/CSV imports: the database is the queue.
+# True  -> the web process runs each job on a daemon thread right after upload
+# False -> jobs wait for `python manage.py import_worker`
+IMPORT_JOBS_INLINE_THREAD = os.getenv('IMPORT_JOBS_INLINE_THREAD', 'True') == 'True'
+# A RUNNING job without progress for this long is reclaimed (its worker died);
+# after IMPORT_JOB_MAX_ATTEMPTS claims it is marked FAILED instead
+IMPORT_JOB_STALE_MINUTES = int(os.getenv('IMPORT_JOB_STALE_MINUTES', '10'))
+IMPORT_JOB_MAX_ATTEMPTS = int(os.getenv('IMPORT_JOB_MAX_ATTEMPTS', '3'))
+
+# ⚡ Video duration/thumbnail/preview extraction - same queue scheme.
+# True  -> a daemon thread in the web process handles each upload
+# False -> videos wait for `python manage.py video_worker`
+VIDEO_PROCESSING_INLINE_THREAD = os.getenv('VIDEO_PROCESSING_INLINE_THREAD', 'True') == 'True'
+# A RUNNING video without a heartbeat for this long is reclaimed (its thread or
+# worker died - e.g. a recycled gunicorn worker); after VIDEO_PROCESSING_MAX_ATTEMPTS
+# claims it is marked FAILED instead. Longer than one ffmpeg call (FFMPEG_TIMEOUT)
+VIDEO_PROCESSING_STALE_MINUTES = int(os.getenv('VIDEO_PROCESSING_STALE_MINUTES', '15'))
+VIDEO_PROCESSING_MAX_ATTEMPTS = int(os.getenv('VIDEO_PROCESSING_MAX_ATTEMPTS', '3'))
+# Without ffmpeg only the duration of MP4/MOV files is filled in
+FFMPEG_BINARY = os.getenv('FFMPEG_BINARY', 'ffmpeg')
+FFPROBE_BINARY = os.getenv('FFPROBE_BINARY', 'ffprobe')
+
+# ⚡ Dashboard statistics read the ApplicationDailyRollup table instead of
+# re-aggregating every application (`python manage.py rebuild_rollups` resyncs it)
+STATS_FROM_ROLLUPS = os.getenv('STATS_FROM_ROLLUPS', 'True') == 'True'
+
+# ⚡ Cache for metadata endpoints, invalidated by a data version counter.
+# locmem (default) -> per-process, fine for a single worker
+# file / db        -> shared by every worker (db needs `python manage.py createcachetable`)
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+# Conditional GET (core/conditional.py) answers 304 only from a shared cache: with
+# a per-process one a write bumps the data version of one worker, and the others
+# would keep confirming the old ETag. Set True for locmem only with a single process
+CACHE_SHARED = os.getenv('CACHE_SHARED', str(CACHE_BACKEND != 'locmem')) == 'True'
+CACHES = {
+    'default': {
+        'locmem': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'opencourt',
+        },
+        'file': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+        },
+        'db': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': os.getenv('CACHE_LOCATION', 'django_cache'),
+        },
+    }[CACHE_BACKEND]
+}
+
+# ⚡ Response compression (core.middleware.CompressionMiddleware).
+# Encodings in preference order - br / zstd need the brotli / zstandard
+# packages and are skipped without them. Empty disables compression.
+RESPONSE_COMPRESSION_ENCODINGS = [
+    name for name in os.getenv('RESPONSE_COMPRESSION_ENCODINGS', 'br,zstd,gzip').split(',') if name
+]
+# Smaller bodies are sent uncompressed
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv('RESPONSE_COMPRESSION_MIN_SIZE', '1024'))
+
+# ⚡ Per-request instrumentation (core/metrics.py): Server-Timing headers,
+# a JSON log line per request and Prometheus metrics at /api/metrics/
+REQUEST_METRICS = os.getenv('REQUEST_METRICS', 'True') == 'True'
+# Warn when one SELECT runs this many times in a request (0 disables)
+REQUEST_METRICS_N_PLUS_ONE = int(os.getenv('REQUEST_METRICS_N_PLUS_ONE', '10'))
+# Scrapers send `Authorization: Bearer <token>`; without a token only admins can read the metrics
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'core.metrics': {
+            'handlers': ['console'],
+            'level': os.getenv('REQUEST_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=5),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
@@ -0,0 +1,240 @@
+# backend/benchmarks/bench_api.py
+"""
+Hot API endpoints at growing table sizes, as a JSON report comparable across commits.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_api --sizes 1000,10000,100000 --output bench-main.json
+    python -m benchmarks.bench_api --sizes 1000,10000,100000 --compare bench-main.json
+    python -m benchmarks.bench_api --sizes 1000000 --repeat 3     # ~1M rows: tens of minutes
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.utils import setup_django, benchmark_database, BASE_DIR
+
+setup_django()
+
+import django  # noqa: E402
+from django.db import connection  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+from core.importer import upsert_applications  # noqa: E402
+from core.metrics import registry  # noqa: E402
+from core.models import OpenCourtApplication, User  # noqa: E402
+from benchmarks.bench_pagination import PAGE_SIZE, keyset_cursor  # noqa: E402
+from benchmarks.data import synthetic_applications, write_workbook  # noqa: E402
+
+REPORT_VERSION = 1
+# A scenario this much slower than the baseline is flagged as a regression
+DEFAULT_THRESHOLD = 1.25
+
+
+# =====================================================
+# SCENARIOS
+# =====================================================
+# name -> (url, query params for a table of `rows` rows, samples per run)
+
+def scenarios(rows, repeat):
+    deep_page = max(1, rows // PAGE_SIZE * 9 // 10)
+    return {
+        'list': ('/api/applications/', {'page_size': PAGE_SIZE}, repeat),
+        'list_filtered': ('/api/applications/', {
+            'page_size': PAGE_SIZE, 'police_station': 'Shahdara', 'status': 'PENDING',
+            'from_date': '2025-03-01', 'to_date': '2025-09-30',
+        }, repeat),
+        'list_search': ('/api/applications/', {'page_size': PAGE_SIZE, 'search': 'Bhatti'}, repeat),
+        'deep_page_number': ('/api/applications/', {'page_size': PAGE_SIZE, 'page': deep_page}, repeat),
+        'deep_page_cursor': ('/api/applications/', {
+            'page_size': PAGE_SIZE, 'pagination': 'cursor', 'cursor': keyset_cursor(deep_page),
+        } if deep_page > 1 else {'page_size': PAGE_SIZE, 'pagination': 'cursor'}, repeat),
+        'dashboard_stats': ('/api/dashboard-stats/', {}, repeat),
+        'export_csv': ('/api/export-applications/', {'format': 'csv'}, max(1, repeat // 3)),
+    }
+
+
+def sql_totals():
+    """(queries, db seconds) RequestMetricsMiddleware has recorded so far, all views together"""
+    with registry.lock:
+        return sum(registry.queries.values()), sum(registry.db_seconds.values())
+
+
+def measure(send, repeat):
+    """
+    Latency stats of `repeat` calls of send(), with the SQL numbers the
+    metrics middleware recorded - streamed bodies included, since a
+    response is recorded when it closes (after the join below)
+    """
+    samples, db_ms, queries, size = [], [], None, 0
+    for _ in range(repeat):
+        queries_before, db_before = sql_totals()
+        start = time.perf_counter()
+        response = send()
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, (response.status_code, body[:200])
+
+        size = len(body)
+        queries_after, db_after = sql_totals()
+        if queries_after > queries_before:
+            queries = queries_after - queries_before
+            db_ms.append((db_after - db_before) * 1000)
+
+    samples.sort()
+    return {
+        'median_ms': round(statistics.median(samples), 2),
+        'p95_ms': round(samples[min(len(samples) - 1, round(len(samples) * 0.95))], 2),
+        'min_ms': round(samples[0], 2),
+        'samples': len(samples),
+        'queries': queries,
+        'db_ms': round(statistics.median(db_ms), 2) if db_ms else None,
+        'bytes': size,
+    }
+
+
+def upload(client, path):
+    with open(path, 'rb') as handle:
+        return client.post('/api/upload-excel/', {'file': handle})
+
+
+def top_up(rows, creator):
+    """Grow the table to `rows` rows with the import path the app itself uses"""
+    existing = OpenCourtApplication.objects.count()
+    if rows > existing:
+        upsert_applications(
+            synthetic_applications(rows - existing, seed=existing, start_sr_no=existing + 1),
+            created_by=creator,
+        )
+
+
+def workbook(rows, workdir):
+    """Synthetic register re-uploading every row (all updates) - cached between runs"""
+    path = os.path.join(workdir, f'applications-{rows}.xlsx')
+    if not os.path.exists(path):
+        print(f"  writing {rows}-row workbook...", flush=True)
+        write_workbook(path, rows, seed=1)
+    return path
+
+
+def run(sizes, repeat, workdir, skip_upload=False):
+    results = {}
+    with benchmark_database():
+        creator = User.objects.create(username='bench', role='ADMIN')
+        client = APIClient()
+        client.force_authenticate(creator)
+
+        for rows in sorted(sizes):
+            print(f"\n📊 {rows} rows", flush=True)
+            start = time.perf_counter()
+            top_up(rows, creator)
+            print(f"  loaded in {time.perf_counter() - start:.1f}s", flush=True)
+
+            results[str(rows)] = timings = {}
+            for name, (url, params, samples) in scenarios(rows, repeat).items():
+                timings[name] = measure(lambda: client.get(url, params), samples)
+                queries = timings[name]['queries']
+                print(f"  {name:<18} {timings[name]['median_ms']:10.1f} ms"
+                      + (f"  {queries:>3} queries" if queries is not None else ''), flush=True)
+
+            if not skip_upload:
+                # Last: it rewrites every row (same Sr.Nos, other values)
+                path = workbook(rows, workdir)
+                timings['upload_excel'] = measure(lambda: upload(client, path), 1)
+                print(f"  {'upload_excel':<18} {timings['upload_excel']['median_ms']:10.1f} ms", flush=True)
+
+    return results
+
+
+# =====================================================
+# REPORT
+# =====================================================
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    try:
+        import orjson  # noqa: F401
+        json_backend = 'orjson'
+    except ImportError:
+        json_backend = 'json'
+    return {
+        'commit': git_commit(),
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'json': json_backend,
+        'machine': f'{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs',
+    }
+
+
+def compare(report, baseline, threshold):
+    """Print median ratios against an earlier report; returns the regressed (size, scenario) pairs"""
+    print(f"\n📊 vs {baseline['environment'].get('commit') or 'baseline'} "
+          f"(regression: ≥{threshold:.2f}x slower)")
+    print("=" * 72)
+    regressions = []
+    for rows, timings in report['results'].items():
+        for name, current in timings.items():
+            previous = baseline['results'].get(rows, {}).get(name)
+            if previous is None:
+                continue
+            ratio = current['median_ms'] / previous['median_ms'] if previous['median_ms'] else 1
+            flag = ''
+            if ratio >= threshold:
+                flag = '  ⚠️ slower'
+                regressions.append((rows, name))
+            elif ratio <= 1 / threshold:
+                flag = '  ⚡ faster'
+            print(f"{rows:>8} {name:<18} {previous['median_ms']:10.1f} → {current['median_ms']:10.1f} ms"
+                  f"  {ratio:5.2f}x{flag}")
+    print("=" * 72)
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help='Comma-separated table sizes (1000000 works, slowly)')
+    parser.add_argument('--repeat', type=int, default=9, help='Samples per endpoint (median reported)')
+    parser.add_argument('--output', help='Write the JSON report here')
+    parser.add_argument('--compare', help='Earlier JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--workdir', default=os.path.join(tempfile.gettempdir(), 'opencourt-bench'),
+                        help='Where synthetic workbooks are cached')
+    parser.add_argument('--skip-upload', action='store_true', help='Leave out upload_excel')
+    args = parser.parse_args()
+
+    # One JSON line per request would drown the table (N+1 warnings still show)
+    logging.getLogger('core.metrics').setLevel(logging.WARNING)
+    os.makedirs(args.workdir, exist_ok=True)
+
+    report = {
+        'version': REPORT_VERSION,
+        'environment': environment(),
+        'repeat': args.repeat,
+        'results': run([int(size) for size in args.sizes.split(',')], args.repeat, args.workdir, args.skip_upload),
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\n💾 Report written to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            regressions = compare(report, json.load(handle), args.threshold)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_compression.py
+"""
+Response size and render time: identity vs gzip/br/zstd, stdlib json vs orjson.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_compression --rows 50000
+"""
+
+import argparse
+import statistics
+import time
+from unittest import mock
+
+from benchmarks.utils import setup_django, benchmark_database
+
+setup_django()
+
+from django.test import override_settings  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+from core.middleware import CODECS  # noqa: E402
+from core.models import OpenCourtApplication, User  # noqa: E402
+from core.renderers import FastJSONRenderer  # noqa: E402
+from core.serializers import OpenCourtApplicationSerializer  # noqa: E402
+from benchmarks.bench_excel_upsert import synthetic_records  # noqa: E402
+
+
+def median_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def wire_bytes(client, url, params, encoding):
+    response = client.get(url, params, HTTP_ACCEPT_ENCODING=encoding)
+    assert response.status_code == 200, response.status_code
+    body = b''.join(response.streaming_content) if response.streaming else response.content
+    return response.get('Content-Encoding', 'identity'), len(body)
+
+
+def run(rows, repeat):
+    with benchmark_database():
+        creator = User.objects.create(username='bench', role='ADMIN')
+        OpenCourtApplication.objects.bulk_create(
+            (
+                OpenCourtApplication(**data, created_by=creator, remarks='Called applicant; hearing notes ' * 4)
+                for _, data in synthetic_records(rows)
+            ),
+            batch_size=2000,
+        )
+        client = APIClient()
+        client.force_authenticate(creator)
+
+        encodings = ['identity', *CODECS]
+        sizes = {}
+        with override_settings(RESPONSE_COMPRESSION_ENCODINGS=list(CODECS)):
+            for label, url, params in [
+                ('list (1000 rows)', '/api/applications/', {'page_size': 1000}),
+                (f'csv export ({rows})', '/api/export-applications/', {'format': 'csv'}),
+                (f'ndjson export ({rows})', '/api/export-applications/', {'format': 'ndjson'}),
+            ]:
+                sizes[label] = {encoding: wire_bytes(client, url, params, encoding) for encoding in encodings}
+
+        data = OpenCourtApplicationSerializer(OpenCourtApplication.objects.all()[:5000], many=True).data
+        stdlib_ms = median_ms(lambda: JSONRenderer().render(data), repeat)
+        fast_ms = median_ms(lambda: FastJSONRenderer().render(data), repeat)
+        with mock.patch('core.renderers.orjson', None):
+            fallback_ms = median_ms(lambda: FastJSONRenderer().render(data), repeat)
+
+    print(f"\n📊 Bytes on the wire - {rows} rows")
+    print("=" * 70)
+    print(f"{'':<24}" + ''.join(f"{encoding:>11}" for encoding in encodings))
+    for label, by_encoding in sizes.items():
+        cells = []
+        for encoding in encodings:
+            applied, size = by_encoding[encoding]
+            cells.append(f"{size / 1024:9.0f}KB" if applied == encoding else f"{'-':>11}")
+        print(f"{label:<24}" + ''.join(cells))
+    print("=" * 70)
+
+    print(f"\n📊 Rendering 5000 serialized applications, median of {repeat}")
+    print("=" * 50)
+    print(f"{'DRF JSONRenderer':<28} {stdlib_ms:8.1f} ms")
+    print(f"{'FastJSONRenderer (orjson)':<28} {fast_ms:8.1f} ms")
+    print(f"{'FastJSONRenderer (fallback)':<28} {fallback_ms:8.1f} ms")
+    print("=" * 50)
+    print(f"⚡ orjson: {stdlib_ms / fast_ms:.1f}x faster")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,49 @@
+# backend/benchmarks/bench_excel_read.py
+"""
+Excel parsing memory: default load_workbook vs the streaming read-only reader.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_excel_read "April3File.xlsx"
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+import openpyxl  # noqa: E402
+from core.importer import iter_sheet_rows  # noqa: E402
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {rows:>8} rows  {elapsed:7.2f}s  peak {peak / (1024 * 1024):8.1f} MB")
+
+
+def full_load(path):
+    sheet = openpyxl.load_workbook(path).active
+    return sum(1 for _ in sheet.iter_rows(min_row=2, values_only=True))
+
+
+def streamed(path):
+    return sum(1 for _ in iter_sheet_rows(path))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('path')
+    args = parser.parse_args()
+
+    print(f"\n📊 Parsing {args.path}")
+    print("=" * 50)
+    measure('full_load', lambda: full_load(args.path))
+    measure('streamed', lambda: streamed(args.path))
+    print("=" * 50)
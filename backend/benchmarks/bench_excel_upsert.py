@@ -0,0 +1,93 @@
+# backend/benchmarks/bench_excel_upsert.py
+"""
+Excel import write path: per-row update_or_create vs chunked bulk upsert.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_excel_upsert --rows 20000
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+
+from benchmarks.utils import setup_django, benchmark_database, timer
+
+setup_django()
+
+from core.models import OpenCourtApplication, User  # noqa: E402
+from core.importer import upsert_applications  # noqa: E402
+
+
+def synthetic_records(count, seed=0):
+    """Rows shaped like the ones upload_excel hands to the importer"""
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    for i in range(1, count + 1):
+        yield i + 1, {
+            'sr_no': i,
+            'dairy_no': f'D-{i:06d}',
+            'name': f'Applicant {i}',
+            'contact': f'0300{rng.randint(1000000, 9999999)}',
+            'marked_to': 'SHO',
+            'date': start + timedelta(days=rng.randint(0, 365)),
+            'marked_by': 'DPO',
+            'timeline': '7 days',
+            'police_station': f'PS {rng.randint(1, 60)}',
+            'division': f'Division {rng.randint(1, 6)}',
+            'category': rng.choice(['Fraud', 'Theft', 'Harassment', 'Property', 'Other']),
+            'status': 'PENDING',
+            'days': rng.randint(0, 90),
+            'feedback': 'PENDING',
+            'dairy_ps': '',
+        }
+
+
+def legacy_import(records, user):
+    """The pre-bulk implementation: update_or_create + save() per row"""
+    created = updated = 0
+    for _, data in records:
+        defaults = {k: v for k, v in data.items() if k != 'sr_no'}
+        application, was_created = OpenCourtApplication.objects.update_or_create(
+            sr_no=data['sr_no'], defaults=defaults
+        )
+        if was_created:
+            application.created_by = user
+            application.save()
+            created += 1
+        else:
+            updated += 1
+    return {'created': created, 'updated': updated, 'errors': []}
+
+
+def run(rows):
+    timings = {}
+    with benchmark_database():
+        user = User.objects.create(username='bench', role='ADMIN')
+
+        with timer(timings, 'legacy_insert'):
+            legacy_import(synthetic_records(rows), user)
+        with timer(timings, 'legacy_update'):
+            legacy_import(synthetic_records(rows, seed=1), user)
+
+        OpenCourtApplication.objects.all().delete()
+
+        with timer(timings, 'bulk_insert'):
+            upsert_applications(synthetic_records(rows), created_by=user)
+        with timer(timings, 'bulk_update'):
+            upsert_applications(synthetic_records(rows, seed=1), created_by=user)
+
+    print(f"\n📊 Excel import write path - {rows} rows")
+    print("=" * 50)
+    for label, seconds in timings.items():
+        print(f"{label:<15} {seconds:8.2f}s  {rows / seconds:10.0f} rows/sec")
+    print("=" * 50)
+    print(f"⚡ Insert speed-up: {timings['legacy_insert'] / timings['bulk_insert']:.1f}x")
+    print(f"⚡ Update speed-up: {timings['legacy_update'] / timings['bulk_update']:.1f}x")
+    return timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    args = parser.parse_args()
+    run(args.rows)
@@ -0,0 +1,75 @@
+# backend/benchmarks/bench_list_projection.py
+"""
+Applications list: full serializer vs the ?fields= projection (values() fast path).
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_list_projection --rows 5000 --page-size 1000
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.utils import setup_django, benchmark_database
+
+setup_django()
+
+from rest_framework.test import APIClient  # noqa: E402
+from core.models import OpenCourtApplication, User  # noqa: E402
+from benchmarks.bench_excel_upsert import synthetic_records  # noqa: E402
+
+# What the frontend tables request (APPLICATION_TABLE_FIELDS in services/api.js)
+TABLE_FIELDS = (
+    'id,sr_no,dairy_no,name,contact,marked_to,date,'
+    'police_station,division,category,status,days,feedback'
+)
+
+
+def measure(client, params, repeat):
+    """(median ms, response bytes)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get('/api/applications/', params)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.content[:200]
+    return statistics.median(samples), len(response.content)
+
+
+def run(rows, page_size, repeat):
+    with benchmark_database():
+        creator = User.objects.create(username='bench', role='ADMIN')
+        OpenCourtApplication.objects.bulk_create(
+            (
+                OpenCourtApplication(**data, created_by=creator, remarks='Called applicant; hearing notes ' * 4)
+                for _, data in synthetic_records(rows)
+            ),
+            batch_size=2000,
+        )
+        client = APIClient()
+        client.force_authenticate(creator)
+
+        params = {'page_size': page_size}
+        results = {
+            'full serializer': measure(client, params, repeat),
+            '?fields= (table)': measure(client, {**params, 'fields': TABLE_FIELDS}, repeat),
+            '?fields=sr_no,name': measure(client, {**params, 'fields': 'sr_no,name'}, repeat),
+        }
+
+    print(f"\n📊 /api/applications/?page_size={page_size} - {rows} rows, median of {repeat}")
+    print("=" * 60)
+    for label, (ms, size) in results.items():
+        print(f"{label:<20} {ms:8.1f} ms {size / 1024:10.1f} KB")
+    print("=" * 60)
+    full_ms, full_size = results['full serializer']
+    table_ms, table_size = results['?fields= (table)']
+    print(f"⚡ table projection: {full_ms / table_ms:.1f}x faster, {full_size / table_size:.1f}x smaller")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=9)
+    args = parser.parse_args()
+    run(args.rows, args.page_size, args.repeat)
@@ -0,0 +1,164 @@
+# backend/benchmarks/bench_normalize.py
+"""
+Row normalization throughput: legacy per-cell branching vs columnar chunks.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_normalize --rows 100000
+    python -m benchmarks.bench_normalize --rows 100000 --workbook   # also parse a real .xlsx
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+import openpyxl  # noqa: E402
+from django.utils.dateparse import parse_date  # noqa: E402
+from core.importer import (  # noqa: E402
+    COLUMN_CONVERTERS, FIELD_ORDER, IMPORT_CHUNK_SIZE, _chunked, _to_int,
+    detect_columns, iter_application_rows, normalize_chunk,
+)
+
+HEADER = (
+    'Sr.No', 'Dairy No ', 'Name', 'Contact', 'Marked To', 'Date', 'Marked By',
+    'Timeline', 'P.S', 'DIVISON', 'Category', 'Status', 'Days', 'Feedback', None,
+)
+
+
+def synthetic_sheet_rows(count, seed=0):
+    """Raw cell tuples shaped like openpyxl's values_only rows"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    stations = [f'PS {i}' for i in range(1, 61)]
+    for i in range(1, count + 1):
+        yield i + 1, (
+            i, f'{rng.randint(1, 999)}-KK', f'Applicant {i}', rng.randint(3000000000, 3499999999),
+            'SDPO', start + timedelta(days=rng.randint(0, 365)), 'DIG', '07Days',
+            rng.choice(stations), rng.choice(['CITY', 'MODEL TOWN', 'CANTT', 'SADDAR']),
+            rng.choice(['Misc', 'Fraud', 'Property', 'Harassment']),
+            rng.choice(['Pending', 'Heard', 'Closed', None]), rng.randint(0, 400),
+            rng.choice(['Positive', 'Negative', None]), rng.choice(['JAMIL', None]),
+        )
+
+
+def as_csv_cells(rows):
+    """The same rows as the CSV reader yields them - every cell a string"""
+    for row_num, values in rows:
+        yield row_num, tuple(
+            None if value is None else (value.date().isoformat() if isinstance(value, datetime) else str(value))
+            for value in values
+        )
+
+
+def legacy_normalize(row):
+    """Per-row normalization as load_excel_data.py did it before the shared importer"""
+    sr_no, dairy_no, name, contact, marked_to, date_value, marked_by, timeline, \
+        police_station, division, category, status_value, days, feedback_value = row[:14]
+    dairy_ps = row[14] if len(row) > 14 else ''
+    if not sr_no:
+        return None
+    if isinstance(date_value, datetime):
+        date_value = date_value.date()
+    elif isinstance(date_value, str) and date_value:
+        try:
+            date_value = parse_date(date_value)
+        except Exception:
+            date_value = None
+    else:
+        date_value = None
+    if days:
+        try:
+            days = int(days)
+        except Exception:
+            days = None
+    else:
+        days = None
+    status_mapping = {'Pending': 'PENDING', 'Heard': 'HEARD', 'Referred': 'REFERRED', 'Closed': 'CLOSED'}
+    feedback_mapping = {'Positive': 'POSITIVE', 'Negative': 'NEGATIVE', 'Pending': 'PENDING'}
+    return {
+        'sr_no': int(sr_no),
+        'dairy_no': str(dairy_no) if dairy_no else '',
+        'name': str(name) if name else '',
+        'contact': str(contact) if contact else '',
+        'marked_to': str(marked_to) if marked_to else '',
+        'date': date_value,
+        'marked_by': str(marked_by) if marked_by else '',
+        'timeline': str(timeline) if timeline else '',
+        'police_station': str(police_station) if police_station else '',
+        'division': str(division) if division else '',
+        'category': str(category) if category else '',
+        'status': status_mapping.get(str(status_value).strip(), 'PENDING') if status_value else 'PENDING',
+        'days': days,
+        'feedback': feedback_mapping.get(str(feedback_value).strip(), 'PENDING') if feedback_value else 'PENDING',
+        'dairy_ps': str(dairy_ps) if dairy_ps else '',
+    }
+
+
+def report(label, rows, seconds):
+    print(f"{label:<22} {seconds:7.2f}s  {rows / seconds:12.0f} rows/sec")
+
+
+def compare(label, raw, columns):
+    start = time.perf_counter()
+    for _, values in raw:
+        legacy_normalize(values)
+    legacy = time.perf_counter() - start
+    report(f'{label} legacy', len(raw), legacy)
+
+    # Same rules as the importer, applied cell by cell
+    converters = [(field, columns[field], COLUMN_CONVERTERS.get(field, _to_int)) for field in FIELD_ORDER]
+    start = time.perf_counter()
+    for _, values in raw:
+        {field: convert(values[index]) for field, index, convert in converters}
+    per_cell = time.perf_counter() - start
+    report(f'{label} per-cell', len(raw), per_cell)
+
+    tables = {}
+    start = time.perf_counter()
+    for chunk in _chunked(raw, IMPORT_CHUNK_SIZE):
+        normalize_chunk(chunk, columns, tables=tables)
+    columnar = time.perf_counter() - start
+    report(f'{label} columnar', len(raw), columnar)
+    print(f"⚡ {label} columnar vs per-cell: {per_cell / columnar:.1f}x, vs legacy: {legacy / columnar:.1f}x")
+
+
+def run(rows, workbook=False):
+    raw = list(synthetic_sheet_rows(rows))
+    columns = detect_columns(HEADER)
+
+    print(f"\n📊 Row normalization - {rows} rows")
+    print("=" * 55)
+    compare('xlsx cells', raw, columns)
+    compare('csv cells', list(as_csv_cells(raw)), columns)
+
+    if workbook:
+        fd, path = tempfile.mkstemp(suffix='.xlsx')
+        os.close(fd)
+        try:
+            book = openpyxl.Workbook(write_only=True)
+            sheet = book.create_sheet()
+            sheet.append(HEADER)
+            for _, values in raw:
+                sheet.append(values)
+            book.save(path)
+
+            start = time.perf_counter()
+            parsed = sum(1 for _ in iter_application_rows(path))
+            report('xlsx end-to-end', parsed, time.perf_counter() - start)
+        finally:
+            os.remove(path)
+    print("=" * 55)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--workbook', action='store_true', help='Also time streaming a generated .xlsx')
+    args = parser.parse_args()
+    run(args.rows, workbook=args.workbook)
@@ -0,0 +1,84 @@
+# backend/benchmarks/bench_pagination.py
+"""
+Applications list latency: page-number (OFFSET + COUNT) vs keyset cursor pages.
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_pagination --rows 50000 --page 500
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.utils import setup_django, benchmark_database
+
+setup_django()
+
+from rest_framework.test import APIClient  # noqa: E402
+from core.models import OpenCourtApplication, User  # noqa: E402
+from core.pagination import KeysetPagination  # noqa: E402
+from benchmarks.bench_excel_upsert import synthetic_records  # noqa: E402
+
+PAGE_SIZE = 50
+
+
+def median_ms(client, params, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get('/api/applications/', params)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.content[:200]
+    return statistics.median(samples)
+
+
+def keyset_cursor(page):
+    """Cursor a client would hold after walking to `page` (default -created_at ordering)"""
+    paginator = KeysetPagination()
+    paginator.ordering = paginator.default_ordering
+    paginator.fields, _ = paginator.orderings[paginator.ordering]
+    last = (
+        OpenCourtApplication.objects.order_by('-created_at', '-id')
+        .values_list(*paginator.fields)[(page - 1) * PAGE_SIZE - 1]
+    )
+    return paginator.encode_cursor(last)
+
+
+def run(rows, page, repeat):
+    with benchmark_database():
+        OpenCourtApplication.objects.bulk_create(
+            (OpenCourtApplication(**data) for _, data in synthetic_records(rows)),
+            batch_size=2000,
+        )
+        client = APIClient()
+        client.force_authenticate(User.objects.create(username='bench', role='ADMIN'))
+
+        cursor = keyset_cursor(page)
+        results = {
+            'page-number p1': median_ms(client, {'page_size': PAGE_SIZE}, repeat),
+            f'page-number p{page}': median_ms(client, {'page_size': PAGE_SIZE, 'page': page}, repeat),
+            'keyset p1': median_ms(client, {'pagination': 'cursor', 'page_size': PAGE_SIZE}, repeat),
+            f'keyset p{page}': median_ms(
+                client, {'pagination': 'cursor', 'page_size': PAGE_SIZE, 'cursor': cursor}, repeat
+            ),
+        }
+
+    print(f"\n📊 Applications list - {rows} rows, {PAGE_SIZE} per page, median of {repeat}")
+    print("=" * 55)
+    for label, ms in results.items():
+        print(f"{label:<22} {ms:8.1f} ms")
+    print("=" * 55)
+    print(f"⚡ page {page} / page 1: page-number "
+          f"{results[f'page-number p{page}'] / results['page-number p1']:.1f}x, "
+          f"keyset {results[f'keyset p{page}'] / results['keyset p1']:.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--page', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=15)
+    args = parser.parse_args()
+    if args.page * PAGE_SIZE > args.rows:
+        parser.error('--rows must cover --page pages of 50')
+    run(args.rows, args.page, args.repeat)
@@ -0,0 +1,62 @@
+# backend/benchmarks/bench_search.py
+"""
+Application search: icontains OR chain vs the search index (core/search.py).
+
+Usage (from the backend/ directory):
+    python -m benchmarks.bench_search --rows 100000
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.utils import setup_django, benchmark_database
+
+setup_django()
+
+from django.db import connection  # noqa: E402
+from core.models import OpenCourtApplication  # noqa: E402
+from core.search import contains_filter, search_applications, search_backend  # noqa: E402
+from benchmarks.bench_excel_upsert import synthetic_records  # noqa: E402
+
+# (label, term): a rare hit, a common hit and a miss
+TERMS = [('rare', 'Applicant 4242'), ('common', 'Applicant 9'), ('miss', 'zzqx')]
+
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(rows, repeat):
+    with benchmark_database():
+        OpenCourtApplication.objects.bulk_create(
+            (OpenCourtApplication(**data) for _, data in synthetic_records(rows)),
+            batch_size=2000,
+        )
+        queryset = OpenCourtApplication.objects.all()
+
+        print(f"\n📊 Search - {rows} rows, first page of 50, median of {repeat} ({connection.vendor}, index: {search_backend()})")
+        print("=" * 60)
+        for label, term in TERMS:
+            legacy = median_ms(
+                lambda: list(queryset.filter(contains_filter(term)).order_by('-created_at')[:50]), repeat
+            )
+            indexed = median_ms(
+                lambda: list(search_applications(queryset, term).order_by('search_rank', '-created_at')[:50]), repeat
+            )
+            hits = search_applications(queryset, term).count()
+            print(f"{label:<7} {hits:>6} hits   icontains {legacy:8.1f} ms   index {indexed:8.1f} ms   ⚡ {legacy / indexed:.1f}x")
+        print("=" * 60)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=9)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,153 @@
+# backend/benchmarks/data.py
+"""
+Synthetic open court applications for benchmarks and local testing.
+
+The shape follows the real registers: a handful of divisions with a long
+tail of police stations, categories dominated by Misc/FIR, hearings only
+on working days, and about half the sheet rows without a station,
+division or category. Older applications are more likely to be heard or
+closed and to have feedback. The same seed always gives the same rows.
+
+Used by `manage.py generate_synthetic_data` and benchmarks/bench_api.py.
+"""
+
+import random
+from datetime import date, timedelta
+from itertools import accumulate
+
+import openpyxl
+
+# Division -> its police stations, busiest first
+STATIONS = {
+    'CITY': [
+        'Shahdara', 'Islampura', 'Shahdara Town', 'Akbari Gate', 'Bhati Gate', 'Lohari Gate',
+        'Mozang', 'Ravi Road', 'Tibbi City', 'Data Darbar',
+    ],
+    'CANTT': [
+        'Shadbagh', 'Baghbanpura', 'Factory Area', 'Harbanspura', 'Mughalpura', 'Ghaziabad',
+        'North Cantt', 'Cantt',
+    ],
+    'MODEL TOWN': ['Kahna', 'Township', 'Kot Lakhpat', 'Green Town', 'Model Town', 'Faisal Town', 'Nishtar Colony'],
+    'SADAR': ['Raiwind', 'Chung', 'Manga Mandi', 'Hair', 'Sundar', 'Nawab Town'],
+    'IQBAL TOWN': ['Sabzazar', 'Gulshan-e-Ravi', 'Samanabad', 'Iqbal Town', 'Sanda', 'Nawankot'],
+    'CIVIL LINES': ['Gujjarpura', 'Garhi Shahu', 'Race Course', 'Qila Gujjar Singh', 'Old Anarkali', 'Civil Lines'],
+}
+DIVISION_WEIGHTS = {'CITY': 28, 'CANTT': 20, 'MODEL TOWN': 15, 'SADAR': 14, 'IQBAL TOWN': 14, 'CIVIL LINES': 11}
+
+CATEGORY_WEIGHTS = {
+    'Misc': 590, 'FIR': 255, 'A/P': 100, 'Har': 23, 'Property': 8, 'Threats': 8, 'L/G': 6,
+    'Financial Welfare/Help': 2, 'Political Dispute': 2, 'Religous Dispute': 2, 'Police Employee Case': 2,
+    'Other District': 1, 'Other Department': 1, 'Informant': 1,
+}
+TIMELINE_WEIGHTS = {'07Days': 57, '03Days': 40, '05Days': 2, 'Nill': 1}
+# Monday..Saturday; no hearings on Sunday
+WEEKDAY_WEIGHTS = [20, 18, 17, 17, 12, 14, 0]
+
+FIRST_NAMES = [
+    'Muhammad', 'Ali', 'Ahmed', 'Hassan', 'Usman', 'Bilal', 'Imran', 'Asif', 'Tariq', 'Zahid', 'Naveed',
+    'Fatima', 'Ayesha', 'Maryam', 'Sana', 'Nadia', 'Rubina', 'Shazia', 'Khalid', 'Rashid', 'Sajid', 'Waqas',
+]
+LAST_NAMES = [
+    'Khan', 'Ahmed', 'Ali', 'Butt', 'Malik', 'Sheikh', 'Chaudhry', 'Qureshi', 'Raza', 'Iqbal', 'Hussain',
+    'Javed', 'Akhtar', 'Rana', 'Mirza', 'Bhatti', 'Anwar', 'Aslam',
+]
+
+# Share of rows with no station / division / category in the sheets
+BLANK_RATE = 0.5
+START_DATE = date(2025, 1, 1)
+DAYS = 365
+
+# Header of the registers as they are uploaded
+SHEET_HEADER = [
+    'Sr.No', 'Dairy No', 'Name', 'Contact', 'Marked To', 'Date', 'Marked By', 'Timeline',
+    'P.S', 'DIVISON', 'Category', 'Status', 'Days', 'Feedback', 'Dairy PS',
+]
+SHEET_FIELDS = [
+    'sr_no', 'dairy_no', 'name', 'contact', 'marked_to', 'date', 'marked_by', 'timeline',
+    'police_station', 'division', 'category', 'status', 'days', 'feedback', 'dairy_ps',
+]
+
+
+def _cumulative(weights):
+    """(values, cumulative weights) - rng.choices is much faster given cum_weights"""
+    return list(weights), list(accumulate(weights.values()))
+
+
+def _station_weights():
+    # Zipf-like: the busiest station of a division sees ~3x the traffic of the quietest
+    stations = {}
+    for division, names in STATIONS.items():
+        shares = [1 / (rank ** 0.8) for rank in range(1, len(names) + 1)]
+        for name, share in zip(names, shares):
+            stations[(division, name)] = DIVISION_WEIGHTS[division] * share / sum(shares)
+    return stations
+
+
+def _hearing_days():
+    days = [START_DATE + timedelta(days=offset) for offset in range(DAYS)]
+    return _cumulative({day: WEEKDAY_WEIGHTS[day.weekday()] for day in days})
+
+
+def synthetic_applications(count, seed=0, start_sr_no=1):
+    """Yield (row_num, data) like iter_application_rows, ready for upsert_applications"""
+    rng = random.Random(seed)
+    stations, station_cum = _cumulative(_station_weights())
+    categories, category_cum = _cumulative(CATEGORY_WEIGHTS)
+    timelines, timeline_cum = _cumulative(TIMELINE_WEIGHTS)
+    days, day_cum = _hearing_days()
+    end = START_DATE + timedelta(days=DAYS)
+
+    for index in range(count):
+        sr_no = start_sr_no + index
+        hearing = rng.choices(days, cum_weights=day_cum)[0]
+        age = (end - hearing).days / DAYS  # 0 = newest, 1 = oldest
+
+        if rng.random() < BLANK_RATE:
+            division = station = category = marked_to = timeline = marked_by = ''
+        else:
+            division, station = rng.choices(stations, cum_weights=station_cum)[0]
+            category = rng.choices(categories, cum_weights=category_cum)[0]
+            timeline = rng.choices(timelines, cum_weights=timeline_cum)[0]
+            marked_to = f'SHO {station}' if rng.random() < 0.6 else f'SP {division.title()}'
+            marked_by = 'DIG'
+
+        # Applications move on with age: heard, referred or closed
+        status = rng.choices(
+            ['PENDING', 'HEARD', 'REFERRED', 'CLOSED'],
+            [1 - 0.7 * age, 0.35 * age, 0.1 * age, 0.25 * age],
+        )[0]
+        feedback = 'PENDING'
+        if status in ('HEARD', 'CLOSED') and rng.random() < 0.6:
+            feedback = 'POSITIVE' if rng.random() < 0.7 else 'NEGATIVE'
+
+        yield sr_no + 1, {
+            'sr_no': sr_no,
+            'dairy_no': str(sr_no % 1000 + 1),
+            'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'contact': f'3{rng.randint(0, 499999999):09d}',
+            'marked_to': marked_to,
+            'date': hearing,
+            'marked_by': marked_by,
+            'timeline': timeline,
+            'police_station': station,
+            'division': division,
+            'category': category,
+            'status': status,
+            'days': (end - hearing).days if status != 'PENDING' else None,
+            'feedback': feedback,
+            'dairy_ps': '',
+        }
+
+
+def write_workbook(path, count, seed=0, start_sr_no=1):
+    """An .xlsx register of `count` synthetic rows, written in streaming mode"""
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(SHEET_HEADER)
+    for _, data in synthetic_applications(count, seed=seed, start_sr_no=start_sr_no):
+        row = [data[field] for field in SHEET_FIELDS]
+        row[SHEET_FIELDS.index('status')] = data['status'].title()
+        row[SHEET_FIELDS.index('feedback')] = data['feedback'].title()
+        sheet.append(row)
+    workbook.save(path)
+    return path
@@ -0,0 +1,46 @@
+# backend/benchmarks/utils.py
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """Configure Django the same way the loader scripts do"""
+    if str(BASE_DIR) not in sys.path:
+        sys.path.append(str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Run against a throwaway test database so benchmarks never touch db.sqlite3.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    # Also lets benchmarks drive views through the test client ('testserver' host)
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+@contextmanager
+def timer(results, label):
+    """Store the elapsed wall time (seconds) of the block in results[label]"""
+    start = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - start
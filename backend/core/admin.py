@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from . models import User, OpenCourtApplication
+from . models import User, OpenCourtApplication, PoliceStation, Division, Category
 
 @admin.register(User)
 class CustomUserAdmin(UserAdmin):
@@ -18,4 +18,10 @@ class OpenCourtApplicationAdmin(admin.ModelAdmin):
     list_display = ['sr_no', 'dairy_no', 'name', 'contact', 'police_station', 'status', 'feedback']
     list_filter = ['status', 'feedback', 'police_station', 'division']
     search_fields = ['name', 'dairy_no', 'contact']
-    list_per_page = 50
\ No newline at end of file
+    list_per_page = 50
+
+
+@admin.register(PoliceStation, Division, Category)
+class ReferenceNameAdmin(admin.ModelAdmin):
+    list_display = ['name', 'aliases']
+    search_fields = ['name']
@@ -0,0 +1,57 @@
+# backend/core/bulk.py
+"""
+Set-based updates of many applications at once (the bulk_update_* actions).
+
+QuerySet.update() sends no signals, so everything the post_save handlers
+normally do is done here: rollup deltas, updated_at and the cache version.
+The search index triggers don't watch status/feedback/remarks.
+"""
+
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import bump_data_version_on_commit
+from .models import OpenCourtApplication
+from .rollups import ROLLUP_FIELDS, apply_rollup_deltas, key_deltas
+
+# Most applications one request may change
+BULK_UPDATE_LIMIT = 5000
+
+
+def bulk_update_applications(queryset, values, limit=BULK_UPDATE_LIMIT):
+    """
+    Set `values` ({field: value}) on every application in queryset.
+
+    Rows that already hold the values are left alone (their updated_at is
+    not touched). Returns (updated_ids, unchanged_ids); raises ValueError
+    when more than `limit` applications match.
+    """
+    fields = list(values)
+    target = tuple(values.values())
+    key_size = len(ROLLUP_FIELDS)
+
+    with transaction.atomic():
+        rows = list(
+            queryset.select_for_update().order_by('id')
+            .values_list('id', *ROLLUP_FIELDS, *fields)[:limit + 1]
+        )
+        if len(rows) > limit:
+            raise ValueError(f'More than {limit} applications match - narrow the selection')
+
+        changed = [row for row in rows if tuple(row[1 + key_size:]) != target]
+        updated_ids = [row[0] for row in changed]
+        unchanged_ids = [row[0] for row in rows if tuple(row[1 + key_size:]) == target]
+
+        if changed:
+            # ⚡ One UPDATE for the whole selection
+            OpenCourtApplication.objects.filter(id__in=updated_ids).update(**values, updated_at=timezone.now())
+
+            old_keys = [row[1:1 + key_size] for row in changed]
+            new_keys = [
+                tuple(values.get(field, value) for field, value in zip(ROLLUP_FIELDS, key))
+                for key in old_keys
+            ]
+            apply_rollup_deltas(key_deltas(old_keys, new_keys))
+            bump_data_version_on_commit()
+
+    return updated_ids, unchanged_ids
@@ -0,0 +1,52 @@
+# backend/core/cache.py
+"""
+Versioned caching for data derived from the database.
+
+Every cached entry is keyed by the current data version of its namespace
+('applications' - applications and their reference tables, 'videos' -
+video feedback). Writes bump the version instead of deleting keys, so stale
+entries are simply never read again and expire on their own.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+DATA_VERSION_KEY = '{namespace}:data_version'
+
+# Seconds an entry for a given version is kept
+CACHE_TIMEOUT = 60 * 60
+
+
+def get_data_version(namespace='applications'):
+    """Current data version (created on first use)"""
+    key = DATA_VERSION_KEY.format(namespace=namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so a restarted cache never reissues old ETags
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_data_version(namespace='applications'):
+    """Invalidate every versioned entry of the namespace"""
+    key = DATA_VERSION_KEY.format(namespace=namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        get_data_version(namespace)
+        return cache.incr(key)
+
+
+def bump_data_version_on_commit(namespace='applications'):
+    """Bump once the current transaction commits, so readers can't cache pre-commit data"""
+    transaction.on_commit(lambda: bump_data_version(namespace))
+
+
+def get_or_compute(name, compute, version=None):
+    """cache.get_or_set keyed by name and the data version"""
+    if version is None:
+        version = get_data_version()
+    return cache.get_or_set(f'{name}:v{version}', compute, CACHE_TIMEOUT)
@@ -0,0 +1,112 @@
+# backend/core/conditional.py
+"""
+Conditional GET for read endpoints.
+
+The validator is the data version of a namespace (core/cache.py) plus the
+caller's role and police station, so it costs one cache read: a client
+revalidating with If-None-Match gets a bodyless 304 before any query or
+serializer runs. Every write bumps the version, which changes the ETag.
+A view whose output also depends on something else (the current date)
+passes `extra`, a callable of the request whose result joins the ETag.
+
+The 304 needs every worker to read the same version, i.e. a shared cache
+(settings.CACHE_SHARED); otherwise the ETag is sent but never honoured.
+
+    @api_view(['GET'])
+    @permission_classes([IsAuthenticated])
+    @conditional_get('dashboard')
+    def dashboard_stats(request): ...
+
+    class SomeViewSet(ConditionalGetMixin, viewsets.ModelViewSet): ...
+"""
+
+from functools import wraps
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from .cache import get_data_version
+
+
+def data_etag(request, name, namespace='applications', extra=None):
+    """ETag for `name` as seen by request.user at the current data version"""
+    user = request.user
+    scope = f"{getattr(user, 'role', '')}.{getattr(user, 'police_station_ref_id', None) or ''}"
+    if extra is not None:
+        scope = f'{scope}-{extra(request)}'
+    return f'"{name}-{get_data_version(namespace)}-{scope}"'
+
+
+def is_not_modified(request, etag):
+    """Weak comparison - compressed responses carry W/ ETags (core/middleware.py)"""
+    if not settings.CACHE_SHARED:
+        # Per-process data versions: another worker may have seen a write this one didn't
+        return False
+    return etag in (tag.removeprefix('W/') for tag in parse_etags(request.headers.get('If-None-Match', '')))
+
+
+def set_validator(response, etag):
+    """Attach the ETag to a 200/304 and make browsers revalidate every time"""
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_get(name, namespace='applications', extra=None):
+    """Decorator for function views - goes below @api_view/@permission_classes"""
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            # Read before the view runs: a write landing mid-request then
+            # leaves the client with an already-stale ETag, never a too-new one
+            etag = data_etag(request, name, namespace, extra)
+            if is_not_modified(request, etag):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = view(request, *args, **kwargs)
+            return set_validator(response, etag)
+        return wrapped
+    return decorator
+
+
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET for a ViewSet's read actions (after authentication and
+    permission checks). The ETag name is the viewset basename plus action;
+    define conditional_extra(self, request) to add to it, like `extra`.
+    """
+    conditional_actions = ('list', 'retrieve')
+    conditional_namespace = 'applications'
+    conditional_extra = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = None
+        if request.method in ('GET', 'HEAD') and self.action in self.conditional_actions:
+            self.etag = data_etag(
+                request, f'{self.basename}-{self.action}', self.conditional_namespace, self.conditional_extra
+            )
+            if is_not_modified(request, self.etag):
+                raise NotModified
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, 'etag', None):
+            set_validator(response, self.etag)
+        return response
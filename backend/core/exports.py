@@ -0,0 +1,153 @@
+# backend/core/exports.py
+
+import csv
+import io
+import json
+import tempfile
+
+import openpyxl
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.renderers import BaseRenderer
+
+# Rows fetched per database round trip and written per response chunk
+EXPORT_CHUNK_SIZE = 2000
+
+# (field, header) in export column order
+EXPORT_COLUMNS = [
+    ('sr_no', 'Sr. No'),
+    ('dairy_no', 'Dairy No'),
+    ('name', 'Name'),
+    ('contact', 'Contact'),
+    ('police_station', 'PS'),
+    ('division', 'Division'),
+    ('category', 'Category'),
+    ('marked_to', 'Marked To'),
+    ('marked_by', 'Marked By'),
+    ('date', 'Date'),
+    ('timeline', 'Timeline'),
+    ('status', 'Status'),
+    ('days', 'Days'),
+    ('feedback', 'Feedback'),
+    ('dairy_ps', 'Dairy PS'),
+    ('remarks', 'Remarks'),
+]
+EXPORT_FIELDS = [field for field, _ in EXPORT_COLUMNS]
+
+
+# =====================================================
+# RENDERERS (content negotiation only)
+# =====================================================
+
+class ExportRenderer(BaseRenderer):
+    """
+    Lets ?format=csv|ndjson|xlsx through DRF content negotiation.
+
+    The export view streams the body itself; only error responses
+    (401, 403...) are ever rendered here, as JSON text.
+    """
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return json.dumps(data, default=str).encode('utf-8')
+
+
+class CSVExportRenderer(ExportRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class NDJSONExportRenderer(ExportRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+class XLSXExportRenderer(ExportRenderer):
+    media_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    format = 'xlsx'
+    charset = None
+
+
+EXPORT_RENDERERS = [CSVExportRenderer, NDJSONExportRenderer, XLSXExportRenderer]
+EXPORT_FORMATS = {renderer.format: renderer.media_type for renderer in EXPORT_RENDERERS}
+
+
+# =====================================================
+# WRITERS
+# =====================================================
+
+def iter_csv(rows, batch_size=EXPORT_CHUNK_SIZE):
+    """CSV text in batches of rows. The header goes out before the first query returns"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so Excel opens the UTF-8 file with Urdu names intact
+    buffer.write('\ufeff')
+    writer.writerow([header for _, header in EXPORT_COLUMNS])
+    yield buffer.getvalue()
+
+    buffer.seek(0)
+    buffer.truncate()
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows, batch_size=EXPORT_CHUNK_SIZE):
+    """One JSON object per line, keyed by field name"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(EXPORT_FIELDS, row)), default=str, ensure_ascii=False))
+        if len(lines) == batch_size:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def write_xlsx(rows):
+    """
+    Write rows to a temporary .xlsx and return it rewound.
+
+    An .xlsx is a zip whose directory comes last, so it cannot be sent
+    before it is complete - but the write-only workbook keeps memory flat
+    and the file is streamed back from disk.
+    """
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet('Applications')
+    sheet.append([header for _, header in EXPORT_COLUMNS])
+    for row in rows:
+        sheet.append(row)
+
+    handle = tempfile.TemporaryFile(suffix='.xlsx')
+    book.save(handle)
+    handle.seek(0)
+    return handle
+
+
+# =====================================================
+# RESPONSE
+# =====================================================
+
+def stream_export(queryset, export_format, filename='applications'):
+    """Streaming response for queryset in one of EXPORT_FORMATS"""
+    rows = queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    filename = f"{filename}_{timezone.localdate().isoformat()}.{export_format}"
+
+    if export_format == 'xlsx':
+        return FileResponse(
+            write_xlsx(rows), as_attachment=True, filename=filename,
+            content_type=EXPORT_FORMATS['xlsx'],
+        )
+
+    writer = iter_csv if export_format == 'csv' else iter_ndjson
+    response = StreamingHttpResponse(
+        writer(rows), content_type=f"{EXPORT_FORMATS[export_format]}; charset=utf-8"
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
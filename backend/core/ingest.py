@@ -0,0 +1,208 @@
+# backend/core/ingest.py
+"""
+Bulk loading of feedback videos from a folder (`manage.py load_videos`).
+
+Re-runnable: files are identified by SHA-256 and stored in the
+content-addressed layout (core/storage.py), so a video already stored -
+under any name - is never copied or recorded twice, and nothing existing
+is deleted. A checkpoint file remembers the hash of every file by size and
+mtime, so a rerun after a crash or with a few new files only reads the
+new ones.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from .cache import bump_data_version_on_commit
+from .models import MediaBlob, VideoFeedback
+from .storage import adjust_references, blob_name
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm')
+UPLOAD_DIR = 'video_feedback'
+CHECKPOINT_NAME = '.load_videos_checkpoint.json'
+
+try:
+    import fcntl
+    FICLONE = 0x40049409  # linux/fs.h - copy-on-write clone (btrfs, XFS)
+except ImportError:  # Windows
+    fcntl = None
+
+
+# =====================================================
+# CHECKPOINT
+# =====================================================
+
+def load_checkpoint(path):
+    """{file name: [size, mtime_ns, sha256]} from an earlier run"""
+    try:
+        with open(path, encoding='utf-8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_checkpoint(path, entries):
+    """Write atomically - an interrupted run leaves the previous checkpoint intact"""
+    temp = f'{path}.tmp'
+    with open(temp, 'w', encoding='utf-8') as handle:
+        json.dump(entries, handle)
+    os.replace(temp, path)
+
+
+# =====================================================
+# FILES
+# =====================================================
+
+def file_sha256(path):
+    with open(path, 'rb') as handle:
+        return hashlib.file_digest(handle, 'sha256').hexdigest()
+
+
+def place_file(source, dest, link=False):
+    """
+    Put `source` at `dest` as cheaply as the filesystem allows. Returns how:
+    'reflink' (copy-on-write clone), 'hardlink' (only with link=True - the
+    media file then *is* the source file) or 'copy'.
+    """
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    if fcntl is not None:
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return 'reflink'
+            except OSError:
+                pass  # not supported here / across filesystems
+        os.unlink(dest)
+    if link:
+        try:
+            os.link(source, dest)
+            return 'hardlink'
+        except OSError:
+            pass
+    # copyfile uses the kernel's zero-copy path (sendfile) where it can
+    shutil.copyfile(source, dest)
+    return 'copy'
+
+
+def scan_folder(folder):
+    """(name, path, size, mtime_ns) of the video files directly in folder"""
+    with os.scandir(folder) as entries:
+        return sorted(
+            (entry.name, entry.path, stat.st_size, stat.st_mtime_ns)
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(VIDEO_EXTENSIONS)
+            for stat in [entry.stat()]
+        )
+
+
+# =====================================================
+# ⚡ INGESTION
+# =====================================================
+
+def place_video(digest, name, path, link=False):
+    """Blob name of a new video, placing the file unless an earlier run already did"""
+    target = blob_name(digest, os.path.splitext(name)[1])
+    if default_storage.exists(target):
+        return target, 'existing'
+    return target, place_file(path, default_storage.path(target), link=link)
+
+
+def legacy_match(video, digest):
+    """Whether a row from the old loader (stored by name, no hash) holds this content"""
+    name = video.video_file.name
+    return default_storage.exists(name) and file_sha256(default_storage.path(name)) == digest
+
+
+def ingest_videos(folder, workers=8, checkpoint_path=None, link=False):
+    """
+    Load every new video in `folder`. Hashing and copying run on a thread
+    pool; all records go in with one bulk_create in one transaction.
+    Returns counts: found, hashed, skipped, adopted, created, plus how many
+    files were placed by each method.
+    """
+    checkpoint_path = checkpoint_path or os.path.join(folder, CHECKPOINT_NAME)
+    checkpoint = load_checkpoint(checkpoint_path)
+    files = scan_folder(folder)
+    stats = {'found': len(files), 'hashed': 0, 'skipped': 0, 'adopted': 0, 'created': 0}
+
+    # 1. Hashes - reused from the checkpoint while size and mtime still match
+    hashes = {}
+    to_hash = []
+    for name, path, size, mtime_ns in files:
+        known = checkpoint.get(name)
+        if known and known[:2] == [size, mtime_ns]:
+            hashes[name] = known[2]
+        else:
+            to_hash.append((name, path))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for (name, _), digest in zip(to_hash, pool.map(file_sha256, [path for _, path in to_hash])):
+            hashes[name] = digest
+        stats['hashed'] = len(to_hash)
+
+        # 2. Dedupe within the folder and against what is stored
+        new = {}
+        for name, path, size, mtime_ns in files:
+            new.setdefault(hashes[name], (name, path, size, mtime_ns))
+        stored = set(VideoFeedback.objects.filter(content_hash__in=new).values_list('content_hash', flat=True))
+        new = [(digest, *file) for digest, file in new.items() if digest not in stored]
+        stats['skipped'] = len(files) - len(new)
+
+        # 3. Rows from the old loader holding the same file are adopted, not duplicated
+        by_old_name = {f'{UPLOAD_DIR}/{item[1]}': item for item in new}
+        candidates = [
+            (video, by_old_name[video.video_file.name])
+            for video in VideoFeedback.objects.filter(content_hash__isnull=True, video_file__in=by_old_name)
+        ]
+        matches = pool.map(lambda pair: legacy_match(pair[0], pair[1][0]), candidates)
+        adopted = []
+        for (video, (digest, name, path, size, mtime_ns)), matched in zip(candidates, matches):
+            if matched:
+                video.content_hash, video.file_size = digest, size
+                adopted.append(video)
+        adopted_hashes = {video.content_hash for video in adopted}
+        new = [item for item in new if item[0] not in adopted_hashes]
+
+        # 4. Files into the content-addressed layout
+        placed = list(pool.map(lambda item: place_video(item[0], item[1], item[2], link), new))
+
+    records, submitted = [], []
+    for (digest, name, path, size, mtime_ns), (target, method) in zip(new, placed):
+        stats[method] = stats.get(method, 0) + 1
+        records.append(VideoFeedback(
+            user_name='Unknown', title='Feedback', video_file=target, file_size=size, content_hash=digest,
+            description='Video feedback submitted by Unknown regarding their experience at the open court.',
+        ))
+        submitted.append(datetime.fromtimestamp(mtime_ns / 1e9, tz=dt_timezone.utc))
+
+    # 5. One transaction for all records. submitted_date is auto_now_add, so
+    # the file times go in with bulk_update (which skips pre_save). bulk_create
+    # sends no signals - the blob references are counted here
+    with transaction.atomic():
+        known_blobs = set(
+            MediaBlob.objects.filter(name__in=[video.video_file.name for video in records]).values_list('name', flat=True)
+        )
+        MediaBlob.objects.bulk_create([
+            MediaBlob(name=video.video_file.name, digest=video.content_hash, size=video.file_size, ref_count=1)
+            for video in records if video.video_file.name not in known_blobs
+        ], batch_size=500)
+        adjust_references({name: 1 for name in known_blobs})
+        VideoFeedback.objects.bulk_create(records, batch_size=500)
+        for video, submitted_date in zip(records, submitted):
+            video.submitted_date = submitted_date
+        VideoFeedback.objects.bulk_update(records, ['submitted_date'], batch_size=500)
+        VideoFeedback.objects.bulk_update(adopted, ['content_hash', 'file_size'], batch_size=500)
+        if records or adopted:
+            bump_data_version_on_commit('videos')
+
+    stats.update(adopted=len(adopted), created=len(records))
+    # Only once the records are committed - a crash before this re-checks these files next time
+    save_checkpoint(checkpoint_path, {name: [size, mtime_ns, hashes[name]] for name, _, size, mtime_ns in files})
+    return stats
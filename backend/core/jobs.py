@@ -0,0 +1,133 @@
+# backend/core/jobs.py
+
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .importer import iter_application_rows, upsert_applications
+from .models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+# Only the first errors are kept on the job record
+MAX_STORED_ERRORS = 500
+
+
+# =====================================================
+# QUEUE (the database is the broker)
+# =====================================================
+
+def enqueue_import(uploaded_file, user=None):
+    """Save the upload to disk and queue an ImportJob for it"""
+    job = ImportJob(original_name=uploaded_file.name, created_by=user)
+    job.file.save(uploaded_file.name, uploaded_file, save=False)
+    job.save()
+
+    if getattr(settings, 'IMPORT_JOBS_INLINE_THREAD', False):
+        start_import_thread(job.pk)
+    return job
+
+
+def claim_import_job(job_id=None):
+    """
+    Atomically move one QUEUED job to RUNNING and return it (or None).
+
+    The conditional UPDATE makes the claim safe when several workers poll
+    the same table - only one of them gets rowcount 1. A RUNNING job whose
+    heartbeat is older than IMPORT_JOB_STALE_MINUTES lost its worker and is
+    claimed again (the upsert is idempotent, so it simply starts over);
+    after IMPORT_JOB_MAX_ATTEMPTS claims it is marked FAILED instead.
+    """
+    now = timezone.now()
+    stale = Q(status='RUNNING', heartbeat_at__lt=now - timedelta(minutes=settings.IMPORT_JOB_STALE_MINUTES))
+    fail_abandoned_jobs(stale, now)
+
+    claimable = Q(status='QUEUED') | stale
+    candidates = ImportJob.objects.filter(claimable)
+    if job_id is not None:
+        candidates = candidates.filter(pk=job_id)
+
+    for pk in candidates.order_by('created_at').values_list('pk', flat=True)[:5]:
+        claimed = ImportJob.objects.filter(claimable, pk=pk).update(
+            status='RUNNING', started_at=now, heartbeat_at=now, attempts=F('attempts') + 1
+        )
+        if claimed:
+            return ImportJob.objects.get(pk=pk)
+    return None
+
+
+def fail_abandoned_jobs(stale, now):
+    """Give up on stale jobs that already lost their worker IMPORT_JOB_MAX_ATTEMPTS times"""
+    abandoned = ImportJob.objects.filter(stale, attempts__gte=settings.IMPORT_JOB_MAX_ATTEMPTS)
+    for pk in abandoned.values_list('pk', flat=True):
+        if abandoned.filter(pk=pk).update(
+            status='FAILED', finished_at=now,
+            error_message=f'The import stopped responding {settings.IMPORT_JOB_MAX_ATTEMPTS} times',
+        ):
+            logger.error("Import job %s abandoned after %s attempts", pk, settings.IMPORT_JOB_MAX_ATTEMPTS)
+
+
+# =====================================================
+# PROCESSING
+# =====================================================
+
+def run_import_job(job):
+    """Process a claimed job chunk by chunk, saving progress after every chunk"""
+    parse_errors = []
+
+    def save_progress(result):
+        errors = parse_errors + result['errors']
+        ImportJob.objects.filter(pk=job.pk).update(
+            rows_processed=result['created'] + result['updated'] + len(errors),
+            created_count=result['created'],
+            updated_count=result['updated'],
+            errors=errors[:MAX_STORED_ERRORS],
+            heartbeat_at=timezone.now(),
+        )
+
+    try:
+        with job.file.open('rb') as handle:
+            rows = iter_application_rows(handle, job.original_name or job.file.name, errors=parse_errors)
+            result = upsert_applications(rows, created_by=job.created_by, on_progress=save_progress)
+        save_progress(result)
+    except Exception as e:
+        logger.exception("Import job %s failed", job.pk)
+        ImportJob.objects.filter(pk=job.pk).update(
+            status='FAILED', error_message=str(e), finished_at=timezone.now()
+        )
+    else:
+        ImportJob.objects.filter(pk=job.pk).update(status='DONE', finished_at=timezone.now())
+
+    job.refresh_from_db()
+    return job
+
+
+def process_next_import_job():
+    """Claim and run the oldest queued job. Returns the job, or None if the queue is empty"""
+    job = claim_import_job()
+    if job is None:
+        return None
+    return run_import_job(job)
+
+
+def start_import_thread(job_id):
+    """Run one job on a daemon thread inside the web process (no worker needed)"""
+    def target():
+        close_old_connections()
+        try:
+            job = claim_import_job(job_id)
+            if job is not None:
+                run_import_job(job)
+        finally:
+            connection.close()
+
+    def start():
+        threading.Thread(target=target, name=f'import-job-{job_id}', daemon=True).start()
+
+    # The job row must be committed before another connection can claim it
+    transaction.on_commit(start)
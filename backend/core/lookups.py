@@ -0,0 +1,24 @@
+# backend/core/lookups.py
+"""
+`ciexact`: a case-insensitive exact match that can use an index.
+
+`field__iexact` compiles to `LIKE` on SQLite and `UPPER(col::text)` on
+PostgreSQL, neither of which a plain column index can answer. `ciexact`
+compiles to `LOWER(col) = LOWER(%s)` on every backend, which matches a
+functional `models.Index(Lower('col'))` exactly - see the *_lower indexes
+on OpenCourtApplication and ApplicationDailyRollup.
+"""
+
+from django.db.models import CharField, Lookup
+from django.db.models.functions import Lower
+
+
+@CharField.register_lookup
+class CaseInsensitiveExact(Lookup):
+    lookup_name = 'ciexact'
+
+    def as_sql(self, compiler, connection):
+        # Compiled through Lower() so the SQL is identical to the index expression
+        lhs, lhs_params = compiler.compile(Lower(self.lhs))
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} = LOWER({rhs})', (*lhs_params, *rhs_params)
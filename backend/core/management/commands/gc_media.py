@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core.storage import GC_GRACE, collect_garbage
+
+
+class Command(BaseCommand):
+    help = 'Recount media blob references and delete blobs no record points at any more'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=float, default=GC_GRACE.total_seconds() / 3600,
+                            help='Keep unreferenced blobs younger than this')
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be deleted')
+
+    def handle(self, *args, **options):
+        stats = collect_garbage(grace=timedelta(hours=options['grace_hours']), dry_run=options['dry_run'])
+        verb = 'Would free' if options['dry_run'] else 'Freed'
+        self.stdout.write(self.style.SUCCESS(
+            f"🗑️ {verb} {stats['freed'] / (1024 * 1024):.1f} MB: {stats['deleted']} unreferenced blobs, "
+            f"{stats['stray']} stray files ({stats['recounted']} reference counts corrected)"
+        ))
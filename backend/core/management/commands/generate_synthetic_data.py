@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max
+
+from benchmarks.data import synthetic_applications, write_workbook
+from core.importer import upsert_applications
+from core.models import OpenCourtApplication, User
+
+
+class Command(BaseCommand):
+    help = 'Add synthetic applications to the database and/or write a synthetic Excel register'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applications', type=int, default=0,
+                            help='Rows to add, numbered after the highest existing Sr.No')
+        parser.add_argument('--workbook', help='Also write an .xlsx register to this path')
+        parser.add_argument('--workbook-rows', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=0, help='Same seed, same rows')
+        parser.add_argument('--created-by', help='Username recorded as creator of the rows')
+
+    def handle(self, *args, **options):
+        if not options['applications'] and not options['workbook']:
+            raise CommandError('Nothing to do - pass --applications N and/or --workbook PATH')
+
+        if options['workbook']:
+            start = time.perf_counter()
+            write_workbook(options['workbook'], options['workbook_rows'], seed=options['seed'])
+            self.stdout.write(self.style.SUCCESS(
+                f"📄 Wrote {options['workbook_rows']} rows to {options['workbook']} "
+                f"in {time.perf_counter() - start:.1f}s"
+            ))
+
+        if options['applications']:
+            creator = None
+            if options['created_by']:
+                try:
+                    creator = User.objects.get(username=options['created_by'])
+                except User.DoesNotExist:
+                    raise CommandError(f"No user named {options['created_by']!r}")
+
+            # Appended after the real rows - never overwrites an existing Sr.No
+            first = (OpenCourtApplication.objects.aggregate(last=Max('sr_no'))['last'] or 0) + 1
+            start = time.perf_counter()
+
+            def progress(result):
+                self.stdout.write(f"  {result['created']} / {options['applications']}", ending='\r')
+
+            result = upsert_applications(
+                synthetic_applications(options['applications'], seed=options['seed'], start_sr_no=first),
+                created_by=creator,
+                on_progress=progress,
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ Created {result['created']} synthetic applications (Sr.No {first} onwards) "
+                f"in {time.perf_counter() - start:.1f}s"
+            ))
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.jobs import process_next_import_job
+
+
+class Command(BaseCommand):
+    help = 'Process queued Excel/CSV import jobs, polling the database for new ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue and exit')
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds between polls when idle')
+
+    def handle(self, *args, **options):
+        self.stdout.write('📥 Import worker started')
+        while True:
+            close_old_connections()
+            job = process_next_import_job()
+            if job is not None:
+                self.stdout.write(
+                    f"{'✅' if job.status == 'DONE' else '❌'} Job {job.pk} ({job.original_name}): "
+                    f"{job.status} - created {job.created_count}, updated {job.updated_count}, "
+                    f"errors {len(job.errors)}"
+                )
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
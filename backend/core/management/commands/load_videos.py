@@ -0,0 +1,34 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.ingest import CHECKPOINT_NAME, ingest_videos
+
+
+class Command(BaseCommand):
+    help = 'Load feedback videos from a folder - only files not already stored, safe to rerun'
+
+    def add_arguments(self, parser):
+        parser.add_argument('folder', help='Folder with .mp4/.avi/.mov/.mkv/.webm files')
+        parser.add_argument('--workers', type=int, default=min(8, (os.cpu_count() or 1) * 2),
+                            help='Files hashed/copied at once')
+        parser.add_argument('--checkpoint', help=f'Checkpoint file (default: <folder>/{CHECKPOINT_NAME})')
+        parser.add_argument('--link', action='store_true',
+                            help='Hardlink instead of copying when reflinks are unavailable (same filesystem)')
+
+    def handle(self, *args, **options):
+        folder = options['folder']
+        if not os.path.isdir(folder):
+            raise CommandError(f'Folder not found: {folder}')
+
+        self.stdout.write(f'📂 Loading videos from: {folder}')
+        stats = ingest_videos(folder, workers=options['workers'], checkpoint_path=options['checkpoint'],
+                              link=options['link'])
+        placed = ', '.join(f'{stats[method]} {method}' for method in ('reflink', 'hardlink', 'copy', 'existing')
+                           if stats.get(method))
+        self.stdout.write(
+            f"✅ {stats['found']} files: {stats['hashed']} hashed, {stats['skipped']} already stored, "
+            f"{stats['adopted']} adopted, {stats['created']} created" + (f' ({placed})' if placed else '')
+        )
+        if stats['created']:
+            self.stdout.write('🎬 Run `python manage.py video_worker --once` for durations and thumbnails')
@@ -0,0 +1,17 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core.uploads import UPLOAD_SESSION_TTL, prune_uploads
+
+
+class Command(BaseCommand):
+    help = 'Delete abandoned chunked upload sessions and their partial files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=float, default=UPLOAD_SESSION_TTL.total_seconds() / 3600,
+                            help='Delete sessions untouched for this long')
+
+    def handle(self, *args, **options):
+        sessions, files = prune_uploads(ttl=timedelta(hours=options['hours']))
+        self.stdout.write(self.style.SUCCESS(f'✅ Pruned {sessions} upload sessions and {files} orphaned part files'))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.search import drop_search_index, install_search_index, search_backend
+
+
+class Command(BaseCommand):
+    help = 'Recreate the application search index (FTS5 on SQLite, pg_trgm on PostgreSQL)'
+
+    def handle(self, *args, **options):
+        drop_search_index(connection)
+        install_search_index(connection)
+        backend = search_backend(connection.alias)
+        if backend:
+            self.stdout.write(self.style.SUCCESS(f'✅ Search index rebuilt ({backend})'))
+        else:
+            self.stdout.write(self.style.WARNING('⚠️ No search index on this database - search uses icontains'))
@@ -0,0 +1,47 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from core.videos import claim_video, run_video_job
+
+
+def run_and_close(video):
+    try:
+        return run_video_job(video)
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = 'Extract duration, thumbnails and previews of queued feedback videos, polling the database for new ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue and exit')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls when idle')
+        parser.add_argument(
+            '--concurrency', type=int, default=2,
+            help='Videos processed at once (each runs its own ffmpeg process)',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('🎬 Video worker started')
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            while True:
+                close_old_connections()
+                batch = []
+                while len(batch) < options['concurrency'] and (video := claim_video()) is not None:
+                    batch.append(video)
+                for video in pool.map(run_and_close, batch):
+                    self.stdout.write(
+                        f"{'✅' if video.processing_status == 'DONE' else '❌'} Video {video.pk} "
+                        f"({video.video_file.name}): {video.processing_status} - "
+                        f"{video.duration or '?'}s, thumbnail {'yes' if video.thumbnail else 'no'}, "
+                        f"preview {'yes' if video.preview else 'no'}"
+                    )
+                if batch:
+                    continue
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
@@ -0,0 +1,209 @@
+# backend/core/media.py
+"""
+Authenticated media streaming (video feedback files).
+
+Byte ranges so a player can seek without re-downloading, ETag and
+Last-Modified so the browser can revalidate, and a hand-off to the front
+proxy (X-Accel-Redirect / X-Sendfile) when MEDIA_SENDFILE is set, so
+Python never copies the bytes at all. Without a proxy the file goes out
+through FileResponse, which WSGI servers with a sendfile file_wrapper
+(gunicorn) send zero-copy - ranges included.
+"""
+
+import mimetypes
+import re
+import time
+from urllib.parse import quote
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.negotiation import BaseContentNegotiation
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+STREAM_TOKEN_SALT = 'core.media.stream'
+
+
+# =====================================================
+# AUTHENTICATION / NEGOTIATION
+# =====================================================
+
+def stream_token(video, user):
+    """
+    Signed ?token= for one video's stream URL - a <video src> can't send an
+    Authorization header. It only opens that video and expires after
+    MEDIA_STREAM_TOKEN_MAX_AGE, so a URL copied from an access log or a
+    Referer header is no API credential.
+    """
+    return signing.dumps({'video': video.pk, 'user': user.pk}, salt=STREAM_TOKEN_SALT)
+
+
+def stream_token_epoch():
+    """Changes every half token lifetime - responses carrying tokens revalidate into fresh ones"""
+    return int(time.time()) // max(1, settings.MEDIA_STREAM_TOKEN_MAX_AGE // 2)
+
+
+class StreamTokenAuthentication(BaseAuthentication):
+    """?token= from stream_token(), for the video named in the URL only"""
+
+    def authenticate(self, request):
+        token = request.query_params.get('token')
+        if not token:
+            return None
+        try:
+            payload = signing.loads(token, salt=STREAM_TOKEN_SALT, max_age=settings.MEDIA_STREAM_TOKEN_MAX_AGE)
+        except signing.BadSignature:  # expired included
+            raise AuthenticationFailed('Invalid or expired stream token')
+        if str(payload['video']) != str(request.parser_context['kwargs'].get('pk')):
+            raise AuthenticationFailed('Stream token is for another video')
+        user = get_user_model().objects.filter(pk=payload['user'], is_active=True).first()
+        if user is None:
+            raise AuthenticationFailed('User not found')
+        return user, payload
+
+    def authenticate_header(self, request):
+        return 'Bearer realm="api"'
+
+
+class IgnoreAcceptNegotiation(BaseContentNegotiation):
+    """Players send Accept: video/*; the body is the file, errors are JSON"""
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+# =====================================================
+# RANGES
+# =====================================================
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single `bytes=` range, None to send the
+    whole file (no/multiple/malformed ranges) or ValueError if unsatisfiable.
+    """
+    match = RANGE_RE.match(header.replace(' ', ''))
+    if not match:
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    elif last:
+        # Suffix range: the last N bytes
+        start, end = max(size - int(last), 0), size - 1
+        if int(last) == 0:
+            raise ValueError(header)
+    else:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, end
+
+
+def if_range_matches(if_range, etag, modified):
+    """A Range only applies while If-Range (when sent) still names this file"""
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return modified is not None and parse_http_date_safe(if_range) == modified
+
+
+class RangeFile:
+    """
+    A file positioned at `start` that reads at most `length` bytes.
+    fileno() stays available so a sendfile file_wrapper can still take the
+    zero-copy path (it sends Content-Length bytes from the current offset).
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size else b''
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+# =====================================================
+# ⚡ STREAMING
+# =====================================================
+
+def file_validators(field):
+    """(ETag, last-modified timestamp or None) from size and mtime - no file read"""
+    try:
+        modified = int(field.storage.get_modified_time(field.name).timestamp())
+    except NotImplementedError:
+        modified = None
+    return f'"{field.size:x}-{modified or 0:x}"', modified
+
+
+def sendfile_response(field, content_type):
+    """Empty response telling the front proxy which file to send"""
+    response = HttpResponse(content_type=content_type)
+    if settings.MEDIA_SENDFILE == 'nginx':
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_PREFIX + quote(field.name)
+    else:
+        response['X-Sendfile'] = field.storage.path(field.name)
+    return response
+
+
+def serve_file(request, field):
+    """Stream a FileField with Range, If-Range and conditional GET support"""
+    content_type = mimetypes.guess_type(field.name)[0] or 'application/octet-stream'
+
+    if settings.MEDIA_SENDFILE:
+        # The proxy answers ranges and conditionals itself
+        response = sendfile_response(field, content_type)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    size = field.size
+    etag, modified = file_validators(field)
+    response = get_conditional_response(request, etag=etag, last_modified=modified)
+    if response is None:
+        byte_range = None
+        header = request.headers.get('Range', '')
+        if header and if_range_matches(request.headers.get('If-Range'), etag, modified):
+            try:
+                byte_range = parse_range(header, size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        start, end = byte_range or (0, size - 1)
+        length = end - start + 1
+        response = FileResponse(RangeFile(field.open('rb'), start, length), content_type=content_type)
+        response['Content-Length'] = str(length)
+        if byte_range:
+            response.status_code = 206
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    if modified:
+        response['Last-Modified'] = http_date(modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
@@ -0,0 +1,271 @@
+# backend/core/metrics.py
+"""
+Per-request timing and SQL instrumentation.
+
+RequestMetricsMiddleware wraps every database call of a request
+(connection.execute_wrapper) and reports, per request:
+
+- a Server-Timing header (db, render, total) - visible in the browser's
+  network panel (not on streamed responses: their body, and its queries,
+  only run after the headers are sent);
+- one JSON log line on the `core.metrics` logger;
+- a warning when one SELECT runs REQUEST_METRICS_N_PLUS_ONE times or more
+  (a queryset missing select_related/prefetch_related).
+
+The same numbers are aggregated per view name and served in Prometheus
+text format at /api/metrics/. Totals are per process: with several
+workers, scrape each one or sum them in the query.
+"""
+
+import hmac
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.permissions import BasePermission
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# How much of a repeated statement the N+1 warning quotes
+SQL_PREVIEW = 200
+
+
+# =====================================================
+# PER REQUEST
+# =====================================================
+
+class RequestStats:
+    """Queries and timings of one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        # The execute_wrapper hook: time every statement on this thread's connections
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            if sql.lstrip()[:6].upper() == 'SELECT':
+                self.statements[sql] += 1
+
+    def repeated(self, threshold):
+        """(count, sql) of the most repeated SELECT if it ran `threshold` times or more"""
+        if not threshold or not self.statements:
+            return None
+        sql, count = self.statements.most_common(1)[0]
+        return (count, sql) if count >= threshold else None
+
+
+# =====================================================
+# AGGREGATES (/api/metrics/)
+# =====================================================
+
+class Registry:
+    """Counters and latency histograms per (view, method)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = Counter()        # (view, method, status) -> n
+            self.buckets = {}                # (view, method) -> [n per bucket]
+            self.latency_sum = Counter()     # (view, method) -> seconds
+            self.latency_count = Counter()
+            self.queries = Counter()         # view -> n
+            self.db_seconds = Counter()
+            self.render_seconds = Counter()
+            self.n_plus_one = Counter()
+
+    def observe(self, view, method, status, duration, stats, repeated):
+        key = (view, method)
+        with self.lock:
+            self.requests[(view, method, str(status))] += 1
+            buckets = self.buckets.setdefault(key, [0] * len(LATENCY_BUCKETS))
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    buckets[index] += 1
+            self.latency_sum[key] += duration
+            self.latency_count[key] += 1
+            self.queries[view] += stats.queries
+            self.db_seconds[view] += stats.db_time
+            self.render_seconds[view] += stats.render_time
+            if repeated:
+                self.n_plus_one[view] += 1
+
+    def render(self):
+        """Prometheus text exposition format"""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for sample, labels, value in samples:
+                lines.append(f'{sample}{{{format_labels(labels)}}} {value:g}')
+
+        with self.lock:
+            metric('http_requests_total', 'counter', 'Requests by view, method and status.', [
+                ('http_requests_total', (('view', view), ('method', method), ('status', status)), count)
+                for (view, method, status), count in sorted(self.requests.items())
+            ])
+
+            histogram = []
+            for key, buckets in sorted(self.buckets.items()):
+                labels = (('view', key[0]), ('method', key[1]))
+                name = 'http_request_duration_seconds'
+                histogram += [
+                    (f'{name}_bucket', (*labels, ('le', f'{bound:g}')), count)
+                    for bound, count in zip(LATENCY_BUCKETS, buckets)
+                ]
+                histogram += [
+                    (f'{name}_bucket', (*labels, ('le', '+Inf')), self.latency_count[key]),
+                    (f'{name}_sum', labels, self.latency_sum[key]),
+                    (f'{name}_count', labels, self.latency_count[key]),
+                ]
+            metric('http_request_duration_seconds', 'histogram', 'Wall time of requests by view.', histogram)
+
+            for name, help_text, values in (
+                ('http_request_db_queries_total', 'SQL statements run, by view.', self.queries),
+                ('http_request_db_seconds_total', 'Time spent in SQL, by view.', self.db_seconds),
+                ('http_request_render_seconds_total', 'Time spent rendering responses, by view.', self.render_seconds),
+                ('http_request_n_plus_one_total', 'Requests that repeated one SELECT like an N+1.', self.n_plus_one),
+            ):
+                metric(name, 'counter', help_text, [(name, (('view', view),), value) for view, value in sorted(values.items())])
+        return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels):
+    return ','.join(
+        '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    )
+
+
+registry = Registry()
+
+
+class MetricsTokenAuthentication(BaseAuthentication):
+    """`Authorization: Bearer <METRICS_TOKEN>` from a scraper - checked before the JWT is"""
+
+    def authenticate(self, request):
+        token = settings.METRICS_TOKEN
+        header = request.headers.get('Authorization', '')
+        if token and hmac.compare_digest(header.encode(), f'Bearer {token}'.encode()):
+            return AnonymousUser(), 'metrics-token'
+        return None
+
+    def authenticate_header(self, request):
+        return 'Bearer realm="api"'
+
+
+class CanReadMetrics(BasePermission):
+    def has_permission(self, request, view):
+        if request.auth == 'metrics-token':
+            return True
+        return bool(request.user and request.user.is_authenticated and request.user.role == 'ADMIN')
+
+
+# =====================================================
+# ⚡ MIDDLEWARE
+# =====================================================
+
+def view_name(request):
+    """Route name as a low-cardinality label ('application-list', 'login'...)"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return '<unresolved>'
+    return match.view_name  # the view's dotted path when the route has no name
+
+
+class RequestMetricsMiddleware:
+    """
+    Time the request, its SQL and its rendering. Outermost middleware so
+    the total includes everything the other middleware do.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.n_plus_one = settings.REQUEST_METRICS_N_PLUS_ONE
+
+    def __call__(self, request):
+        stats = request._metrics = RequestStats()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+            if response.streaming:
+                # ⚡ A streamed body (exports) runs its queries after this returns:
+                # keep counting until the server closes the response, then record
+                wrappers = stack.pop_all()
+
+                def finish():
+                    wrappers.close()
+                    self.record(request, response, stats)
+
+                response._resource_closers.append(finish)
+                return response
+        self.record(request, response, stats)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook - time it
+        stats = getattr(request, '_metrics', None)
+        if stats is not None:
+            start = time.perf_counter()
+
+            def rendered(response):
+                stats.render_time += time.perf_counter() - start
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def record(self, request, response, stats):
+        duration = time.perf_counter() - stats.started
+        view = view_name(request)
+        repeated = stats.repeated(self.n_plus_one)
+
+        # A streamed response's headers left before its body ran - log and registry only
+        if not response.streaming:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries"',
+                f'render;dur={stats.render_time * 1000:.1f}',
+                f'total;dur={duration * 1000:.1f}',
+            ])
+        registry.observe(view, request.method, response.status_code, duration, stats, repeated)
+
+        logger.info(json.dumps({
+            'view': view,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round(duration * 1000, 1),
+            'db_ms': round(stats.db_time * 1000, 1),
+            'queries': stats.queries,
+            'render_ms': round(stats.render_time * 1000, 1),
+        }))
+        if repeated:
+            count, sql = repeated
+            logger.warning(
+                "Possible N+1 in %s %s: the same query ran %d times: %s",
+                request.method, view, count, sql[:SQL_PREVIEW],
+            )
@@ -0,0 +1,149 @@
+# backend/core/middleware.py
+
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional - pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional - pip install zstandard
+    zstandard = None
+
+# Content types worth compressing (xlsx, images and video are already compressed)
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/x-ndjson', 'application/javascript')
+
+
+# =====================================================
+# CODECS
+# =====================================================
+# Each has compress(data) -> bytes and flush(finish) -> bytes. flush(False)
+# ends a block so a streamed chunk reaches the client without waiting.
+
+class GzipCodec:
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self, finish):
+        return self._compressor.flush(zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH)
+
+
+class BrotliCodec:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=5)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self, finish):
+        return self._compressor.finish() if finish else self._compressor.flush()
+
+
+class ZstdCodec:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self, finish):
+        return self._compressor.flush() if finish else self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+
+CODECS = {'gzip': GzipCodec}
+if brotli is not None:
+    CODECS['br'] = BrotliCodec
+if zstandard is not None:
+    CODECS['zstd'] = ZstdCodec
+
+
+def accepted_encodings(header):
+    """Encodings named in an Accept-Encoding header, minus those with q=0"""
+    accepted = set()
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+# =====================================================
+# ⚡ RESPONSE COMPRESSION
+# =====================================================
+
+class CompressionMiddleware:
+    """
+    Compress JSON/CSV/text responses with the first of
+    RESPONSE_COMPRESSION_ENCODINGS the client accepts (br and zstd only when
+    their packages are installed). Bodies under RESPONSE_COMPRESSION_MIN_SIZE
+    bytes go out as-is; streamed exports are compressed chunk by chunk.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.encodings = [name for name in settings.RESPONSE_COMPRESSION_ENCODINGS if name in CODECS]
+        self.min_size = settings.RESPONSE_COMPRESSION_MIN_SIZE
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    def choose_encoding(self, request):
+        accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        for name in self.encodings:
+            if name in accepted or '*' in accepted:
+                return name
+        return None
+
+    def process_response(self, request, response):
+        if not self.encodings or response.has_header('Content-Encoding') or response.has_header('Content-Range'):
+            return response
+        if not response.get('Content-Type', '').startswith(COMPRESSIBLE_TYPES):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = self.choose_encoding(request)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = self.compress_stream(response.streaming_content, CODECS[encoding]())
+            del response['Content-Length']
+        else:
+            if len(response.content) < self.min_size:
+                return response
+            codec = CODECS[encoding]()
+            compressed = codec.compress(response.content) + codec.flush(finish=True)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # The bytes differ from the identity encoding - the ETag can only be weak
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
+
+    @staticmethod
+    def compress_stream(chunks, codec):
+        for chunk in chunks:
+            data = codec.compress(chunk) + codec.flush(finish=False)
+            if data:
+                yield data
+        yield codec.flush(finish=True)
@@ -0,0 +1,67 @@
+# Generated by Django 6.0.1 on 2026-10-17 00:04
+
+from django.db import migrations, models
+from django.db.models import Count
+
+ROLLUP_FIELDS = ["date", "police_station", "division", "category", "status", "feedback"]
+
+
+def populate_rollups(apps, schema_editor):
+    OpenCourtApplication = apps.get_model("core", "OpenCourtApplication")
+    ApplicationDailyRollup = apps.get_model("core", "ApplicationDailyRollup")
+
+    grouped = (
+        OpenCourtApplication.objects.order_by()
+        .values(*ROLLUP_FIELDS)
+        .annotate(total=Count("id"))
+    )
+    ApplicationDailyRollup.objects.bulk_create(
+        [
+            ApplicationDailyRollup(
+                application_count=group["total"],
+                **{field: group[field] for field in ROLLUP_FIELDS}
+            )
+            for group in grouped
+        ],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_importjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ApplicationDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(blank=True, null=True)),
+                ("police_station", models.CharField(max_length=100)),
+                ("division", models.CharField(max_length=100)),
+                ("category", models.CharField(max_length=200)),
+                ("status", models.CharField(max_length=20)),
+                ("feedback", models.CharField(max_length=20)),
+                ("application_count", models.IntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["police_station", "date"], name="idx_rollup_ps_date"
+                    ),
+                    models.Index(fields=["date"], name="idx_rollup_date"),
+                ],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
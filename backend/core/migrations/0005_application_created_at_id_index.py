@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_applicationdailyrollup"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="opencourtapplication",
+            index=models.Index(fields=["created_at", "id"], name="idx_created_at_id"),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-17 11:00
+
+from django.db import migrations
+
+from core.search import drop_search_index, install_search_index
+
+
+def install(apps, schema_editor):
+    install_search_index(schema_editor.connection)
+
+
+def drop(apps, schema_editor):
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_application_created_at_id_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, drop),
+    ]
@@ -0,0 +1,203 @@
+# Generated by Django 6.0.1 on 2026-10-17 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+# text field -> reference model
+REFERENCES = {
+    "police_station": "PoliceStation",
+    "division": "Division",
+    "category": "Category",
+}
+ROLLUP_FIELDS = ["date", "police_station", "division", "category", "status", "feedback"]
+
+
+def clean_name(value):
+    return " ".join(str(value).split()) if value is not None else ""
+
+
+def canonicalize(apps, schema_editor):
+    """
+    One reference per case/whitespace-insensitive spelling group. The most
+    common spelling becomes the canonical name and every row is rewritten
+    to it, so the rollup table is rebuilt afterwards.
+    """
+    OpenCourtApplication = apps.get_model("core", "OpenCourtApplication")
+    User = apps.get_model("core", "User")
+    ApplicationDailyRollup = apps.get_model("core", "ApplicationDailyRollup")
+
+    for field, model_name in REFERENCES.items():
+        Reference = apps.get_model("core", model_name)
+        spellings = {}
+        counts = (
+            OpenCourtApplication.objects.values_list(field)
+            .annotate(total=Count("id"))
+            .order_by("-total", field)
+        )
+        for value, _ in counts:
+            key = clean_name(value).casefold()
+            if key:
+                spellings.setdefault(key, []).append(value)
+
+        for group in spellings.values():
+            reference = Reference.objects.create(name=clean_name(group[0]))
+            OpenCourtApplication.objects.filter(**{f"{field}__in": group}).update(
+                **{field: reference.name, f"{field}_ref": reference}
+            )
+
+    PoliceStation = apps.get_model("core", "PoliceStation")
+    stations = {
+        station.name.casefold(): station for station in PoliceStation.objects.all()
+    }
+    for user in User.objects.exclude(police_station=""):
+        name = clean_name(user.police_station)
+        if not name:
+            continue
+        station = stations.get(name.casefold())
+        if station is None:
+            station = stations[name.casefold()] = PoliceStation.objects.create(
+                name=name
+            )
+        user.police_station = station.name
+        user.police_station_ref = station
+        user.save(update_fields=["police_station", "police_station_ref"])
+
+    ApplicationDailyRollup.objects.all().delete()
+    grouped = (
+        OpenCourtApplication.objects.order_by()
+        .values(*ROLLUP_FIELDS)
+        .annotate(total=Count("id"))
+    )
+    ApplicationDailyRollup.objects.bulk_create(
+        [
+            ApplicationDailyRollup(
+                application_count=group["total"],
+                **{field: group[field] for field in ROLLUP_FIELDS},
+            )
+            for group in grouped
+        ],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_application_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Category",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200, unique=True)),
+                ("aliases", models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                "verbose_name_plural": "categories",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Division",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200, unique=True)),
+                ("aliases", models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="PoliceStation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200, unique=True)),
+                ("aliases", models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="opencourtapplication",
+            name="category_ref",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="applications",
+                to="core.category",
+            ),
+        ),
+        migrations.AddField(
+            model_name="opencourtapplication",
+            name="division_ref",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="applications",
+                to="core.division",
+            ),
+        ),
+        migrations.AddField(
+            model_name="opencourtapplication",
+            name="police_station_ref",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="applications",
+                to="core.policestation",
+            ),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="police_station_ref",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="staff",
+                to="core.policestation",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="opencourtapplication",
+            index=models.Index(
+                fields=["police_station_ref", "status"], name="idx_ps_ref_status"
+            ),
+        ),
+        migrations.RunPython(canonicalize, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-17 11:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_reference_tables"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="applicationdailyrollup",
+            index=models.Index(
+                django.db.models.functions.text.Lower("police_station"),
+                name="idx_rollup_ps_lower",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="opencourtapplication",
+            index=models.Index(
+                django.db.models.functions.text.Lower("police_station"),
+                name="idx_police_station_lower",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="opencourtapplication",
+            index=models.Index(
+                django.db.models.functions.text.Lower("division"),
+                name="idx_division_lower",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="opencourtapplication",
+            index=models.Index(
+                django.db.models.functions.text.Lower("category"),
+                name="idx_category_lower",
+            ),
+        ),
+    ]
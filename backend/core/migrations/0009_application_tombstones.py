@@ -0,0 +1,52 @@
+# Generated by Django 6.0.1 on 2026-10-17 12:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_case_insensitive_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ApplicationTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("application_id", models.BigIntegerField()),
+                ("police_station", models.CharField(blank=True, max_length=100)),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="opencourtapplication",
+            index=models.Index(fields=["updated_at", "id"], name="idx_updated_at_id"),
+        ),
+        migrations.AddField(
+            model_name="applicationtombstone",
+            name="police_station_ref",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="core.policestation",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="applicationtombstone",
+            index=models.Index(
+                fields=["deleted_at", "id"], name="idx_tombstone_deleted_at"
+            ),
+        ),
+    ]
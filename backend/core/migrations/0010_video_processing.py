@@ -0,0 +1,54 @@
+# Generated by Django 6.0.1 on 2026-10-17 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_application_tombstones"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videofeedback",
+            name="preview",
+            field=models.FileField(
+                blank=True,
+                help_text="Low-bitrate preview clip",
+                null=True,
+                upload_to="video_previews/",
+            ),
+        ),
+        migrations.AddField(
+            model_name="videofeedback",
+            name="processed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="videofeedback",
+            name="processing_error",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="videofeedback",
+            name="processing_status",
+            field=models.CharField(
+                choices=[
+                    ("QUEUED", "Queued"),
+                    ("RUNNING", "Running"),
+                    ("DONE", "Done"),
+                    ("FAILED", "Failed"),
+                ],
+                default="QUEUED",
+                max_length=10,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videofeedback",
+            index=models.Index(
+                fields=["processing_status", "submitted_date"],
+                name="idx_video_processing",
+            ),
+        ),
+    ]
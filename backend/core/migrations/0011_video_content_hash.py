@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-17 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_video_processing"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videofeedback",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="SHA-256 of the file - bulk loads skip videos already stored",
+                max_length=64,
+                null=True,
+                unique=True,
+            ),
+        ),
+    ]
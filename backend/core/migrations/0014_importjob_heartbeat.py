@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-17 16:10
+
+from django.db import migrations, models
+
+
+def backfill_running_jobs(apps, schema_editor):
+    # Jobs already RUNNING count as claimed once, last seen when they started
+    ImportJob = apps.get_model("core", "ImportJob")
+    ImportJob.objects.filter(status="RUNNING").update(
+        heartbeat_at=models.F("started_at"), attempts=1
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_upload_sessions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importjob",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="heartbeat_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_running_jobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_importjob_heartbeat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadsession",
+            name="locked_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-17 17:05
+
+from django.db import migrations, models
+
+
+def backfill_running_videos(apps, schema_editor):
+    # Videos already RUNNING count as claimed once, last seen when they were submitted
+    VideoFeedback = apps.get_model("core", "VideoFeedback")
+    VideoFeedback.objects.filter(processing_status="RUNNING").update(
+        processing_heartbeat_at=models.F("submitted_date"), processing_attempts=1
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0015_upload_session_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videofeedback",
+            name="processing_attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="videofeedback",
+            name="processing_heartbeat_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_running_videos, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,37 @@
 # backend/core/models.py
 
+import uuid
+
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 
+class ReferenceName(models.Model):
+    """Canonical spelling of a free-text value, plus extra spellings that mean the same"""
+    name = models.CharField(max_length=200, unique=True)
+    aliases = models.JSONField(default=list, blank=True)
+    
+    class Meta:
+        abstract = True
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+
+
+class PoliceStation(ReferenceName):
+    pass
+
+
+class Division(ReferenceName):
+    pass
+
+
+class Category(ReferenceName):
+    class Meta(ReferenceName.Meta):
+        verbose_name_plural = 'categories'
+
+
 class User(AbstractUser):
     ROLE_CHOICES = [
         ('ADMIN', 'Admin'),
@@ -12,6 +41,10 @@ class User(AbstractUser):
     phone = models.CharField(max_length=15, blank=True)
     police_station = models.CharField(max_length=100, blank=True)
     division = models.CharField(max_length=100, blank=True)
+    # ⚡ Set from police_station on save - STAFF scoping filters on this id
+    police_station_ref = models.ForeignKey(
+        PoliceStation, on_delete=models.SET_NULL, null=True, blank=True, related_name='staff'
+    )
     
     def __str__(self):
         return f"{self.username} - {self.get_role_display()}"
@@ -55,6 +88,18 @@ class OpenCourtApplication(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='created_applications')
     
+    # ⚡ Canonical references, resolved from the text columns on save/import
+    # (the text columns keep the canonical name for display and export)
+    police_station_ref = models.ForeignKey(
+        PoliceStation, on_delete=models.PROTECT, null=True, blank=True, related_name='applications'
+    )
+    division_ref = models.ForeignKey(
+        Division, on_delete=models.PROTECT, null=True, blank=True, related_name='applications'
+    )
+    category_ref = models.ForeignKey(
+        Category, on_delete=models.PROTECT, null=True, blank=True, related_name='applications'
+    )
+    
     class Meta:
         ordering = ['-created_at']
         # ⚡ DATABASE INDEXES FOR SUPER FAST QUERIES
@@ -66,23 +111,82 @@ class OpenCourtApplication(models.Model):
             models.Index(fields=['feedback'], name='idx_feedback'),
             models.Index(fields=['date'], name='idx_date'),
             models.Index(fields=['created_at'], name='idx_created_at'),
+            models.Index(fields=['created_at', 'id'], name='idx_created_at_id'),  # keyset pages
+            models.Index(fields=['updated_at', 'id'], name='idx_updated_at_id'),  # delta sync
             models.Index(fields=['sr_no'], name='idx_sr_no'),
             models.Index(fields=['dairy_no'], name='idx_dairy_no'),
             models.Index(fields=['name'], name='idx_name'),
             # Composite indexes for common filter combinations
             models.Index(fields=['police_station', 'status'], name='idx_ps_status'),
+            models.Index(fields=['police_station_ref', 'status'], name='idx_ps_ref_status'),
             models.Index(fields=['status', 'feedback'], name='idx_status_feedback'),
+            # Case-insensitive filters (`__ciexact`, see core/lookups.py)
+            models.Index(Lower('police_station'), name='idx_police_station_lower'),
+            models.Index(Lower('division'), name='idx_division_lower'),
+            models.Index(Lower('category'), name='idx_category_lower'),
         ]
     
     def __str__(self):
         return f"{self.dairy_no} - {self.name}"
 
+class ApplicationTombstone(models.Model):
+    """
+    Left behind when an application is deleted, so delta-sync clients
+    (applications/changes/) can drop it. Pruned by `manage.py prune_tombstones`.
+    """
+    application_id = models.BigIntegerField()
+    # Copied from the application so STAFF users only see their station's deletes
+    police_station = models.CharField(max_length=100, blank=True)
+    police_station_ref = models.ForeignKey(
+        PoliceStation, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    deleted_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='idx_tombstone_deleted_at'),
+        ]
+    
+    def __str__(self):
+        return f"Application {self.application_id} deleted {self.deleted_at}"
+
+class ApplicationDailyRollup(models.Model):
+    """
+    Pre-aggregated application counts, one row per
+    (date, police_station, division, category, status, feedback).
+    Kept current by core.rollups - read it with Sum('application_count').
+    """
+    date = models.DateField(null=True, blank=True)
+    police_station = models.CharField(max_length=100)
+    division = models.CharField(max_length=100)
+    category = models.CharField(max_length=200)
+    status = models.CharField(max_length=20)
+    feedback = models.CharField(max_length=20)
+    application_count = models.IntegerField(default=0)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['police_station', 'date'], name='idx_rollup_ps_date'),
+            models.Index(fields=['date'], name='idx_rollup_date'),
+            models.Index(Lower('police_station'), name='idx_rollup_ps_lower'),
+        ]
+    
+    def __str__(self):
+        return f"{self.date} {self.police_station} {self.status}/{self.feedback}: {self.application_count}"
+
+
 class VideoFeedback(models.Model):
     FEEDBACK_CHOICES = [
         ('PENDING', 'Pending Review'),
         ('LIKE', 'Approved'),
         ('DISLIKE', 'Rejected'),
     ]
+    PROCESSING_CHOICES = [
+        ('QUEUED', 'Queued'),
+        ('RUNNING', 'Running'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    ]
     
     user_name = models.CharField(max_length=200)  # Random name for now
     video_file = models.FileField(upload_to='video_feedback/')
@@ -99,12 +203,29 @@ class VideoFeedback(models.Model):
     # Video metadata
     duration = models.IntegerField(null=True, blank=True, help_text='Duration in seconds')
     file_size = models.BigIntegerField(null=True, blank=True, help_text='File size in bytes')
+    content_hash = models.CharField(
+        max_length=64, unique=True, null=True, blank=True, editable=False,
+        help_text='SHA-256 of the file - bulk loads skip videos already stored',
+    )
     thumbnail = models.ImageField(upload_to='video_thumbnails/', null=True, blank=True)
+    preview = models.FileField(upload_to='video_previews/', null=True, blank=True, help_text='Low-bitrate preview clip')
+    
+    # Background metadata/thumbnail extraction (core/videos.py)
+    processing_status = models.CharField(max_length=10, choices=PROCESSING_CHOICES, default='QUEUED')
+    processing_error = models.TextField(blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    # Bumped at claim time and between ffmpeg steps - a RUNNING video that stops bumping it lost its worker
+    processing_heartbeat_at = models.DateTimeField(null=True, blank=True)
+    processing_attempts = models.PositiveSmallIntegerField(default=0)
     
     class Meta:
         ordering = ['-submitted_date']
         verbose_name = 'Video Feedback'
         verbose_name_plural = 'Video Feedbacks'
+        indexes = [
+            # Worker polls the oldest queued video
+            models.Index(fields=['processing_status', 'submitted_date'], name='idx_video_processing'),
+        ]
     
     def __str__(self):
         return f"{self.user_name} - {self.title or 'Video Feedback'}"
@@ -113,4 +234,94 @@ class VideoFeedback(models.Model):
     def file_size_mb(self):
         if self.file_size:
             return round(self.file_size / (1024 * 1024), 2)
-        return None
\ No newline at end of file
+        return None
+
+class ImportJob(models.Model):
+    STATUS_CHOICES = [
+        ('QUEUED', 'Queued'),
+        ('RUNNING', 'Running'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    ]
+    
+    file = models.FileField(upload_to='imports/')
+    original_name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='QUEUED')
+    
+    # Progress
+    rows_processed = models.IntegerField(default=0)
+    created_count = models.IntegerField(default=0)
+    updated_count = models.IntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+    error_message = models.TextField(blank=True)
+    
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='import_jobs')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Bumped after every chunk - a RUNNING job that stops bumping it lost its worker
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # Worker polls the oldest queued job
+            models.Index(fields=['status', 'created_at'], name='idx_importjob_status'),
+        ]
+    
+    def __str__(self):
+        return f"{self.original_name or self.file.name} - {self.status}"
+
+
+class MediaBlob(models.Model):
+    """One stored file of the content-addressed media storage (core/storage.py)"""
+    name = models.CharField(max_length=255, unique=True)
+    digest = models.CharField(max_length=64, help_text='SHA-256 of the content')
+    size = models.BigIntegerField()
+    # FileFields pointing at the blob - kept by signals, recounted by gc_media
+    ref_count = models.IntegerField(default=0)
+    # Refreshed whenever an upload reuses the blob - gc_media's grace period counts from here
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            # gc_media looks for old unreferenced blobs
+            models.Index(fields=['ref_count', 'created_at'], name='idx_blob_unreferenced'),
+        ]
+    
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
+
+class UploadSession(models.Model):
+    """A resumable chunked upload in progress (core/uploads.py)"""
+    TARGET_CHOICES = [
+        ('video_feedback', 'New video feedback'),
+        ('video_response', 'Application video response'),
+        ('supporting_documents', 'Application supporting documents'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions')
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField(help_text='Declared total size in bytes')
+    offset = models.BigIntegerField(default=0, help_text='Bytes received so far')
+    checksum = models.CharField(max_length=64, blank=True, help_text='Expected SHA-256 (hex) of the whole file')
+    target = models.CharField(max_length=30, choices=TARGET_CHOICES)
+    application = models.ForeignKey(
+        OpenCourtApplication, on_delete=models.CASCADE, null=True, blank=True, related_name='+',
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Lease of the one PATCH or finalize working on the session (core/uploads.py)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        indexes = [
+            # prune_upload_sessions drops abandoned uploads
+            models.Index(fields=['updated_at'], name='idx_upload_updated_at'),
+        ]
+    
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
@@ -0,0 +1,145 @@
+# backend/core/pagination.py
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+# ⚡ CUSTOM PAGINATION CLASS
+class StandardResultsPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+class KeysetPagination(BasePagination):
+    """
+    Count-free keyset ("seek") pagination.
+
+    Each page is `WHERE key < last_key ORDER BY key LIMIT n`, so page 500
+    costs the same index range scan as page 1 - no OFFSET, no COUNT(*).
+    The cursor is the key of the last row served, base64-encoded.
+
+    ?ordering= picks the key: -created_at (default), created_at, sr_no, -sr_no.
+    ?with_count=true adds the total count for clients that need it once.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    cursor_query_param = 'cursor'
+
+    # ordering param -> (fields, descending)
+    orderings = {
+        '-created_at': (('created_at', 'id'), True),
+        'created_at': (('created_at', 'id'), False),
+        'sr_no': (('sr_no',), False),
+        '-sr_no': (('sr_no',), True),
+    }
+    default_ordering = '-created_at'
+
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = request.query_params.get('ordering', self.default_ordering)
+        if self.ordering not in self.orderings:
+            self.ordering = self.default_ordering
+        self.fields, self.descending = self.orderings[self.ordering]
+
+        self.count = None
+        if request.query_params.get('with_count') in ('1', 'true', 'True'):
+            self.count = queryset.count()
+
+        prefix = '-' if self.descending else ''
+        queryset = queryset.order_by(*(prefix + field for field in self.fields))
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self.seek_filter(self.decode_cursor(cursor)))
+
+        # ⚡ One extra row tells us whether there is a next page
+        page = list(queryset[:self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[:self.page_size]
+        self.last_key = self.row_key(page[-1]) if page else None
+        return page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def row_key(self, obj):
+        if isinstance(obj, dict):  # .values() rows
+            return [obj[field] for field in self.fields]
+        return [getattr(obj, field) for field in self.fields]
+
+    def seek_filter(self, key):
+        """
+        (f1, f2) after (v1, v2) as `f1 > v1 OR (f1 = v1 AND f2 > v2)` (or < when descending).
+
+        The redundant `f1 >= v1` bound lets the planner start the index range
+        at the cursor instead of scanning and discarding the rows before it.
+        """
+        lookup = 'lt' if self.descending else 'gt'
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.fields, key):
+            condition |= Q(**equal, **{f'{field}__{lookup}': value})
+            equal[field] = value
+        return Q(**{f'{self.fields[0]}__{lookup}e': key[0]}) & condition
+
+    # =====================================================
+    # CURSOR ENCODING
+    # =====================================================
+
+    def encode_cursor(self, key):
+        payload = {'o': self.ordering, 'k': [value.isoformat() if hasattr(value, 'isoformat') else value for value in key]}
+        return urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            payload = json.loads(urlsafe_b64decode(cursor.encode('ascii')))
+            if payload['o'] != self.ordering or len(payload['k']) != len(self.fields):
+                raise ValueError
+            key = [
+                parse_datetime(value) if field == 'created_at' else int(value)
+                for field, value in zip(self.fields, payload['k'])
+            ]
+            if None in key:
+                raise ValueError
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        return key
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.last_key))
+
+    def get_paginated_response(self, data):
+        response = {'next': self.get_next_link(), 'results': data}
+        if self.count is not None:
+            response['count'] = self.count
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'count': {'type': 'integer'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,76 @@
+# backend/core/references.py
+"""
+Canonical police station / division / category names.
+
+Free text from Excel files and forms is matched case- and whitespace-
+insensitively against each reference's name and aliases. Unknown values
+create a new reference. Applications and users then point at it by id,
+and their text column is rewritten to the canonical name.
+"""
+
+from .models import Category, Division, PoliceStation
+
+# text field -> (reference model, FK field) on OpenCourtApplication
+APPLICATION_REFERENCES = {
+    'police_station': (PoliceStation, 'police_station_ref'),
+    'division': (Division, 'division_ref'),
+    'category': (Category, 'category_ref'),
+}
+
+# FK fields the importer writes alongside the text columns
+REFERENCE_FIELDS = [ref_field for _, ref_field in APPLICATION_REFERENCES.values()]
+
+
+def clean_name(value):
+    """Trimmed, single-spaced spelling ('' for None)"""
+    return ' '.join(str(value).split()) if value is not None else ''
+
+
+def name_key(value):
+    """Matching key: case- and whitespace-insensitive"""
+    return clean_name(value).casefold()
+
+
+class ReferenceResolver:
+    """
+    Resolves free text to reference rows.
+
+    Each reference table is loaded once per resolver (they hold tens to
+    hundreds of rows), so keep one resolver for a whole import.
+    """
+
+    def __init__(self):
+        self._lookups = {}
+
+    def _lookup(self, model):
+        if model not in self._lookups:
+            lookup = {}
+            for ref in model.objects.all():
+                for spelling in [ref.name, *ref.aliases]:
+                    lookup.setdefault(name_key(spelling), ref)
+            self._lookups[model] = lookup
+        return self._lookups[model]
+
+    def resolve(self, model, value):
+        """Reference for value (created when new), or None for blank text"""
+        key = name_key(value)
+        if not key:
+            return None
+        lookup = self._lookup(model)
+        if key not in lookup:
+            name = clean_name(value)
+            # Another process may have added it since the table was loaded
+            ref = model.objects.filter(name__iexact=name).first()
+            if ref is None:
+                ref, _ = model.objects.get_or_create(name=name)
+            lookup[key] = ref
+        return lookup[key]
+
+    def canonicalize(self, data):
+        """Set the *_ref_id keys of an application field dict and rewrite its text to the canonical names"""
+        for field, (model, ref_field) in APPLICATION_REFERENCES.items():
+            if field in data:
+                ref = self.resolve(model, data[field])
+                data[f'{ref_field}_id'] = ref.pk if ref else None
+                data[field] = ref.name if ref else ''
+        return data
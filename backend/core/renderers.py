@@ -0,0 +1,43 @@
+# backend/core/renderers.py
+"""
+Compact JSON rendering.
+
+With orjson installed, responses are serialized several times faster than
+by the stdlib json module DRF uses. Without it FastJSONRenderer is DRF's
+JSONRenderer. Values orjson doesn't know, and dates (so they keep DRF's
+format), go through DRF's JSONEncoder either way.
+"""
+
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional - pip install orjson
+    orjson = None
+
+_encoder = JSONEncoder()
+
+
+def dumps(data):
+    """Compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer through orjson - indented output (?indent / browsable API) stays with DRF"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
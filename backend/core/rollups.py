@@ -0,0 +1,89 @@
+# backend/core/rollups.py
+
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from .models import ApplicationDailyRollup, OpenCourtApplication
+
+# Dimensions of a rollup row, in key order
+ROLLUP_FIELDS = ['date', 'police_station', 'division', 'category', 'status', 'feedback']
+
+
+def rollup_key(application):
+    """Rollup key tuple of an OpenCourtApplication instance (or a dict of its fields)"""
+    if isinstance(application, dict):
+        return tuple(application.get(field) for field in ROLLUP_FIELDS)
+    return tuple(getattr(application, field) for field in ROLLUP_FIELDS)
+
+
+def apply_rollup_deltas(deltas):
+    """
+    Add {key: +/-n} to the rollup table.
+
+    Each key is one UPDATE ... SET application_count = application_count + n,
+    so concurrent writers never lose each other's increments. A key with no
+    row yet is inserted; rows that reach zero are deleted at the end. Readers
+    always Sum('application_count'), so a duplicate key row created by two
+    concurrent inserts still adds up correctly.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    with transaction.atomic():
+        new_rows = []
+        for key, delta in deltas.items():
+            updated = ApplicationDailyRollup.objects.filter(key_filter(key)).update(
+                application_count=F('application_count') + delta
+            )
+            if not updated and delta > 0:
+                new_rows.append(ApplicationDailyRollup(application_count=delta, **dict(zip(ROLLUP_FIELDS, key))))
+        if new_rows:
+            ApplicationDailyRollup.objects.bulk_create(new_rows)
+
+        dates = {key[0] for key in deltas}
+        date_filter = Q(date__in=[d for d in dates if d is not None])
+        if None in dates:
+            date_filter |= Q(date__isnull=True)
+        ApplicationDailyRollup.objects.filter(
+            date_filter,
+            police_station__in={key[1] for key in deltas},
+            application_count__lte=0,
+        ).delete()
+
+
+def key_filter(key):
+    """Q matching the rollup rows of one key (a None date is IS NULL, not = NULL)"""
+    lookups = dict(zip(ROLLUP_FIELDS, key))
+    if lookups['date'] is None:
+        del lookups['date']
+        lookups['date__isnull'] = True
+    return Q(**lookups)
+
+
+def rebuild_rollups():
+    """Recompute the whole rollup table from OpenCourtApplication. Returns the number of rollup rows"""
+    grouped = (
+        OpenCourtApplication.objects.order_by()
+        .values(*ROLLUP_FIELDS)
+        .annotate(total=Count('id'))
+    )
+    with transaction.atomic():
+        ApplicationDailyRollup.objects.all().delete()
+        rows = ApplicationDailyRollup.objects.bulk_create(
+            (
+                ApplicationDailyRollup(application_count=group['total'], **{field: group[field] for field in ROLLUP_FIELDS})
+                for group in grouped.iterator(chunk_size=2000)
+            ),
+            batch_size=2000,
+        )
+    return len(rows)
+
+
+def key_deltas(old_keys, new_keys):
+    """Counter of rollup changes when rows move from old_keys to new_keys"""
+    deltas = Counter(new_keys)
+    deltas.subtract(Counter(old_keys))
+    return deltas
@@ -0,0 +1,169 @@
+# backend/core/search.py
+"""
+Application search (the `search` query param).
+
+SQLite     - an FTS5 trigram index (core_application_search) over name,
+             dairy_no, contact and sr_no, kept in sync by triggers, so every
+             write path (save, bulk_create, update()) is covered.
+PostgreSQL - pg_trgm GIN indexes on UPPER(column), which the icontains
+             lookups use directly; ranked by trigram similarity.
+Otherwise  - the plain icontains OR chain.
+
+Matches keep icontains semantics (case-insensitive substring) and carry a
+`search_rank` annotation where lower is a better match.
+"""
+
+import logging
+
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIELDS = ['name', 'dairy_no', 'contact', 'sr_no']
+SEARCH_TABLE = 'core_application_search'
+APPLICATION_TABLE = 'core_opencourtapplication'
+
+# Trigram indexes cannot answer shorter terms
+MIN_INDEXED_LENGTH = 3
+
+_columns = ', '.join(SEARCH_FIELDS)
+_new_values = ', '.join(f'new.{field}' for field in SEARCH_FIELDS)
+_old_values = ', '.join(f'old.{field}' for field in SEARCH_FIELDS)
+
+SQLITE_INSTALL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        {_columns}, content='{APPLICATION_TABLE}', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON {APPLICATION_TABLE} BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON {APPLICATION_TABLE} BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au AFTER UPDATE OF {_columns} ON {APPLICATION_TABLE} BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+        INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END""",
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP = [
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_au",
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+]
+
+POSTGRES_INSTALL = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+    f"""CREATE INDEX IF NOT EXISTS idx_{field}_trgm ON {APPLICATION_TABLE}
+        USING gin (UPPER({field}::text) gin_trgm_ops)"""
+    for field in SEARCH_FIELDS
+]
+
+POSTGRES_DROP = [f"DROP INDEX IF EXISTS idx_{field}_trgm" for field in SEARCH_FIELDS]
+
+# alias -> 'fts5' | 'trigram' | None
+_backends = {}
+
+
+# =====================================================
+# INDEX MANAGEMENT
+# =====================================================
+
+def install_search_index(connection):
+    """
+    Create the search index for this connection's database (no-op elsewhere).
+
+    On SQLite the triggers live on the application table: run this again
+    (or `manage.py rebuild_search_index`) after any migration that rebuilds
+    that table.
+    """
+    statements = {'sqlite': SQLITE_INSTALL, 'postgresql': POSTGRES_INSTALL}.get(connection.vendor)
+    if statements:
+        try:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+        except DatabaseError as e:
+            # FTS5/trigram or pg_trgm unavailable: search falls back to icontains
+            logger.warning("Search index not installed: %s", e)
+    _backends.pop(connection.alias, None)
+
+
+def drop_search_index(connection):
+    statements = {'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP}.get(connection.vendor, [])
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    _backends.pop(connection.alias, None)
+
+
+def search_backend(alias='default'):
+    """Which index serves searches on this database (checked once per process)"""
+    if alias not in _backends:
+        connection = connections[alias]
+        backend = None
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [SEARCH_TABLE])
+                backend = 'fts5' if cursor.fetchone() else None
+            elif connection.vendor == 'postgresql':
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                backend = 'trigram' if cursor.fetchone() else None
+        _backends[alias] = backend
+    return _backends[alias]
+
+
+# =====================================================
+# QUERYING
+# =====================================================
+
+def contains_filter(term):
+    """The icontains OR chain over SEARCH_FIELDS"""
+    query = Q()
+    for field in SEARCH_FIELDS:
+        query |= Q(**{f'{field}__icontains': term})
+    return query
+
+
+def match_rank(term):
+    """Exact Sr./Dairy No first, then name prefix, then any other match"""
+    exact = Q(dairy_no__iexact=term)
+    if term.isdigit():
+        exact |= Q(sr_no=int(term))
+    return Case(
+        When(exact, then=Value(0)),
+        When(name__istartswith=term, then=Value(1)),
+        default=Value(2),
+        output_field=IntegerField(),
+    )
+
+
+def search_applications(queryset, term):
+    """Filter queryset to applications matching term, annotated with search_rank"""
+    term = (term or '').strip()
+    if not term:
+        return queryset
+
+    backend = search_backend(queryset.db)
+    if backend == 'fts5' and len(term) >= MIN_INDEXED_LENGTH:
+        # ⚡ Quoted phrase = substring match through the trigram index
+        match = '"%s"' % term.replace('"', '""')
+        queryset = queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s", [match])
+        )
+    else:
+        queryset = queryset.filter(contains_filter(term))
+
+    if backend == 'trigram':
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        similarity = Greatest(*(TrigramSimilarity(field, term) for field in ['name', 'dairy_no', 'contact']))
+        return queryset.annotate(search_rank=-similarity)
+
+    # bm25 over trigrams says little about 15-character fields and costs a
+    # correlated FTS lookup per matching row - rank the matched rows instead
+    return queryset.annotate(search_rank=match_rank(term))
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from .models import OpenCourtApplication, VideoFeedback
-from . models import OpenCourtApplication
+from .models import OpenCourtApplication, VideoFeedback, ImportJob, UploadSession
+from .media import stream_token
+from .uploads import MAX_UPLOAD_SIZE
 
 User = get_user_model()
 
@@ -18,7 +19,62 @@ class OpenCourtApplicationSerializer(serializers.ModelSerializer):
     class Meta:
         model = OpenCourtApplication
         fields = '__all__'
-        read_only_fields = ['created_at', 'updated_at', 'created_by']
+        read_only_fields = [
+            'created_at', 'updated_at', 'created_by',
+            # resolved from the text fields on save
+            'police_station_ref', 'division_ref', 'category_ref',
+        ]
+
+
+# Fields `?fields=` may project: every column except the file fields, plus created_by_name
+APPLICATION_PROJECTABLE_FIELDS = [
+    'id', 'sr_no', 'dairy_no', 'name', 'contact', 'marked_to', 'date', 'marked_by',
+    'timeline', 'police_station', 'division', 'category', 'status', 'days', 'feedback',
+    'dairy_ps', 'remarks', 'created_at', 'updated_at', 'created_by_name',
+]
+
+
+class ApplicationRowListSerializer(serializers.ListSerializer):
+    """
+    ⚡ Serializes `.values()` rows in one loop - text and number columns are
+    copied as-is, only dates and datetimes go through their DRF field.
+    """
+    passthrough = (serializers.CharField, serializers.IntegerField, serializers.ChoiceField)
+    
+    def to_representation(self, data):
+        columns = [
+            (name, column, None if isinstance(field, self.passthrough) else field.to_representation)
+            for (name, field), column in zip(self.child.fields.items(), self.child.value_columns())
+        ]
+        rows = []
+        for row in data:
+            item = {}
+            for name, column, convert in columns:
+                value = row[column]
+                item[name] = value if convert is None or value is None else convert(value)
+            rows.append(item)
+        return rows
+
+
+class OpenCourtApplicationListSerializer(serializers.ModelSerializer):
+    """Read-only projection for list pages, serializing `.values()` rows"""
+    created_by_name = serializers.CharField(source='created_by.username', read_only=True)
+    
+    class Meta:
+        model = OpenCourtApplication
+        fields = APPLICATION_PROJECTABLE_FIELDS
+        read_only_fields = fields
+        list_serializer_class = ApplicationRowListSerializer
+    
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+    
+    def value_columns(self):
+        """`.values()` lookups for the selected fields"""
+        return [field.source.replace('.', '__') for field in self.fields.values()]
 
 
 class ApplicationStatsSerializer(serializers. Serializer):
@@ -45,6 +101,7 @@ class PoliceStationStatsSerializer(serializers.Serializer):
 class VideoFeedbackSerializer(serializers.ModelSerializer):
     file_size_mb = serializers.ReadOnlyField()
     reviewed_by_name = serializers.CharField(source='reviewed_by.username', read_only=True)
+    stream_token = serializers.SerializerMethodField()
     
     class Meta:
         model = VideoFeedback
@@ -52,6 +109,62 @@ class VideoFeedbackSerializer(serializers.ModelSerializer):
             'id', 'user_name', 'video_file', 'title', 'description',
             'submitted_date', 'admin_feedback', 'admin_remarks',
             'reviewed_by', 'reviewed_by_name', 'reviewed_at',
-            'duration', 'file_size', 'file_size_mb', 'thumbnail'
+            'duration', 'file_size', 'file_size_mb', 'thumbnail',
+            'preview', 'processing_status', 'processed_at', 'stream_token',
+        ]
+        read_only_fields = [
+            'submitted_date', 'reviewed_by', 'reviewed_at',
+            'preview', 'processing_status', 'processed_at',
         ]
-        read_only_fields = ['submitted_date', 'reviewed_by', 'reviewed_at']
\ No newline at end of file
+
+    def get_stream_token(self, video):
+        """?token= for the stream/ URL of this video (core/media.py)"""
+        request = self.context.get('request')
+        if request is None or not request.user.is_authenticated:
+            return None
+        return stream_token(video, request.user)
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    created_by_name = serializers.CharField(source='created_by.username', read_only=True)
+    
+    class Meta:
+        model = ImportJob
+        fields = [
+            'id', 'original_name', 'status', 'rows_processed',
+            'created_count', 'updated_count', 'errors', 'error_message',
+            'created_by', 'created_by_name', 'created_at', 'started_at', 'finished_at'
+        ]
+        read_only_fields = fields
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadSession
+        fields = ['id', 'filename', 'size', 'offset', 'checksum', 'target', 'application', 'created_at', 'updated_at']
+        read_only_fields = ['offset', 'created_at', 'updated_at']
+
+    def validate_size(self, value):
+        if not 0 < value <= MAX_UPLOAD_SIZE:
+            raise serializers.ValidationError(f'Size must be between 1 and {MAX_UPLOAD_SIZE} bytes')
+        return value
+
+    def validate_checksum(self, value):
+        value = value.strip().lower()
+        if value and (len(value) != 64 or set(value) - set('0123456789abcdef')):
+            raise serializers.ValidationError('Expected a SHA-256 hex digest')
+        return value
+
+    def validate(self, attrs):
+        if (attrs['target'] == 'video_feedback') != (attrs.get('application') is None):
+            raise serializers.ValidationError(
+                {'application': 'Required for application files, not allowed for video feedback'}
+            )
+        return attrs
+
+
+class UploadFinalizeSerializer(serializers.Serializer):
+    """Fields of the VideoFeedback a finalized video upload creates"""
+    user_name = serializers.CharField(max_length=200)
+    title = serializers.CharField(max_length=300, required=False, allow_blank=True, default='')
+    description = serializers.CharField(required=False, allow_blank=True, trim_whitespace=False, default='')
@@ -0,0 +1,216 @@
+# backend/core/signals.py
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_data_version_on_commit
+from .models import (
+    ApplicationTombstone, Category, Division, ImportJob, OpenCourtApplication, PoliceStation, User, VideoFeedback,
+)
+from .references import APPLICATION_REFERENCES, ReferenceResolver
+from .rollups import ROLLUP_FIELDS, apply_rollup_deltas, rollup_key
+from .storage import MEDIA_FIELDS, adjust_references
+from .sync import station_moved, station_of
+
+
+# =====================================================
+# ⚡ ROLLUP MAINTENANCE
+# =====================================================
+
+@receiver(post_init, sender=OpenCourtApplication)
+def remember_rollup_key(sender, instance, **kwargs):
+    """Keep the key the row was loaded with, so a save knows what it moved from"""
+    if instance.pk is None or instance.get_deferred_fields().intersection(ROLLUP_FIELDS):
+        instance._rollup_key = None
+    else:
+        instance._rollup_key = rollup_key(instance)
+
+
+@receiver(pre_save, sender=OpenCourtApplication)
+def load_missing_rollup_key(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Fetch the stored key when the loaded one can't be trusted: the instance
+    was built by hand with an explicit pk, or loaded with deferred fields.
+    """
+    if raw:
+        return
+    if instance.pk is None:
+        instance._rollup_key = None
+        return
+    if not instance._state.adding and getattr(instance, '_rollup_key', None) is not None:
+        return
+    if update_fields is not None and not set(update_fields).intersection(ROLLUP_FIELDS):
+        return
+    stored = sender.objects.filter(pk=instance.pk).values_list(*ROLLUP_FIELDS).first()
+    instance._rollup_key = tuple(stored) if stored else None
+
+
+@receiver(post_save, sender=OpenCourtApplication)
+def update_rollup_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not set(update_fields).intersection(ROLLUP_FIELDS):
+        return
+
+    old_key = getattr(instance, '_rollup_key', None)
+    new_key = rollup_key(instance)
+    if old_key != new_key:
+        deltas = {new_key: 1}
+        if old_key is not None:
+            deltas[old_key] = -1
+        apply_rollup_deltas(deltas)
+    instance._rollup_key = new_key
+
+
+@receiver(post_delete, sender=OpenCourtApplication)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    key = getattr(instance, '_rollup_key', None) or rollup_key(instance)
+    apply_rollup_deltas({key: -1})
+
+
+# =====================================================
+# ⚡ CACHE INVALIDATION
+# =====================================================
+
+@receiver(post_save, sender=OpenCourtApplication)
+@receiver(post_delete, sender=OpenCourtApplication)
+@receiver(post_save, sender=PoliceStation)
+@receiver(post_delete, sender=PoliceStation)
+@receiver(post_save, sender=Division)
+@receiver(post_delete, sender=Division)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_cached_data(sender, raw=False, **kwargs):
+    if not raw:
+        bump_data_version_on_commit()
+
+
+@receiver(post_save, sender=VideoFeedback)
+@receiver(post_delete, sender=VideoFeedback)
+def invalidate_cached_videos(sender, raw=False, **kwargs):
+    if not raw:
+        bump_data_version_on_commit('videos')
+
+
+# =====================================================
+# DELTA SYNC
+# =====================================================
+
+@receiver(post_delete, sender=OpenCourtApplication)
+def record_tombstone(sender, instance, **kwargs):
+    """Let applications/changes/ tell synced clients about the delete"""
+    ApplicationTombstone.objects.create(
+        application_id=instance.pk,
+        police_station=instance.police_station,
+        police_station_ref_id=instance.police_station_ref_id,
+    )
+
+
+@receiver(post_init, sender=OpenCourtApplication)
+def remember_station(sender, instance, **kwargs):
+    instance._station = station_of(instance.__dict__) if instance.pk is not None else None
+
+
+@receiver(post_save, sender=OpenCourtApplication)
+def record_station_change(sender, instance, created, raw=False, **kwargs):
+    """
+    A row moved to another police station disappears from the old station's
+    STAFF clients - tell them with a tombstone scoped to the old station.
+    """
+    if raw:
+        return
+    old, new = instance._station, station_of(instance.__dict__)
+    if not created and old is not None and station_moved(old, new):
+        ApplicationTombstone.objects.create(
+            application_id=instance.pk, police_station=old[1] or '', police_station_ref_id=old[0],
+        )
+    instance._station = new
+
+
+# =====================================================
+# ⚡ REFERENCE RESOLUTION
+# =====================================================
+
+@receiver(post_init, sender=OpenCourtApplication)
+def remember_reference_text(sender, instance, **kwargs):
+    instance._reference_text = {field: instance.__dict__.get(field) for field in APPLICATION_REFERENCES}
+
+
+@receiver(pre_save, sender=OpenCourtApplication)
+def assign_application_references(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Point police_station/division/category at their reference rows when the text changed"""
+    if raw:
+        return
+    resolver = None
+    for field, (model, ref_field) in APPLICATION_REFERENCES.items():
+        if update_fields is not None and field not in update_fields:
+            continue
+        value = getattr(instance, field)
+        if getattr(instance, f'{ref_field}_id') is not None and value == instance._reference_text.get(field):
+            continue
+        resolver = resolver or ReferenceResolver()
+        ref = resolver.resolve(model, value)
+        setattr(instance, ref_field, ref)
+        setattr(instance, field, ref.name if ref else '')
+        instance._reference_text[field] = getattr(instance, field)
+
+
+@receiver(pre_save, sender=User)
+def assign_user_police_station(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and 'police_station' not in update_fields):
+        return
+    ref = ReferenceResolver().resolve(PoliceStation, instance.police_station)
+    instance.police_station_ref = ref
+    instance.police_station = ref.name if ref else ''
+
+
+# =====================================================
+# MEDIA REFERENCES (content-addressed storage)
+# =====================================================
+
+def _media_names(instance):
+    """{field: stored name} of the loaded (non-deferred) file fields"""
+    return {
+        field: getattr(instance.__dict__[field], 'name', instance.__dict__[field]) or None
+        for field in MEDIA_FIELDS[type(instance)] if field in instance.__dict__
+    }
+
+
+@receiver(post_init, sender=OpenCourtApplication)
+@receiver(post_init, sender=VideoFeedback)
+@receiver(post_init, sender=ImportJob)
+def remember_media_names(sender, instance, **kwargs):
+    instance._media_names = _media_names(instance) if instance.pk is not None else {}
+
+
+@receiver(post_save, sender=OpenCourtApplication)
+@receiver(post_save, sender=VideoFeedback)
+@receiver(post_save, sender=ImportJob)
+def count_media_references(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """A blob gains a reference when a field starts pointing at it and loses one when it stops"""
+    if raw:
+        return
+    old = {} if created else instance._media_names
+    new = _media_names(instance)
+    deltas = {}
+    for field, name in new.items():
+        if update_fields is not None and field not in update_fields:
+            continue
+        if not created and field not in old:
+            continue  # deferred when loaded - gc_media recounts it
+        before = old.get(field)
+        if before == name:
+            continue
+        if before:
+            deltas[before] = deltas.get(before, 0) - 1
+        if name:
+            deltas[name] = deltas.get(name, 0) + 1
+    adjust_references(deltas)
+    instance._media_names = {**old, **new}
+
+
+@receiver(post_delete, sender=OpenCourtApplication)
+@receiver(post_delete, sender=VideoFeedback)
+@receiver(post_delete, sender=ImportJob)
+def release_media_references(sender, instance, **kwargs):
+    adjust_references({name: -1 for name in set(_media_names(instance).values()) if name})
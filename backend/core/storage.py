@@ -0,0 +1,235 @@
+# backend/core/storage.py
+"""
+Content-addressed media storage.
+
+Every saved file lands at cas/<ab>/<cd>/<sha256><ext>: uploading the same
+video or PDF twice stores it once. Each blob has a MediaBlob row whose
+ref_count follows the FileFields pointing at it (core/signals.py);
+`manage.py gc_media` removes blobs nothing references any more.
+
+The hash costs no extra read: the upload handlers below hash the request
+body as it arrives, and the storage then only moves the finished temp
+file into place. Files saved from elsewhere (thumbnails, imports) are
+hashed while they are copied in.
+
+Names saved before this storage (video_feedback/clip.mp4...) keep working;
+they are read and deleted like with FileSystemStorage.
+"""
+
+import hashlib
+import os
+import tempfile
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ImportJob, MediaBlob, OpenCourtApplication, VideoFeedback
+
+CAS_PREFIX = 'cas/'
+TEMP_DIR = 'cas/tmp'
+
+# Every FileField that may point at a blob
+MEDIA_FIELDS = {
+    OpenCourtApplication: ('video_response', 'supporting_documents'),
+    VideoFeedback: ('video_file', 'thumbnail', 'preview'),
+    ImportJob: ('file',),
+}
+
+# Unreferenced blobs younger than this are kept - their row may not be committed yet
+GC_GRACE = timedelta(hours=24)
+# Orphaned blobs re-checked and deleted per statement
+GC_BATCH_SIZE = 500
+
+
+def blob_name(digest, extension=''):
+    return f'{CAS_PREFIX}{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}'
+
+
+def is_blob(name):
+    return bool(name) and name.startswith(CAS_PREFIX)
+
+
+def adjust_references(deltas):
+    """Apply {blob name: +n/-n} to MediaBlob.ref_count (other names are ignored)"""
+    for name, delta in deltas.items():
+        if delta and is_blob(name):
+            MediaBlob.objects.filter(name=name).update(ref_count=F('ref_count') + delta)
+
+
+# =====================================================
+# UPLOAD HANDLERS (hash while receiving)
+# =====================================================
+
+class HashingUploadMixin:
+    """Adds .content_hash (sha256 hex) to the uploaded file"""
+
+    def new_file(self, *args, **kwargs):
+        self.hasher = hashlib.sha256()
+        return super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hasher.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.content_hash = self.hasher.hexdigest()
+        return file
+
+
+class HashingMemoryFileUploadHandler(HashingUploadMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(HashingUploadMixin, TemporaryFileUploadHandler):
+    pass
+
+
+# =====================================================
+# ⚡ STORAGE
+# =====================================================
+
+class ContentAddressedStorage(FileSystemStorage):
+
+    def _save(self, name, content):
+        extension = os.path.splitext(name)[1]
+        digest = getattr(content, 'content_hash', None)
+
+        if digest and hasattr(content, 'temporary_file_path'):
+            # Hashed while it was uploaded and already on disk - only a move
+            final = blob_name(digest, extension)
+            self._store(content.temporary_file_path(), final, digest)
+        else:
+            # One pass: hash while writing a temp file next to the blobs
+            temp_path, digest = self._write_temp(content)
+            try:
+                final = blob_name(digest, extension)
+                self._store(temp_path, final, digest)
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+        return final
+
+    def _store(self, source, final, digest):
+        # Reusing a blob restarts its GC grace period, in the same UPDATE that finds it:
+        # an old orphan must not be collected before the row saving it commits.
+        # Done before the file check, so a file gc_media removed meanwhile is placed again
+        reused = MediaBlob.objects.filter(name=final).update(created_at=timezone.now())
+        if not self.exists(final):
+            self._place(source, final)
+        if not reused:
+            MediaBlob.objects.get_or_create(name=final, defaults={'digest': digest, 'size': self.size(final)})
+
+    def _write_temp(self, content):
+        """(temp file path, sha256) of content copied under TEMP_DIR"""
+        temp_dir = self.path(TEMP_DIR)
+        os.makedirs(temp_dir, exist_ok=True)
+        hasher = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(dir=temp_dir, delete=False) as handle:
+            if hasattr(content, 'seek'):
+                content.seek(0)
+            for chunk in content.chunks():
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()
+                hasher.update(chunk)
+                handle.write(chunk)
+        return handle.name, hasher.hexdigest()
+
+    def _place(self, source, name):
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file_move_safe(source, path, allow_overwrite=True)
+        if self.file_permissions_mode is not None:
+            os.chmod(path, self.file_permissions_mode)
+
+    def delete(self, name):
+        # Other rows may share the blob - gc_media removes it once unreferenced
+        if is_blob(name):
+            return
+        super().delete(name)
+
+
+# =====================================================
+# GARBAGE COLLECTION (manage.py gc_media)
+# =====================================================
+
+def count_references(names=None):
+    """Counter of blob name -> FileFields pointing at it, read from the tables"""
+    counts = Counter()
+    for model, fields in MEDIA_FIELDS.items():
+        for field in fields:
+            lookup = {f'{field}__in': names} if names is not None else {f'{field}__startswith': CAS_PREFIX}
+            counts.update(model.objects.filter(**lookup).values_list(field, flat=True))
+    return counts
+
+
+def collect_garbage(grace=GC_GRACE, dry_run=False):
+    """
+    Recount every blob from the tables (signals miss bulk_create/update()),
+    then delete blobs nothing references that are older than `grace`, plus
+    stray files under cas/ without a blob row. Returns counts and bytes freed.
+    """
+    storage = default_storage
+    cutoff = timezone.now() - grace
+    stats = {'recounted': 0, 'deleted': 0, 'stray': 0, 'freed': 0}
+
+    # 1. Recount
+    counts = count_references()
+    drifted = []
+    for blob in MediaBlob.objects.only('id', 'name', 'ref_count').iterator():
+        if blob.ref_count != counts.get(blob.name, 0):
+            blob.ref_count = counts.get(blob.name, 0)
+            drifted.append(blob)
+    if not dry_run:
+        MediaBlob.objects.bulk_update(drifted, ['ref_count'], batch_size=500)
+    stats['recounted'] = len(drifted)
+
+    # 2. Unreferenced blobs - checked against the tables once more right before deleting,
+    # GC_BATCH_SIZE at a time (SQLite caps the parameters of one statement)
+    orphans = [
+        (pk, name, size)
+        for pk, name, size in MediaBlob.objects.filter(ref_count__lte=0, created_at__lt=cutoff)
+        .order_by('pk').values_list('pk', 'name', 'size')
+        if name not in counts  # a dry run didn't store the recount
+    ]
+    for start in range(0, len(orphans), GC_BATCH_SIZE):
+        batch = orphans[start:start + GC_BATCH_SIZE]
+        with transaction.atomic():
+            referenced = count_references([name for _, name, _ in batch])
+            # An upload may have reused one since it was listed (_store refreshes created_at)
+            still_old = set(
+                MediaBlob.objects.filter(pk__in=[pk for pk, _, _ in batch], created_at__lt=cutoff)
+                .values_list('pk', flat=True)
+            )
+            batch = [orphan for orphan in batch if orphan[1] not in referenced and orphan[0] in still_old]
+            for _, name, size in batch:
+                stats['deleted'] += 1
+                stats['freed'] += size
+                if not dry_run and storage.exists(name):
+                    FileSystemStorage.delete(storage, name)
+            if not dry_run:
+                MediaBlob.objects.filter(pk__in=[pk for pk, _, _ in batch]).delete()
+
+    # 3. Files with no blob row: a save that failed before its row was written, old temp files
+    root = storage.path(CAS_PREFIX)
+    known = set(MediaBlob.objects.values_list('name', flat=True))
+    for directory, _, files in os.walk(root):
+        for file_name in files:
+            path = os.path.join(directory, file_name)
+            name = os.path.relpath(path, storage.location).replace(os.sep, '/')
+            stat = os.stat(path)
+            if name in known or stat.st_mtime >= cutoff.timestamp():
+                continue
+            stats['stray'] += 1
+            stats['freed'] += stat.st_size
+            if not dry_run:
+                os.unlink(path)
+    return stats
@@ -0,0 +1,131 @@
+# backend/core/sync.py
+"""
+Delta sync for applications (GET /api/applications/changes/?since=<token>).
+
+A sync token records how far a client has read: the (updated_at, id) of the
+last changed row and the (deleted_at, id) of the last tombstone served. Each
+call returns the rows and tombstones after those keys, oldest first, through
+the (updated_at, id) and (deleted_at, id) indexes, plus the next token.
+
+Only changes at least SETTLE_SECONDS old are served. updated_at is stamped
+before the transaction commits, so a slow write (an import chunk) could
+otherwise become visible behind a watermark a client has already passed.
+"""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+SETTLE_SECONDS = 5
+
+# Tombstones older than this are pruned; older tokens must resync from scratch
+TOMBSTONE_RETENTION = timedelta(days=30)
+
+CHANGES_LIMIT = 1000
+MAX_CHANGES_LIMIT = 5000
+
+
+class TokenExpired(Exception):
+    """The token predates the oldest tombstone kept - deletes may have been missed"""
+
+
+def encode_token(row_key, tombstone_key):
+    payload = {'u': [row_key[0].isoformat(), row_key[1]], 'd': [tombstone_key[0].isoformat(), tombstone_key[1]]}
+    return urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+
+def decode_token(token):
+    """(row_key, tombstone_key) - raises ValueError for a malformed token"""
+    try:
+        payload = json.loads(urlsafe_b64decode(token.encode('ascii')))
+        keys = [(parse_datetime(payload[name][0]), int(payload[name][1])) for name in ('u', 'd')]
+        if any(moment is None for moment, _ in keys):
+            raise ValueError
+    except (TypeError, ValueError, KeyError, IndexError):
+        raise ValueError('Invalid sync token')
+    return keys[0], keys[1]
+
+
+def _after(field, key):
+    """Rows whose (field, id) sorts after key - with the redundant leading bound for the index"""
+    moment, pk = key
+    return Q(**{f'{field}__gte': moment}) & (Q(**{f'{field}__gt': moment}) | Q(**{field: moment, 'id__gt': pk}))
+
+
+def station_of(values):
+    """(police_station_ref_id, police_station) of an application's field values - None when deferred"""
+    if 'police_station_ref_id' not in values or 'police_station' not in values:
+        return None
+    return values.get('police_station_ref_id'), values.get('police_station')
+
+
+def station_moved(old, new):
+    """Whether an application left the station it was in (a case-only rename is no move)"""
+    if old is None or new is None:
+        return False
+    return old[0] != new[0] or (old[1] or '').strip().lower() != (new[1] or '').strip().lower()
+
+
+def read_changes(applications, tombstones, token=None, limit=CHANGES_LIMIT):
+    """
+    Changes after `token` (None = every row, for a client's first sync).
+
+    `applications` may be a .values() queryset but must select updated_at and
+    id. Returns {'changed': [...], 'deleted': [ids], 'token': str, 'has_more': bool}.
+
+    Tombstones are also left when a row moves to another police station. Ids
+    still visible through `applications` (it moved into the caller's scope,
+    or back) are not reported as deleted - their latest state is in `changed`.
+    """
+    cutoff = timezone.now() - timedelta(seconds=SETTLE_SECONDS)
+    visible = applications
+
+    if token is None:
+        # A first sync reads every row - deletes before it don't concern the client
+        row_key, tombstone_key = None, (cutoff, 0)
+    else:
+        row_key, tombstone_key = decode_token(token)
+        if tombstone_key[0] < timezone.now() - TOMBSTONE_RETENTION:
+            raise TokenExpired
+
+    applications = applications.filter(updated_at__lte=cutoff)
+    if row_key is not None:
+        applications = applications.filter(_after('updated_at', row_key))
+    # ⚡ One extra row tells us whether there is more to read
+    changed = list(applications.order_by('updated_at', 'id')[:limit + 1])
+
+    deleted = []
+    if token is not None:
+        tombstones = tombstones.filter(_after('deleted_at', tombstone_key), deleted_at__lte=cutoff)
+        deleted = list(tombstones.order_by('deleted_at', 'id').values_list('deleted_at', 'id', 'application_id')[:limit + 1])
+
+    more_changed, more_deleted = len(changed) > limit, len(deleted) > limit
+    changed, deleted = changed[:limit], deleted[:limit]
+
+    if changed:
+        last = changed[-1]
+        row_key = (last['updated_at'], last['id']) if isinstance(last, dict) else (last.updated_at, last.id)
+    if deleted:
+        tombstone_key = deleted[-1][:2]
+        still_visible = set(
+            visible.filter(id__in={application_id for _, _, application_id in deleted}).values_list('id', flat=True)
+        )
+        deleted = [entry for entry in deleted if entry[2] not in still_visible]
+    # Caught up: move to the cutoff, so an idle client's token doesn't age out
+    # and the next call seeks from there. Anything stamped exactly at the
+    # cutoff may be sent twice - clients apply changes idempotently.
+    if not more_changed:
+        row_key = max(row_key or (cutoff, 0), (cutoff, 0))
+    if not more_deleted:
+        tombstone_key = max(tombstone_key, (cutoff, 0))
+
+    return {
+        'changed': changed,
+        'deleted': [application_id for _, _, application_id in deleted],
+        'token': encode_token(row_key, tombstone_key),
+        'has_more': more_changed or more_deleted,
+    }
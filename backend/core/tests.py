@@ -1,61 +1,1308 @@
-from django. db import models
-from django.contrib.auth.models import AbstractUser
-
-class User(AbstractUser):
-    ROLE_CHOICES = [
-        ('DIG', 'DIG/Senior Police Officer'),
-        ('PSO', 'Police Station Officer'),
-    ]
-    role = models.CharField(max_length=3, choices=ROLE_CHOICES, default='PSO')
-    phone = models.CharField(max_length=15, blank=True)
-    police_station = models.CharField(max_length=100, blank=True)
-    division = models.CharField(max_length=100, blank=True)
-    
-    def __str__(self):
-        return f"{self.username} - {self.get_role_display()}"
-
-
-class OpenCourtApplication(models.Model):
-    STATUS_CHOICES = [
-        ('PENDING', 'Pending'),
-        ('HEARD', 'Heard'),
-        ('REFERRED', 'Referred to Legal Assistance'),
-        ('CLOSED', 'Closed'),
-    ]
-    
-    FEEDBACK_CHOICES = [
-        ('POSITIVE', 'Positive'),
-        ('NEGATIVE', 'Negative'),
-        ('PENDING', 'Pending'),
-    ]
-    
-    sr_no = models.IntegerField(unique=True)
-    dairy_no = models.CharField(max_length=100)
-    name = models.CharField(max_length=200)
-    contact = models.CharField(max_length=15)
-    marked_to = models.CharField(max_length=200, blank=True)
-    date = models.DateField(null=True, blank=True)
-    marked_by = models.CharField(max_length=200, blank=True)
-    timeline = models.CharField(max_length=100, blank=True)
-    police_station = models.CharField(max_length=100)
-    division = models.CharField(max_length=100)
-    category = models.CharField(max_length=200)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
-    days = models.IntegerField(null=True, blank=True)
-    feedback = models.CharField(max_length=20, choices=FEEDBACK_CHOICES, default='PENDING')
-    dairy_ps = models.CharField(max_length=100, blank=True)
-    
-    # Additional fields
-    remarks = models.TextField(blank=True)
-    video_response = models.FileField(upload_to='video_responses/', null=True, blank=True)
-    supporting_documents = models.FileField(upload_to='documents/', null=True, blank=True)
-    
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='created_applications')
-    
-    class Meta:
-        ordering = ['-created_at']
-    
-    def __str__(self):
-        return f"{self. dairy_no} - {self.name}"
\ No newline at end of file
+# backend/core/tests.py
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+import openpyxl
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from benchmarks.data import synthetic_applications
+from .importer import detect_columns, iter_application_rows, upsert_applications
+from .ingest import ingest_videos
+from .jobs import enqueue_import, process_next_import_job
+from .media import stream_token
+from .metrics import registry
+from .models import (
+    ApplicationDailyRollup, Category, ImportJob, MediaBlob, OpenCourtApplication, PoliceStation, UploadSession,
+    User, VideoFeedback,
+)
+from .renderers import FastJSONRenderer
+from .rollups import apply_rollup_deltas, rebuild_rollups
+from .search import search_backend
+from .storage import GC_GRACE, ContentAddressedStorage, collect_garbage, count_references
+from .sync import TOMBSTONE_RETENTION, encode_token
+from .uploads import SESSION_LEASE, UPLOAD_SESSION_TTL, part_path
+from .videos import mp4_duration, process_next_video
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+# One JSON line per request would bury the test output (N+1 warnings still show)
+logging.getLogger('core.metrics').setLevel(logging.WARNING)
+
+
+def make_application(sr_no, **fields):
+    defaults = {
+        'dairy_no': f'D-{sr_no}',
+        'name': f'Applicant {sr_no}',
+        'contact': '03001234567',
+        'police_station': 'Akbari Gate',
+        'division': 'CITY',
+        'category': 'Misc',
+    }
+    defaults.update(fields)
+    return OpenCourtApplication.objects.create(sr_no=sr_no, **defaults)
+
+
+def csv_upload(rows, name='import.csv'):
+    header = 'Sr.No,Dairy No,Name,Contact,Marked To,Date,Marked By,Timeline,P.S,DIVISON,Category,Status,Days,Feedback,Dairy PS'
+    lines = [header] + [','.join(str(value) for value in row) for row in rows]
+    return SimpleUploadedFile(name, '\n'.join(lines).encode('utf-8'))
+
+
+# =====================================================
+# EXCEL / CSV IMPORT
+# =====================================================
+
+class ImporterTests(TestCase):
+    def test_detect_columns_ignores_summary_table_right_of_data(self):
+        header = ('Sr.No', 'Dairy No ', 'Name', 'Contact', 'Marked To', 'Date', 'Marked By',
+                  'Timeline', 'P.S', 'DIVISON', 'Category', 'Status', 'Days', 'Feedback',
+                  None, None, None, 'Dairy PS')
+        columns = detect_columns(header)
+        self.assertEqual(columns['police_station'], 8)
+        self.assertEqual(columns['division'], 9)
+        self.assertEqual(columns['dairy_ps'], 14)
+
+    def test_csv_rows_are_normalized(self):
+        errors = []
+        upload = csv_upload([
+            [1, 'D-1', 'Ali', 3001234567, 'SHO', '2025-01-05', 'DIG', '7 days', 'Kot Lakhpat', 'MODEL TOWN', 'Misc', 'heard', 12, 'Positive', 'JAMIL'],
+            ['', '', '', '', '', '', '', '', '', '', '', '', '', '', ''],
+            ['abc', 'D-3', 'Bad', '', '', '', '', '', '', '', '', '', '', '', ''],
+        ])
+        rows = list(iter_application_rows(upload, upload.name, errors=errors))
+
+        self.assertEqual(len(rows), 1)
+        row_num, data = rows[0]
+        self.assertEqual(row_num, 2)
+        self.assertEqual(data['sr_no'], 1)
+        self.assertEqual(data['date'], date(2025, 1, 5))
+        self.assertEqual(data['status'], 'HEARD')
+        self.assertEqual(data['feedback'], 'POSITIVE')
+        self.assertEqual(data['days'], 12)
+        self.assertEqual(errors, ['Row 4: invalid Sr. No'])
+
+    def test_upsert_counts_created_and_updated(self):
+        make_application(1, name='Old name')
+        records = [
+            (2, {'sr_no': 1, 'name': 'New name', 'date': datetime(2025, 1, 1).date()}),
+            (3, {'sr_no': 2, 'name': 'Second'}),
+            (4, {'sr_no': 2, 'name': 'Second again'}),
+        ]
+        result = upsert_applications(records, chunk_size=2)
+
+        self.assertEqual(result, {'created': 1, 'updated': 2, 'errors': []})
+        self.assertEqual(OpenCourtApplication.objects.get(sr_no=1).name, 'New name')
+        self.assertEqual(OpenCourtApplication.objects.get(sr_no=2).name, 'Second again')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, IMPORT_JOBS_INLINE_THREAD=False)
+class ImportJobTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create(username='admin', role='ADMIN')
+        self.client.force_authenticate(self.admin)
+
+    def test_job_is_queued_then_processed_by_worker(self):
+        upload = csv_upload([[5, 'D-5', 'Sara', '', '', '', '', '', 'Akbari Gate', 'CITY', 'Misc', '', '', '', '']])
+        response = self.client.post('/api/import-jobs/', {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['status'], 'QUEUED')
+
+        job = process_next_import_job()
+        self.assertEqual(job.status, 'DONE')
+
+        response = self.client.get(f"/api/import-jobs/{response.data['id']}/")
+        self.assertEqual(response.data['status'], 'DONE')
+        self.assertEqual(response.data['created_count'], 1)
+        self.assertEqual(response.data['rows_processed'], 1)
+        self.assertIsNone(process_next_import_job())
+
+    def test_job_of_a_dead_worker_is_reclaimed_then_failed(self):
+        job = enqueue_import(csv_upload([[6, 'D-6', 'Omar', '', '', '', '', '', 'Akbari Gate', 'CITY', 'Misc', '', '', '', '']]))
+        stale = timezone.now() - timedelta(minutes=settings.IMPORT_JOB_STALE_MINUTES + 1)
+        ImportJob.objects.filter(pk=job.pk).update(status='RUNNING', heartbeat_at=timezone.now(), attempts=1)
+        self.assertIsNone(process_next_import_job())
+
+        ImportJob.objects.filter(pk=job.pk).update(heartbeat_at=stale)
+        job = process_next_import_job()
+        self.assertEqual((job.status, job.attempts, job.created_count), ('DONE', 2, 1))
+
+        ImportJob.objects.filter(pk=job.pk).update(
+            status='RUNNING', heartbeat_at=stale, attempts=settings.IMPORT_JOB_MAX_ATTEMPTS,
+        )
+        with self.assertLogs('core.jobs', 'ERROR'):
+            self.assertIsNone(process_next_import_job())
+        self.assertEqual(ImportJob.objects.get(pk=job.pk).status, 'FAILED')
+
+    def test_staff_cannot_see_other_users_jobs(self):
+        job = enqueue_import(csv_upload([]), user=self.admin)
+        staff = User.objects.create(username='staff', role='STAFF', police_station='Akbari Gate')
+        self.client.force_authenticate(staff)
+        response = self.client.get(f'/api/import-jobs/{job.pk}/')
+        self.assertEqual(response.status_code, 404)
+
+
+# =====================================================
+# PAGINATION
+# =====================================================
+
+class KeysetPaginationTests(APITestCase):
+    def setUp(self):
+        for sr_no in range(1, 8):
+            make_application(sr_no)
+        # Identical timestamps: the id tiebreaker must still give a total order
+        OpenCourtApplication.objects.filter(sr_no__lte=4).update(created_at=datetime(2025, 1, 1, tzinfo=dt_timezone.utc))
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+
+    def walk(self, **params):
+        url, seen = '/api/applications/', []
+        params = {'pagination': 'cursor', 'page_size': 3, **params}
+        with self.assertNumQueries(1):
+            response = self.client.get(url, params)
+        while True:
+            self.assertNotIn('count', response.data)
+            seen += [row['sr_no'] for row in response.data['results']]
+            if not response.data['next']:
+                return seen
+            response = self.client.get(response.data['next'])
+
+    def test_created_at_pages_cover_every_row_once(self):
+        expected = list(
+            OpenCourtApplication.objects.order_by('-created_at', '-id').values_list('sr_no', flat=True)
+        )
+        self.assertEqual(self.walk(), expected)
+
+    def test_sr_no_ordering_and_optional_count(self):
+        self.assertEqual(self.walk(ordering='-sr_no'), [7, 6, 5, 4, 3, 2, 1])
+        response = self.client.get('/api/applications/', {'pagination': 'cursor', 'with_count': 'true'})
+        self.assertEqual(response.data['count'], 7)
+
+    def test_bad_cursor_is_404(self):
+        response = self.client.get('/api/applications/', {'pagination': 'cursor', 'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_numbers_remain_the_default(self):
+        response = self.client.get('/api/applications/')
+        self.assertEqual(response.data['count'], 7)
+
+
+class FieldProjectionTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create(username='admin', role='ADMIN')
+        make_application(1, date=date(2025, 1, 5), remarks='Long remarks', created_by=self.admin)
+        make_application(2, name='Aslam Khan', created_by=self.admin)
+        self.client.force_authenticate(self.admin)
+
+    def test_projection_matches_full_serializer(self):
+        fields = ['sr_no', 'date', 'status', 'created_at', 'created_by_name', 'remarks']
+        full = self.client.get('/api/applications/', {'ordering': 'sr_no'}).data['results']
+        response = self.client.get('/api/applications/', {'ordering': 'sr_no', 'fields': ','.join(fields)})
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(response.data['results'], [{name: row[name] for name in fields} for row in full])
+
+    def test_projection_with_search_and_cursor(self):
+        response = self.client.get('/api/applications/', {'fields': 'name', 'search': 'aslam'})
+        self.assertEqual(response.data['results'], [{'name': 'Aslam Khan'}])
+        response = self.client.get('/api/applications/', {'fields': 'sr_no', 'pagination': 'cursor', 'page_size': 1})
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.data['results'], [{'sr_no': 1}])
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get('/api/applications/', {'fields': 'sr_no,video_response'})
+        self.assertEqual(response.status_code, 400)
+
+
+# =====================================================
+# DELTA SYNC
+# =====================================================
+
+@mock.patch('core.sync.SETTLE_SECONDS', 0)
+class DeltaSyncTests(APITestCase):
+    def setUp(self):
+        for sr_no in range(1, 4):
+            make_application(sr_no, police_station='Akbari Gate' if sr_no < 3 else 'Kot Lakhpat')
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+
+    def sync(self, since=None, **params):
+        if since:
+            params['since'] = since
+        return self.client.get('/api/applications/changes/', {'fields': 'sr_no,status', **params})
+
+    def test_first_sync_pages_then_deltas(self):
+        first = self.sync(limit=2).data
+        self.assertTrue(first['has_more'])
+        second = self.sync(first['token'], limit=2).data
+        self.assertFalse(second['has_more'])
+        self.assertEqual([row['sr_no'] for row in first['changed'] + second['changed']], [1, 2, 3])
+
+        self.assertEqual(self.sync(second['token']).data['changed'], [])
+        application = OpenCourtApplication.objects.get(sr_no=1)
+        self.client.patch(f'/api/applications/{application.pk}/update_status/', {'status': 'HEARD'})
+        deleted = OpenCourtApplication.objects.get(sr_no=2)
+        self.client.delete(f'/api/applications/{deleted.pk}/')
+
+        delta = self.sync(second['token']).data
+        self.assertEqual(delta['changed'], [{'sr_no': 1, 'status': 'HEARD'}])
+        self.assertEqual(delta['deleted'], [deleted.pk])
+
+    def test_staff_only_see_their_station(self):
+        token = self.sync().data['token']
+        OpenCourtApplication.objects.filter(sr_no__in=[1, 3]).delete()
+        self.client.force_authenticate(User.objects.create(username='staff', role='STAFF', police_station='Kot Lakhpat'))
+        self.assertEqual(len(self.sync(token).data['deleted']), 1)
+        self.assertEqual(self.sync().data['changed'], [])
+
+    def test_moving_station_deletes_from_the_old_one(self):
+        staff = User.objects.create(username='staff', role='STAFF', police_station='Akbari Gate')
+        self.client.force_authenticate(staff)
+        token = self.sync().data['token']
+
+        moved = OpenCourtApplication.objects.get(sr_no=1)
+        moved.police_station = 'Kot Lakhpat'
+        moved.save()
+        upsert_applications([(2, {'sr_no': 2, 'police_station': 'Kot Lakhpat'})])
+        delta = self.sync(token).data
+        self.assertEqual(delta['changed'], [])
+        moved_ids = OpenCourtApplication.objects.filter(sr_no__lt=3).order_by('id').values_list('id', flat=True)
+        self.assertEqual(sorted(delta['deleted']), list(moved_ids))
+
+        # Moved back: the row is visible again, so its old tombstone is not a delete
+        moved.police_station = 'akbari gate'
+        moved.save()
+        delta = self.sync(token).data
+        self.assertEqual(delta['changed'], [{'sr_no': 1, 'status': 'PENDING'}])
+        self.assertEqual(delta['deleted'], [OpenCourtApplication.objects.get(sr_no=2).pk])
+
+    def test_bad_and_expired_tokens(self):
+        self.assertEqual(self.sync('garbage').status_code, 400)
+        old = timezone.now() - TOMBSTONE_RETENTION - timedelta(days=1)
+        self.assertEqual(self.sync(encode_token((old, 0), (old, 0))).status_code, 410)
+
+
+class DeltaSyncSettleTests(APITestCase):
+    def test_fresh_writes_wait_to_settle(self):
+        make_application(1)
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+        response = self.client.get('/api/applications/changes/')
+        self.assertEqual(response.data['changed'], [])
+        OpenCourtApplication.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+        response = self.client.get('/api/applications/changes/')
+        self.assertEqual(len(response.data['changed']), 1)
+        self.assertIn('remarks', response.data['changed'][0])
+
+
+# =====================================================
+# BULK ACTIONS
+# =====================================================
+
+class BulkUpdateTests(APITestCase):
+    def setUp(self):
+        for sr_no in range(1, 6):
+            make_application(sr_no, status='HEARD' if sr_no < 5 else 'CLOSED', police_station='Akbari Gate' if sr_no < 4 else 'Kot Lakhpat')
+        self.ids = dict(OpenCourtApplication.objects.values_list('sr_no', 'id'))
+        self.client.force_authenticate(User.objects.create(username='staff', role='STAFF', police_station='Akbari Gate'))
+
+    def rollup_counts(self):
+        return sorted(ApplicationDailyRollup.objects.values_list('police_station', 'status', 'application_count'))
+
+    def test_ids_are_updated_in_one_statement_within_scope(self):
+        before = OpenCourtApplication.objects.get(sr_no=1).updated_at
+        ids = [self.ids[1], self.ids[2], self.ids[4], 999999]
+        with self.assertNumQueries(10):
+            response = self.client.post('/api/applications/bulk_update_status/', {'ids': ids, 'status': 'CLOSED'}, format='json')
+        self.assertEqual(response.data['updated_count'], 2)
+        self.assertEqual(
+            [row['result'] for row in response.data['results']],
+            ['updated', 'updated', 'not_found', 'not_found'],
+        )
+        self.assertGreater(OpenCourtApplication.objects.get(sr_no=1).updated_at, before)
+        self.assertEqual(OpenCourtApplication.objects.get(sr_no=4).status, 'HEARD')
+
+        counts = self.rollup_counts()
+        rebuild_rollups()
+        self.assertEqual(counts, self.rollup_counts())
+
+    def test_filter_selection_and_unchanged_rows(self):
+        OpenCourtApplication.objects.filter(sr_no=3).update(feedback='POSITIVE')
+        response = self.client.post(
+            '/api/applications/bulk_update_feedback/',
+            {'filter': {'status': 'HEARD'}, 'feedback': 'POSITIVE'},
+            format='json',
+        )
+        self.assertEqual(response.data['updated_count'], 2)
+        self.assertIn({'id': self.ids[3], 'result': 'unchanged'}, response.data['results'])
+        self.assertEqual(OpenCourtApplication.objects.filter(feedback='POSITIVE').count(), 3)
+
+    def test_selection_is_required(self):
+        for body in [{}, {'filter': {}}, {'filter': {'stauts': 'HEARD'}}, {'ids': 'all'}]:
+            response = self.client.post('/api/applications/bulk_update_status/', {**body, 'status': 'CLOSED'}, format='json')
+            self.assertEqual(response.status_code, 400, body)
+        self.assertFalse(OpenCourtApplication.objects.filter(status='CLOSED').exclude(sr_no=5).exists())
+
+
+# =====================================================
+# REFERENCE TABLES
+# =====================================================
+
+class ReferenceTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_spellings_resolve_to_one_reference(self):
+        PoliceStation.objects.create(name='Bhati Gate', aliases=['Bhatti Gate'])
+        make_application(1, police_station='bhati  gate ')
+        upsert_applications([
+            (2, {'sr_no': 2, 'police_station': 'BHATTI GATE', 'category': 'misc'}),
+            (3, {'sr_no': 3, 'police_station': 'Bhati Gate', 'category': 'Misc '}),
+        ])
+        station = PoliceStation.objects.get()
+        self.assertEqual(station.applications.count(), 3)
+        self.assertEqual(set(OpenCourtApplication.objects.values_list('police_station', flat=True)), {'Bhati Gate'})
+        self.assertEqual(Category.objects.count(), 1)
+
+    def test_staff_scoping_uses_the_reference(self):
+        make_application(1, police_station='Akbari Gate')
+        make_application(2, police_station='Kot Lakhpat')
+        staff = User.objects.create(username='staff', role='STAFF', police_station=' akbari GATE')
+        self.assertEqual(staff.police_station, 'Akbari Gate')
+        self.assertEqual(staff.police_station_ref, PoliceStation.objects.get(name='Akbari Gate'))
+
+        self.client.force_authenticate(staff)
+        response = self.client.get('/api/applications/')
+        self.assertEqual([row['sr_no'] for row in response.data['results']], [1])
+        self.assertEqual(self.client.get('/api/police-stations/').data, ['Akbari Gate', 'Kot Lakhpat'])
+
+
+class CaseInsensitiveLookupTests(APITestCase):
+    def assertUsesIndex(self, queryset, index_name):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest('EXPLAIN output checked on SQLite and PostgreSQL only')
+        if connection.vendor == 'postgresql':
+            # A test-sized table is cheaper to scan; ask whether the index *can* be used
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        self.assertIn(index_name, queryset.explain())
+
+    def test_filters_match_case_insensitively(self):
+        make_application(1, police_station='Akbari Gate', division='CITY')
+        make_application(2, police_station='Kot Lakhpat', division='MODEL TOWN')
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+        response = self.client.get('/api/applications/', {'police_station': ' AKBARI gate', 'division': 'city'})
+        self.assertEqual([row['sr_no'] for row in response.data['results']], [1])
+        response = self.client.get('/api/export-applications/', {'division': 'Model Town'})
+        self.assertEqual([row['sr_no'] for row in response.data['results']], [2])
+
+    def test_lookups_use_lower_indexes(self):
+        applications = OpenCourtApplication.objects.all()
+        self.assertUsesIndex(applications.filter(police_station__ciexact='akbari gate'), 'idx_police_station_lower')
+        self.assertUsesIndex(applications.filter(division__ciexact='city'), 'idx_division_lower')
+        self.assertUsesIndex(applications.filter(category__ciexact='misc'), 'idx_category_lower')
+        rollups = ApplicationDailyRollup.objects.filter(police_station__ciexact='akbari gate')
+        self.assertUsesIndex(rollups, 'idx_rollup_ps_lower')
+
+
+# =====================================================
+# SEARCH
+# =====================================================
+
+class SearchTests(APITestCase):
+    def setUp(self):
+        make_application(1, name='Muhammad Aslam', dairy_no='KK-77')
+        make_application(2, name='Aslam Khan', dairy_no='KK-78')
+        make_application(3, name='Sara Bibi', dairy_no='ASLAM-9')
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+
+    def search(self, term, **params):
+        response = self.client.get('/api/applications/', {'search': term, **params})
+        return [row['sr_no'] for row in response.data['results']]
+
+    def test_substring_match_is_ranked(self):
+        self.assertEqual(search_backend(), 'fts5')
+        self.assertCountEqual(self.search('aslam'), [1, 2, 3])
+        self.assertEqual(self.search('aslam', ordering='sr_no'), [1, 2, 3])
+        self.assertEqual(self.search('slam kh'), [2])
+
+    def test_index_follows_every_write_path(self):
+        OpenCourtApplication.objects.filter(sr_no=3).update(name='Zainab', dairy_no='Z-1')
+        OpenCourtApplication.objects.get(sr_no=1).delete()
+        upsert_applications([(2, {'sr_no': 4, 'name': 'Aslam Pervaiz'})])
+        self.assertCountEqual(self.search('aslam'), [2, 4])
+        self.assertEqual(self.search('zainab'), [3])
+
+    def test_short_terms_fall_back_to_icontains(self):
+        self.assertEqual(self.search('78'), [2])
+        # Every contact contains a 1; the exact Sr. No ranks first
+        self.assertEqual(self.search('1')[0], 1)
+
+
+# =====================================================
+# EXPORT
+# =====================================================
+
+class ExportTests(APITestCase):
+    def setUp(self):
+        make_application(1, date=date(2025, 1, 6), name='Ali')
+        make_application(2, police_station='Kot Lakhpat', name='Sara')
+        self.staff = User.objects.create(username='staff', role='STAFF', police_station='Akbari Gate')
+        self.client.force_authenticate(self.staff)
+
+    def test_csv_is_streamed_and_scoped(self):
+        response = self.client.get('/api/export-applications/', {'format': 'csv', 'ordering': 'sr_no'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        self.assertEqual(lines[0].split(',')[:3], ['Sr. No', 'Dairy No', 'Name'])
+        self.assertEqual(len(lines), 2)
+        self.assertIn('2025-01-06', lines[1])
+
+    def test_ndjson_and_xlsx(self):
+        response = self.client.get('/api/export-applications/', {'format': 'ndjson'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([row['name'] for row in rows], ['Ali'])
+
+        response = self.client.get('/api/export-applications/', {'format': 'xlsx'})
+        book = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)), read_only=True)
+        self.assertEqual(len(list(book.active.values)), 2)
+
+    def test_json_export_is_unchanged(self):
+        response = self.client.get('/api/export-applications/', {'ordering': 'not_a_field'})
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['name'], 'Ali')
+
+    def test_unauthenticated_stream_is_rejected(self):
+        self.client.force_authenticate(None)
+        response = self.client.get('/api/export-applications/', {'format': 'csv'})
+        self.assertEqual(response.status_code, 401)
+
+
+# =====================================================
+# COMPRESSION
+# =====================================================
+
+@override_settings(RESPONSE_COMPRESSION_ENCODINGS=['gzip'], RESPONSE_COMPRESSION_MIN_SIZE=1024, CACHE_SHARED=True)
+class CompressionTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        for sr_no in range(1, 41):
+            make_application(sr_no, remarks='Called applicant; hearing notes ' * 4)
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+
+    def test_large_json_is_gzipped(self):
+        plain = self.client.get('/api/applications/', {'page_size': 40})
+        response = self.client.get('/api/applications/', {'page_size': 40}, HTTP_ACCEPT_ENCODING='gzip, br;q=0')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(json.loads(gzip.decompress(response.content)), json.loads(plain.content))
+
+        # Weak ETag of the compressed body still revalidates
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        response = self.client.get('/api/applications/', {'page_size': 40}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_small_or_unaccepted_is_identity(self):
+        response = self.client.get('/api/applications/', {'page_size': 1}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        response = self.client.get('/api/applications/', {'page_size': 40}, HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_streamed_export_is_gzipped(self):
+        response = self.client.get('/api/export-applications/', {'format': 'csv'}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        lines = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8-sig').splitlines()
+        self.assertEqual(len(lines), 41)
+
+    def test_renderer_matches_stdlib(self):
+        data = {'date': date(2025, 1, 6), 'at': datetime(2025, 1, 6, 9, 30, tzinfo=dt_timezone.utc), 'name': 'عدالت'}
+        expected = JSONRenderer().render(data)
+        self.assertEqual(json.loads(FastJSONRenderer().render(data)), json.loads(expected))
+        with mock.patch('core.renderers.orjson', None):
+            self.assertEqual(FastJSONRenderer().render(data), expected)
+
+
+# =====================================================
+# METADATA CACHE
+# =====================================================
+
+@override_settings(CACHE_SHARED=True)
+class MetadataCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        make_application(1, police_station='Akbari Gate')
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+
+    def test_cached_until_data_version_changes(self):
+        with self.assertNumQueries(1):
+            first = self.client.get('/api/police-stations/')
+        with self.assertNumQueries(0):
+            cached = self.client.get('/api/police-stations/')
+        self.assertEqual(cached.data, ['Akbari Gate'])
+        self.assertEqual(cached['ETag'], first['ETag'])
+        self.assertIn('no-cache', cached['Cache-Control'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            make_application(2, police_station='Kot Lakhpat')
+        fresh = self.client.get('/api/police-stations/')
+        self.assertEqual(fresh.data, ['Akbari Gate', 'Kot Lakhpat'])
+        self.assertNotEqual(fresh['ETag'], first['ETag'])
+
+    def test_import_bumps_version(self):
+        etag = self.client.get('/api/categories/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            upsert_applications([(2, {'sr_no': 5, 'category': 'Fraud'})])
+        response = self.client.get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Fraud', response.data)
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get('/api/divisions/')['ETag']
+        response = self.client.get('/api/divisions/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+
+@override_settings(CACHE_SHARED=True)
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.application = make_application(1, police_station='Akbari Gate')
+        self.admin = User.objects.create(username='admin', role='ADMIN')
+        self.client.force_authenticate(self.admin)
+
+    def test_read_endpoints_answer_304_without_queries(self):
+        for url in ['/api/dashboard-stats/', '/api/analytics/', '/api/applications/',
+                    f'/api/applications/{self.application.pk}/', '/api/video-feedback-stats/']:
+            etag = self.client.get(url)['ETag']
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304, url)
+
+    def test_writes_and_scope_change_the_etag(self):
+        etag = self.client.get('/api/applications/')['ETag']
+        video_etag = self.client.get('/api/video-feedback-stats/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/applications/{self.application.pk}/update_status/', {'status': 'HEARD'})
+        response = self.client.get('/api/applications/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['status'], 'HEARD')
+        response = self.client.get('/api/video-feedback-stats/', HTTP_IF_NONE_MATCH=video_etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.force_authenticate(User.objects.create(username='staff', role='STAFF', police_station='Akbari Gate'))
+        response = self.client.get('/api/applications/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_per_process_cache_never_answers_304(self):
+        for url in ['/api/applications/', '/api/categories/']:
+            etag = self.client.get(url)['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual(response['ETag'], etag)
+
+
+# =====================================================
+# ROLLUPS
+# =====================================================
+
+def rollup_snapshot():
+    return sorted(
+        ApplicationDailyRollup.objects.values_list(
+            'date', 'police_station', 'division', 'category', 'status', 'feedback', 'application_count'
+        )
+    )
+
+
+class RollupTests(TestCase):
+    def assertRollupMatchesRebuild(self):
+        incremental = rollup_snapshot()
+        rebuild_rollups()
+        self.assertEqual(incremental, rollup_snapshot())
+
+    def test_save_and_delete_keep_rollup_current(self):
+        first = make_application(1, date=date(2025, 1, 1))
+        make_application(2, date=date(2025, 1, 1))
+        make_application(3)
+        self.assertEqual(ApplicationDailyRollup.objects.get(date=date(2025, 1, 1)).application_count, 2)
+
+        first.status = 'HEARD'
+        first.save()
+        OpenCourtApplication.objects.get(sr_no=3).delete()
+        self.assertRollupMatchesRebuild()
+
+    def test_bulk_import_keeps_rollup_current(self):
+        make_application(1, police_station='Old PS')
+        upsert_applications([
+            (2, {'sr_no': 1, 'police_station': 'New PS', 'status': 'CLOSED'}),
+            (3, {'sr_no': 2, 'police_station': 'New PS'}),
+        ])
+        self.assertFalse(ApplicationDailyRollup.objects.filter(police_station='Old PS').exists())
+        self.assertRollupMatchesRebuild()
+
+    def test_deltas_to_one_key_add_up(self):
+        key = (date(2025, 1, 1), 'Shahdara', 'CITY', 'FIR', 'PENDING', 'PENDING')
+        apply_rollup_deltas({key: 2})
+        apply_rollup_deltas({key: 3})
+        self.assertEqual(ApplicationDailyRollup.objects.get().application_count, 5)
+
+        # Increments happen in SQL: a stale in-memory count cannot overwrite them
+        stale = ApplicationDailyRollup.objects.get()
+        apply_rollup_deltas({key: -1})
+        apply_rollup_deltas({key: 1, (None, *key[1:]): 1})
+        stale.refresh_from_db()
+        self.assertEqual(stale.application_count, 5)
+
+        apply_rollup_deltas({key: -5})
+        self.assertFalse(ApplicationDailyRollup.objects.filter(date=date(2025, 1, 1)).exists())
+        self.assertEqual(ApplicationDailyRollup.objects.get(date__isnull=True).application_count, 1)
+
+
+# =====================================================
+# DASHBOARD
+# =====================================================
+
+class DashboardStatsTests(APITestCase):
+    def setUp(self):
+        make_application(1, status='PENDING', feedback='POSITIVE')
+        make_application(2, status='HEARD', feedback='NEGATIVE')
+        make_application(3, status='CLOSED', police_station='Kot Lakhpat', division='MODEL TOWN')
+        self.admin = User.objects.create(username='admin', role='ADMIN')
+        self.staff = User.objects.create(username='staff', role='STAFF', police_station='akbari gate ')
+
+    def test_admin_query_count(self):
+        self.client.force_authenticate(self.admin)
+        # totals, categories, police stations, divisions
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/dashboard-stats/')
+
+        stats = response.data['overall_stats']
+        self.assertEqual(stats['total_applications'], 3)
+        self.assertEqual(stats['pending'], 1)
+        self.assertEqual(stats['heard'], 1)
+        self.assertEqual(stats['closed'], 1)
+        self.assertEqual(stats['positive_feedback'], 1)
+        self.assertEqual(len(response.data['police_station_stats']), 2)
+
+    def test_staff_query_count_and_scoping(self):
+        self.client.force_authenticate(self.staff)
+        # totals, categories, divisions
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/dashboard-stats/')
+
+        stats = response.data['overall_stats']
+        self.assertEqual(stats['total_applications'], 2)
+        self.assertEqual(stats['closed'], 0)
+        self.assertEqual(response.data['police_station_stats'], [])
+
+    def test_base_table_path_matches_rollups(self):
+        self.client.force_authenticate(self.admin)
+        from_rollups = self.client.get('/api/dashboard-stats/').data
+        with override_settings(STATS_FROM_ROLLUPS=False), self.assertNumQueries(4):
+            from_table = self.client.get('/api/dashboard-stats/').data
+        self.assertEqual(from_rollups, from_table)
+
+
+class AnalyticsTests(APITestCase):
+    def setUp(self):
+        make_application(1, date=date(2025, 1, 6), status='PENDING', category=' fraud', marked_to='SHO Gate')
+        make_application(2, date=date(2025, 1, 7), status='HEARD', feedback='POSITIVE', category='Fraud', days=10, marked_to='SHO Gate')
+        make_application(3, date=date(2025, 2, 3), status='CLOSED', feedback='NEGATIVE', contact='',
+                         police_station='Kot Lakhpat', division='MODEL TOWN', days=4)
+        self.admin = User.objects.create(username='admin', role='ADMIN')
+        self.staff = User.objects.create(username='staff', role='STAFF', police_station='akbari gate ')
+
+    def test_metrics_are_aggregated(self):
+        self.client.force_authenticate(self.admin)
+        data = self.client.get('/api/analytics/').data
+
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(data['status_dist'], {'PENDING': 1, 'HEARD': 1, 'REFERRED': 0, 'CLOSED': 1})
+        self.assertEqual(data['monthly_trend'], [
+            {'month': 'Jan 2025', 'applications': 2}, {'month': 'Feb 2025', 'applications': 1},
+        ])
+        self.assertEqual(data['top_categories'][0], {'name': 'Fraud', 'count': 2})
+        self.assertEqual(data['top_shos'][0]['resolved'], 1)
+        self.assertEqual(data['contact_rate'][1]['value'], 1)
+        self.assertEqual(data['daily_submissions'][1], {'day': 'Mon', 'count': 2})
+        self.assertEqual(data['resolution_time'][1], {'status': 'Heard', 'days': 10})
+        self.assertEqual(data['pending_age'][-1]['count'], 1)
+
+    def test_date_range_and_staff_scoping(self):
+        self.client.force_authenticate(self.staff)
+        data = self.client.get('/api/analytics/', {'from_date': '2025-01-07', 'to_date': 'not-a-date'}).data
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['status_dist']['HEARD'], 1)
+
+    @override_settings(CACHE_SHARED=True)
+    def test_etag_changes_with_the_date(self):
+        self.client.force_authenticate(self.admin)
+        etag = self.client.get('/api/analytics/')['ETag']
+        self.assertEqual(self.client.get('/api/analytics/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # Same data, next day: the pending-age buckets moved on
+        tomorrow = timezone.now() + timedelta(days=1)
+        with mock.patch('django.utils.timezone.now', return_value=tomorrow):
+            response = self.client.get('/api/analytics/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_base_table_path_matches_rollups(self):
+        self.client.force_authenticate(self.admin)
+        from_rollups = self.client.get('/api/analytics/').data
+        with override_settings(STATS_FROM_ROLLUPS=False):
+            from_table = self.client.get('/api/analytics/').data
+        self.assertEqual(from_rollups, from_table)
+
+
+# =====================================================
+# MEDIA STREAMING
+# =====================================================
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, MEDIA_SENDFILE='')
+class VideoStreamTests(APITestCase):
+    def setUp(self):
+        self.body = bytes(range(256)) * 40
+        self.video = VideoFeedback.objects.create(
+            user_name='Ali', video_file=SimpleUploadedFile('clip.mp4', self.body, content_type='video/mp4'),
+        )
+        self.url = f'/api/video-feedback/{self.video.pk}/stream/'
+        self.admin = User.objects.create(username='admin', role='ADMIN')
+        self.client.force_authenticate(self.admin)
+
+    def test_ranges(self):
+        response = self.client.get(self.url, HTTP_ACCEPT='video/*')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'video/mp4')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(b''.join(response.streaming_content), self.body)
+
+        for header, (start, end) in [('bytes=100-199', (100, 199)), ('bytes=10000-', (10000, 10239)),
+                                     ('bytes=-40', (10200, 10239)), ('bytes=10200-99999', (10200, 10239))]:
+            response = self.client.get(self.url, HTTP_RANGE=header)
+            self.assertEqual(response.status_code, 206, header)
+            self.assertEqual(response['Content-Range'], f'bytes {start}-{end}/10240')
+            self.assertEqual(response['Content-Length'], str(end - start + 1))
+            self.assertEqual(b''.join(response.streaming_content), self.body[start:end + 1])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=20000-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */10240')
+        # Multiple ranges aren't served - the whole file is
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=0-1,5-6').status_code, 200)
+
+    def test_validators(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+
+    def test_stream_token_and_admin_only(self):
+        token = self.client.get(f'/api/video-feedback/{self.video.pk}/').data['stream_token']
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+        self.assertEqual(self.client.get(self.url, {'token': token}).status_code, 200)
+
+        # Neither the access JWT nor another video's token opens the stream
+        access = str(RefreshToken.for_user(self.admin).access_token)
+        self.assertEqual(self.client.get(self.url, {'token': access}).status_code, 401)
+        other = VideoFeedback.objects.create(user_name='Omar', video_file=SimpleUploadedFile('b.mp4', b'x'))
+        self.assertEqual(self.client.get(f'/api/video-feedback/{other.pk}/stream/', {'token': token}).status_code, 401)
+        with override_settings(MEDIA_STREAM_TOKEN_MAX_AGE=60), \
+                mock.patch('time.time', return_value=time.time() + 120):
+            self.assertEqual(self.client.get(self.url, {'token': token}).status_code, 401)
+
+        staff = User.objects.create(username='staff', role='STAFF')
+        response = self.client.get(self.url, {'token': stream_token(self.video, staff)})
+        self.assertEqual(response.status_code, 404)
+
+    def test_proxy_handoff(self):
+        with override_settings(MEDIA_SENDFILE='nginx', MEDIA_ACCEL_PREFIX='/protected-media/'):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.video.video_file.name}')
+        self.assertEqual(response.content, b'')
+
+
+# =====================================================
+# VIDEO PROCESSING
+# =====================================================
+
+def mp4_bytes(timescale, duration, version=0):
+    """ftyp + moov/mvhd - enough of an MP4 for the header duration probe"""
+    if version == 1:
+        mvhd = struct.pack('>B3xQQIQ', 1, 0, 0, timescale, duration)
+    else:
+        mvhd = struct.pack('>B3xIIII', 0, 0, 0, timescale, duration)
+    mvhd = struct.pack('>I4s', 8 + len(mvhd) + 80, b'mvhd') + mvhd + bytes(80)
+    moov = struct.pack('>I4s', 8 + len(mvhd), b'moov') + mvhd
+    ftyp = struct.pack('>I4s4sI', 16, b'ftyp', b'isom', 0)
+    return ftyp + moov + bytes(1000)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, VIDEO_PROCESSING_INLINE_THREAD=False)
+@mock.patch('core.videos.tool', return_value=None)
+class VideoProcessingTests(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+
+    def upload(self, content):
+        response = self.client.post('/api/video-feedback/', {
+            'user_name': 'Ali', 'video_file': SimpleUploadedFile('clip.mp4', content, content_type='video/mp4'),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['processing_status'], 'QUEUED')
+        return response.data['id']
+
+    def test_upload_is_queued_then_processed_without_ffmpeg(self, tool):
+        video_id = self.upload(mp4_bytes(1000, 12400))
+        video = process_next_video()
+        self.assertEqual(video.pk, video_id)
+        self.assertEqual(video.processing_status, 'DONE')
+        self.assertEqual((video.duration, video.file_size), (12, len(mp4_bytes(1000, 12400))))
+        self.assertFalse(video.thumbnail)
+        self.assertIsNone(process_next_video())
+
+    def test_header_probe(self, tool):
+        with tempfile.NamedTemporaryFile(suffix='.mp4') as handle:
+            handle.write(mp4_bytes(600, 600 * 3600, version=1))
+            handle.flush()
+            self.assertEqual(mp4_duration(handle.name), 3600)
+            handle.seek(0)
+            handle.write(b'not a video at all')
+            handle.truncate()
+            handle.flush()
+            self.assertIsNone(mp4_duration(handle.name))
+
+    def test_failure_is_recorded(self, tool):
+        video_id = self.upload(b'not a video')
+        with mock.patch('core.videos.probe_duration', side_effect=RuntimeError('boom')), \
+                self.assertLogs('core.videos', 'ERROR'):
+            video = process_next_video()
+        self.assertEqual((video.pk, video.processing_status, video.processing_error), (video_id, 'FAILED', 'boom'))
+
+    def test_video_of_a_dead_worker_is_reclaimed_then_failed(self, tool):
+        video_id = self.upload(mp4_bytes(1000, 12400))
+        stale = timezone.now() - timedelta(minutes=settings.VIDEO_PROCESSING_STALE_MINUTES + 1)
+        VideoFeedback.objects.filter(pk=video_id).update(
+            processing_status='RUNNING', processing_heartbeat_at=timezone.now(), processing_attempts=1,
+        )
+        self.assertIsNone(process_next_video())
+
+        VideoFeedback.objects.filter(pk=video_id).update(processing_heartbeat_at=stale)
+        video = process_next_video()
+        self.assertEqual((video.processing_status, video.processing_attempts, video.duration), ('DONE', 2, 12))
+
+        VideoFeedback.objects.filter(pk=video_id).update(
+            processing_status='RUNNING', processing_heartbeat_at=stale,
+            processing_attempts=settings.VIDEO_PROCESSING_MAX_ATTEMPTS,
+        )
+        with self.assertLogs('core.videos', 'ERROR'):
+            self.assertIsNone(process_next_video())
+        self.assertEqual(VideoFeedback.objects.get(pk=video_id).processing_status, 'FAILED')
+
+
+@override_settings(VIDEO_PROCESSING_INLINE_THREAD=False)
+class VideoIngestTests(TestCase):
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.folder = tempfile.mkdtemp()
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def write(self, directory, name, content, mtime=None):
+        path = os.path.join(directory, name)
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as handle:
+            handle.write(content)
+        if mtime:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def test_rerun_only_loads_new_files(self):
+        self.write(self.folder, 'a.mp4', b'first video', mtime=1736150400)
+        self.write(self.folder, 'b.MOV', b'second video')
+        self.write(self.folder, 'copy-of-a.mp4', b'first video')
+        self.write(self.folder, 'notes.txt', b'not a video')
+
+        stats = ingest_videos(self.folder, workers=2)
+        self.assertEqual((stats['found'], stats['hashed'], stats['skipped'], stats['created']), (3, 3, 1, 2))
+        video = VideoFeedback.objects.get(file_size=len(b'first video'))
+        self.assertEqual(video.submitted_date, datetime(2025, 1, 6, 8, 0, tzinfo=dt_timezone.utc))
+        self.assertEqual(video.processing_status, 'QUEUED')
+        video = VideoFeedback.objects.get(file_size=len(b'second video'))
+        self.assertRegex(video.video_file.name, r'^cas/[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}\.mov$')
+        with video.video_file.open('rb') as handle:
+            self.assertEqual(handle.read(), b'second video')
+        self.assertEqual(MediaBlob.objects.get(name=video.video_file.name).ref_count, 1)
+
+        self.write(self.folder, 'c.webm', b'third video')
+        out = io.StringIO()
+        call_command('load_videos', self.folder, stdout=out)
+        self.assertIn('4 files: 1 hashed, 3 already stored, 0 adopted, 1 created', out.getvalue())
+        self.assertEqual(VideoFeedback.objects.count(), 3)
+
+    def test_legacy_rows_are_adopted(self):
+        legacy = VideoFeedback.objects.create(user_name='Ali', video_file='video_feedback/a.mp4')
+        self.write(os.path.join(self.media, 'video_feedback'), 'a.mp4', b'first video')
+        self.write(os.path.join(self.media, 'video_feedback'), 'b.mp4', b'something else')
+        self.write(self.folder, 'a.mp4', b'first video')
+        self.write(self.folder, 'b.mp4', b'second video')
+
+        stats = ingest_videos(self.folder)
+        self.assertEqual((stats['adopted'], stats['created'], stats['copy']), (1, 1, 1))
+        legacy.refresh_from_db()
+        self.assertEqual((legacy.user_name, legacy.video_file.name, legacy.file_size), ('Ali', 'video_feedback/a.mp4', 11))
+        self.assertIsNotNone(legacy.content_hash)
+        self.assertTrue(VideoFeedback.objects.exclude(pk=legacy.pk).get().video_file.name.startswith('cas/'))
+
+# =====================================================
+# CONTENT-ADDRESSED STORAGE
+# =====================================================
+
+@override_settings(VIDEO_PROCESSING_INLINE_THREAD=False)
+class ContentAddressedStorageTests(APITestCase):
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.client.force_authenticate(User.objects.create(username='admin', role='ADMIN'))
+
+    def upload(self, content, name='clip.mp4'):
+        response = self.client.post('/api/video-feedback/', {
+            'user_name': 'Ali', 'video_file': SimpleUploadedFile(name, content, content_type='video/mp4'),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        return VideoFeedback.objects.get(pk=response.data['id'])
+
+    def blob_files(self):
+        return sorted(
+            os.path.relpath(os.path.join(directory, name), self.media)
+            for directory, _, names in os.walk(os.path.join(self.media, 'cas')) for name in names
+        )
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    def test_uploads_are_stored_once_hashed_while_received(self):
+        with mock.patch.object(ContentAddressedStorage, '_write_temp') as rehash:
+            first = self.upload(b'same video')
+            second = self.upload(b'same video', name='renamed.MP4')
+        rehash.assert_not_called()
+        digest = hashlib.sha256(b'same video').hexdigest()
+        self.assertEqual(first.video_file.name, f'cas/{digest[:2]}/{digest[2:4]}/{digest}.mp4')
+        self.assertEqual(second.video_file.name, first.video_file.name)
+        self.assertEqual(self.blob_files(), [first.video_file.name])
+        self.assertEqual(MediaBlob.objects.get().ref_count, 2)
+
+    def test_uploads_are_known_to_bulk_loads(self):
+        first = self.upload(b'same video')
+        second = self.upload(b'same video')
+        self.assertEqual((first.content_hash, first.file_size), (hashlib.sha256(b'same video').hexdigest(), 10))
+        # content_hash is unique - a second copy is stored without one
+        self.assertIsNone(second.content_hash)
+
+        folder = tempfile.mkdtemp()
+        with open(os.path.join(folder, 'clip.mp4'), 'wb') as handle:
+            handle.write(b'same video')
+        self.assertEqual(ingest_videos(folder)['skipped'], 1)
+        self.assertEqual(VideoFeedback.objects.count(), 2)
+
+    def test_references_follow_saves_and_deletes(self):
+        video = self.upload(b'video one')
+        other = self.upload(b'video one')
+        video.thumbnail.save('poster.jpg', ContentFile(b'jpeg bytes'))
+        thumbnail = video.thumbnail.name
+        self.assertEqual(MediaBlob.objects.get(name=thumbnail).ref_count, 1)
+
+        video.thumbnail.save('poster.jpg', ContentFile(b'other jpeg'))
+        self.assertEqual(MediaBlob.objects.get(name=thumbnail).ref_count, 0)
+        video.delete()
+        self.assertEqual(MediaBlob.objects.get(name=other.video_file.name).ref_count, 1)
+        self.assertTrue(other.video_file.storage.exists(other.video_file.name))
+
+        other.delete()
+        call_command('gc_media', '--grace-hours', '0', stdout=io.StringIO())
+        self.assertFalse(MediaBlob.objects.exists())
+        self.assertEqual(self.blob_files(), [])
+
+    def test_gc_recounts_and_keeps_young_blobs(self):
+        video = self.upload(b'video one')
+        VideoFeedback.objects.filter(pk=video.pk).update(preview=video.video_file.name)
+        stray = os.path.join(self.media, 'cas', 'tmp', 'leftover')
+        os.makedirs(os.path.dirname(stray), exist_ok=True)
+        open(stray, 'wb').close()
+        orphan = default_storage.save('documents/unused.pdf', ContentFile(b'%PDF'))
+
+        stats = collect_garbage()
+        self.assertEqual((stats['recounted'], stats['deleted'], stats['stray']), (1, 0, 0))
+        self.assertEqual(MediaBlob.objects.get(name=video.video_file.name).ref_count, 2)
+
+        stats = collect_garbage(grace=timedelta(0))
+        self.assertEqual((stats['deleted'], stats['stray']), (1, 1))
+        self.assertEqual(self.blob_files(), [video.video_file.name])
+        self.assertFalse(MediaBlob.objects.filter(name=orphan).exists())
+
+    def test_gc_handles_more_orphans_than_one_statement_takes(self):
+        MediaBlob.objects.bulk_create(
+            MediaBlob(name=f'cas/00/00/{index:064x}.mp4', digest=f'{index:064x}', size=1, ref_count=0)
+            for index in range(1200)
+        )
+        video = self.upload(b'video one')
+        with mock.patch('core.storage.GC_BATCH_SIZE', 50):
+            stats = collect_garbage(grace=timedelta(0))
+        self.assertEqual(stats['deleted'], 1200)
+        self.assertEqual(list(MediaBlob.objects.values_list('name', flat=True)), [video.video_file.name])
+
+    def test_gc_keeps_an_old_orphan_an_upload_just_reused(self):
+        old = timezone.now() - GC_GRACE - timedelta(hours=1)
+        orphan = default_storage.save('documents/unused.pdf', ContentFile(b'%PDF'))
+        MediaBlob.objects.filter(name=orphan).update(created_at=old)
+
+        # Saved again, its referencing row not committed yet
+        self.assertEqual(default_storage.save('documents/again.pdf', ContentFile(b'%PDF')), orphan)
+        self.assertEqual(collect_garbage()['deleted'], 0)
+        self.assertEqual(self.blob_files(), [orphan])
+
+        # Reused while gc_media is already working through its list
+        MediaBlob.objects.filter(name=orphan).update(created_at=old)
+
+        def reuse_then_recheck(names=None):
+            if names is not None:
+                default_storage.save('documents/again.pdf', ContentFile(b'%PDF'))
+            return count_references(names)
+
+        with mock.patch('core.storage.count_references', side_effect=reuse_then_recheck):
+            self.assertEqual(collect_garbage()['deleted'], 0)
+        self.assertEqual(self.blob_files(), [orphan])
+        self.assertTrue(MediaBlob.objects.filter(name=orphan).exists())
+
+
+# =====================================================
+# RESUMABLE UPLOADS
+# =====================================================
+
+class ResumableUploadTests(APITestCase):
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.user = User.objects.create(username='admin', role='ADMIN')
+        self.client.force_authenticate(self.user)
+
+    def start(self, content, **fields):
+        data = {'filename': 'clip.mp4', 'size': len(content), 'target': 'video_feedback', **fields}
+        response = self.client.post('/api/uploads/', data, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response['Upload-Offset'], '0')
+        return response.data['id']
+
+    def send(self, upload_id, offset, chunk, **headers):
+        return self.client.patch(
+            f'/api/uploads/{upload_id}/', chunk, content_type='application/offset+octet-stream',
+            headers={'Upload-Offset': str(offset), **headers},
+        )
+
+    def test_chunks_resume_from_the_server_offset(self):
+        content = os.urandom(3000)
+        upload_id = self.start(content, checksum=hashlib.sha256(content).hexdigest())
+
+        self.assertEqual(self.send(upload_id, 0, content[:1000]).status_code, 204)
+        # A retried chunk the server already has: told where to continue
+        response = self.send(upload_id, 0, content[:1000])
+        self.assertEqual((response.status_code, response.data['offset']), (409, 1000))
+        self.assertEqual(self.client.head(f'/api/uploads/{upload_id}/')['Upload-Offset'], '1000')
+
+        response = self.send(upload_id, 1000, content[1000:])
+        self.assertEqual((response.status_code, response['Upload-Offset']), (204, '3000'))
+
+        for fields in ({}, {'user_name': ['Ali']}, {'user_name': 'Ali', 'title': {'x': 1}}):
+            response = self.client.post(f'/api/uploads/{upload_id}/finalize/', fields, format='json')
+            self.assertEqual(response.status_code, 400, fields)
+
+        response = self.client.post(f'/api/uploads/{upload_id}/finalize/', {'user_name': ' Ali '}, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        video = VideoFeedback.objects.get(pk=response.data['id'])
+        self.assertEqual(video.user_name, 'Ali')
+        self.assertTrue(video.video_file.name.startswith('cas/'))
+        self.assertEqual((video.content_hash, video.file_size), (hashlib.sha256(content).hexdigest(), 3000))
+        with video.video_file.open('rb') as handle:
+            self.assertEqual(handle.read(), content)
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertEqual(os.listdir(os.path.join(self.media, 'uploads')), [])
+
+    def test_one_request_at_a_time_per_session(self):
+        upload_id = self.start(b'abcdef')
+        # A chunk still being received holds the session
+        UploadSession.objects.filter(pk=upload_id).update(locked_at=timezone.now())
+        response = self.send(upload_id, 0, b'abc')
+        self.assertEqual((response.status_code, response['Retry-After']), (423, '1'))
+
+        # ...until its lease runs out (the request died)
+        UploadSession.objects.filter(pk=upload_id).update(locked_at=timezone.now() - SESSION_LEASE * 2)
+        self.assertEqual(self.send(upload_id, 0, b'abcdef').status_code, 204)
+        self.assertIsNone(UploadSession.objects.get(pk=upload_id).locked_at)
+
+        # A finalize in progress: a second one must not create another video
+        UploadSession.objects.filter(pk=upload_id).update(locked_at=timezone.now())
+        response = self.client.post(f'/api/uploads/{upload_id}/finalize/', {'user_name': 'Ali'}, format='json')
+        self.assertEqual(response.status_code, 423)
+        self.assertFalse(VideoFeedback.objects.exists())
+
+    def test_corrupted_chunks_and_files_are_rejected(self):
+        content = b'x' * 100
+        upload_id = self.start(content, checksum=hashlib.sha256(b'something else').hexdigest())
+
+        wrong = base64.b64encode(hashlib.sha256(b'other').digest()).decode()
+        response = self.send(upload_id, 0, content, **{'Upload-Checksum': f'sha256 {wrong}'})
+        self.assertEqual((response.status_code, response['Upload-Offset']), (400, '0'))
+
+        right = base64.b64encode(hashlib.sha256(content).digest()).decode()
+        self.assertEqual(self.send(upload_id, 0, content, **{'Upload-Checksum': f'sha256 {right}'}).status_code, 204)
+        self.assertEqual(self.send(upload_id, 100, b'extra').status_code, 400)
+
+        response = self.client.post(f'/api/uploads/{upload_id}/finalize/', {'user_name': 'Ali'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(VideoFeedback.objects.exists())
+
+    def test_application_files_respect_station_scope(self):
+        own = make_application(1)
+        other = make_application(2, police_station='Kot Lakhpat')
+        self.client.force_authenticate(User.objects.create(username='staff', role='STAFF', police_station='Akbari Gate'))
+
+        response = self.client.post('/api/uploads/', {
+            'filename': 'doc.pdf', 'size': 4, 'target': 'supporting_documents', 'application': other.pk,
+        }, format='json')
+        self.assertEqual(response.status_code, 404)
+
+        upload_id = self.start(b'%PDF', filename='doc.pdf', target='supporting_documents', application=own.pk)
+        self.send(upload_id, 0, b'%PDF')
+        # Sessions are private to whoever started them
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.post(f'/api/uploads/{upload_id}/finalize/').status_code, 404)
+
+        self.client.force_authenticate(User.objects.get(username='staff'))
+        response = self.client.post(f'/api/uploads/{upload_id}/finalize/')
+        self.assertEqual(response.status_code, 201, response.data)
+        own.refresh_from_db()
+        with own.supporting_documents.open('rb') as handle:
+            self.assertEqual(handle.read(), b'%PDF')
+
+    def test_prune_drops_abandoned_sessions(self):
+        fresh = self.start(b'abc')
+        stale = self.start(b'def')
+        UploadSession.objects.filter(pk=stale).update(updated_at=timezone.now() - UPLOAD_SESSION_TTL * 2)
+        stale_part = part_path(UploadSession(pk=stale))
+
+        call_command('prune_upload_sessions', stdout=io.StringIO())
+        self.assertEqual(list(UploadSession.objects.values_list('pk', flat=True)), [uuid.UUID(fresh)])
+        self.assertFalse(os.path.exists(stale_part))
+
+
+# =====================================================
+# REQUEST METRICS
+# =====================================================
+
+class RequestMetricsTests(APITestCase):
+    def setUp(self):
+        registry.reset()
+        self.admin = User.objects.create(username='admin', role='ADMIN')
+        self.client.force_authenticate(self.admin)
+
+    def test_server_timing_and_log_line(self):
+        make_application(1)
+        with self.assertLogs('core.metrics', 'INFO') as logs:
+            response = self.client.get('/api/applications/')
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", render;dur=[\d.]+, total;dur=[\d.]+$')
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual((line['view'], line['status']), ('opencourtapplication-list', 200))
+        self.assertGreater(line['queries'], 0)
+
+    @override_settings(REQUEST_METRICS_N_PLUS_ONE=3)
+    def test_repeated_queries_are_flagged(self):
+        for sr_no in range(5):
+            make_application(sr_no, created_by=self.admin)
+        # The list view selects created_by in the same query - no warning
+        with self.assertNoLogs('core.metrics', 'WARNING'):
+            self.client.get('/api/applications/')
+
+        with mock.patch('core.views.OpenCourtApplication.objects.select_related', lambda *args: OpenCourtApplication.objects.all()):
+            with self.assertLogs('core.metrics', 'WARNING') as logs:
+                self.client.get('/api/applications/')
+        self.assertIn('Possible N+1 in GET opencourtapplication-list', logs.output[0])
+
+    def test_streamed_response_is_recorded_when_it_closes(self):
+        for sr_no in range(3):
+            make_application(sr_no)
+        with self.assertLogs('core.metrics', 'INFO') as logs:
+            response = self.client.get('/api/export-applications/', {'format': 'csv'})
+            self.assertEqual(logs.records, [])  # body not sent yet
+            b''.join(response.streaming_content)
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual(line['view'], 'export_applications')
+        # The export's own SELECTs ran while streaming - and were counted
+        self.assertGreater(line['queries'], 0)
+        self.assertEqual(registry.queries['export_applications'], line['queries'])
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(METRICS_TOKEN='scrape-me')
+    def test_prometheus_endpoint(self):
+        self.client.get('/api/police-stations/')
+        self.client.get('/api/police-stations/')
+
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 401)
+        response = self.client.get('/api/metrics/', headers={'Authorization': 'Bearer scrape-me'})
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('# TYPE http_request_duration_seconds histogram', body)
+        self.assertIn('http_request_duration_seconds_count{view="police_stations",method="GET"} 2', body)
+        self.assertIn('http_request_duration_seconds_bucket{view="police_stations",method="GET",le="+Inf"} 2', body)
+        self.assertIn('http_requests_total{view="police_stations",method="GET",status="200"} 2', body)
+
+        self.client.force_authenticate(User.objects.create(username='staff', role='STAFF'))
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 403)
+
+
+# =====================================================
+# SYNTHETIC DATA
+# =====================================================
+
+class SyntheticDataTests(TestCase):
+    def test_rows_are_appended_and_workbooks_round_trip(self):
+        make_application(7)
+        call_command('generate_synthetic_data', applications=300, stdout=io.StringIO())
+        self.assertEqual(OpenCourtApplication.objects.count(), 301)
+        self.assertEqual(OpenCourtApplication.objects.filter(sr_no__gt=7).count(), 300)
+        self.assertTrue(OpenCourtApplication.objects.filter(police_station_ref__isnull=False).exists())
+        self.assertGreater(OpenCourtApplication.objects.exclude(status='PENDING').count(), 0)
+
+        path = os.path.join(tempfile.mkdtemp(), 'register.xlsx')
+        call_command('generate_synthetic_data', workbook=path, workbook_rows=50, seed=3, stdout=io.StringIO())
+        errors = []
+        rows = list(iter_application_rows(path, errors=errors))
+        self.assertEqual(errors, [])
+        self.assertEqual(rows, list(synthetic_applications(50, seed=3)))
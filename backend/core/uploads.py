@@ -0,0 +1,238 @@
+# backend/core/uploads.py
+"""
+Resumable chunked uploads (tus-like) for large videos and documents.
+
+    POST   /api/uploads/                  {filename, size, target, application?, checksum?}
+    HEAD   /api/uploads/<id>/             -> Upload-Offset: bytes received so far
+    PATCH  /api/uploads/<id>/             Upload-Offset: n, raw bytes as the body
+    POST   /api/uploads/<id>/finalize/    -> the VideoFeedback / application it was attached to
+    DELETE /api/uploads/<id>/
+
+Chunks are streamed to a part file in small blocks, never held in memory,
+and no transaction stays open while they arrive. Instead a PATCH or
+finalize first leases the session with a conditional UPDATE of locked_at:
+only one request at a time writes to a session, and a second one gets
+UploadBusy. The offset moves, and the lease is released, once the bytes
+are on disk. A dropped connection keeps what arrived, and the client
+continues from Upload-Offset. The SHA-256 of the whole file is checked on
+finalize.
+"""
+
+import base64
+import hashlib
+import os
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import UploadSession, VideoFeedback
+from .videos import enqueue_video_processing, file_identity
+
+# Part files, under MEDIA_ROOT
+UPLOAD_DIR = 'uploads'
+# Largest file one session may declare, and largest single PATCH body
+MAX_UPLOAD_SIZE = 4 * 1024 ** 3
+MAX_CHUNK_SIZE = 32 * 1024 ** 2
+# Bytes read from the request per write
+READ_BLOCK = 64 * 1024
+# Sessions untouched this long are dropped by prune_upload_sessions
+UPLOAD_SESSION_TTL = timedelta(days=2)
+# A lease older than this belongs to a request that died - it may be taken over
+SESSION_LEASE = timedelta(minutes=10)
+
+
+class OffsetMismatch(Exception):
+    """The client's Upload-Offset isn't where the upload stands - resume from .offset"""
+
+    def __init__(self, offset):
+        super().__init__(f'Upload is at offset {offset}')
+        self.offset = offset
+
+
+class UploadBusy(Exception):
+    """Another request is writing or finalizing this upload - retry shortly"""
+
+
+def part_path(session):
+    return default_storage.path(f'{UPLOAD_DIR}/{session.pk}.part')
+
+
+def start_upload(session):
+    """Create the empty part file of a new session"""
+    path = part_path(session)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'wb').close()
+    return session
+
+
+def parse_checksum_header(value):
+    """Digest bytes of an `Upload-Checksum: sha256 <base64>` header (ValueError if malformed)"""
+    algorithm, _, encoded = value.strip().partition(' ')
+    if algorithm.lower() != 'sha256':
+        raise ValueError('Only sha256 chunk checksums are supported')
+    return base64.b64decode(encoded, validate=True)
+
+
+# =====================================================
+# ⚡ LEASE
+# =====================================================
+
+def claim_session(session):
+    """
+    Lease the session for this request - the conditional UPDATE lets only one
+    request in. Reloads the offset, which may have moved since the session
+    was read. Returns the lease (its locked_at); raises UploadBusy.
+    """
+    lease = timezone.now()
+    claimed = UploadSession.objects.filter(
+        Q(locked_at__isnull=True) | Q(locked_at__lt=lease - SESSION_LEASE), pk=session.pk,
+    ).update(locked_at=lease)
+    if not claimed:
+        raise UploadBusy('Another request is writing to this upload - retry shortly')
+    session.refresh_from_db(fields=['offset'])
+    return lease
+
+
+def release_session(session, lease):
+    UploadSession.objects.filter(pk=session.pk, locked_at=lease).update(locked_at=None)
+
+
+# =====================================================
+# ⚡ CHUNKS
+# =====================================================
+
+def append_chunk(session, offset, stream, length, checksum=None):
+    """
+    Write `length` bytes from `stream` at `offset` and advance the session.
+    Raises OffsetMismatch, UploadBusy, or ValueError for an oversized chunk
+    or a chunk checksum (digest bytes) that doesn't match. Returns the new
+    offset.
+    """
+    if offset + length > session.size:
+        raise ValueError(f'Chunk ends past the declared size of {session.size} bytes')
+
+    lease = claim_session(session)
+    try:
+        if offset != session.offset:
+            raise OffsetMismatch(session.offset)
+
+        hasher = hashlib.sha256() if checksum is not None else None
+        received = 0
+        with open(part_path(session), 'r+b') as handle:
+            handle.seek(offset)
+            while received < length:
+                block = stream.read(min(READ_BLOCK, length - received)) if stream is not None else b''
+                if not block:
+                    break  # client went away - keep what arrived
+                handle.write(block)
+                if hasher is not None:
+                    hasher.update(block)
+                received += len(block)
+
+        if hasher is not None and (received != length or hasher.digest() != checksum):
+            raise ValueError('Chunk checksum mismatch - resend the chunk')
+    except BaseException:
+        release_session(session, lease)
+        raise
+
+    # Move the offset and release in one statement - unless the lease expired
+    # mid-chunk and another request took the session over
+    moved = UploadSession.objects.filter(pk=session.pk, locked_at=lease).update(
+        offset=offset + received, updated_at=timezone.now(), locked_at=None
+    )
+    if not moved:
+        raise UploadBusy('The upload was taken over by another request - check Upload-Offset')
+    session.offset = offset + received
+    return session.offset
+
+
+# =====================================================
+# FINALIZE
+# =====================================================
+
+class PartFile(File):
+    """
+    The finished part file as upload content. Like a TemporaryUploadedFile it
+    has temporary_file_path() and content_hash, so the storage moves it
+    into place instead of copying (core/storage.py).
+    """
+
+    def __init__(self, path, name, content_hash):
+        super().__init__(open(path, 'rb'), name=name)
+        self.path = path
+        self.content_hash = content_hash
+
+    def temporary_file_path(self):
+        return self.path
+
+
+def finalize_upload(session, **video_fields):
+    """
+    Verify the file and attach it: a new VideoFeedback (video_fields fill
+    it in) or the file field of the session's application. Deletes the
+    session and returns the VideoFeedback / application. The session is
+    leased throughout, so a second finalize gets UploadBusy, not a second
+    VideoFeedback.
+    """
+    lease = claim_session(session)
+    try:
+        if session.offset != session.size:
+            raise ValueError(f'Upload incomplete: {session.offset} of {session.size} bytes received')
+
+        path = part_path(session)
+        with open(path, 'r+b') as handle:
+            handle.truncate(session.size)  # bytes past the end from an abandoned longer chunk
+            digest = hashlib.file_digest(handle, 'sha256').hexdigest()
+        if session.checksum and digest != session.checksum.lower():
+            raise ValueError('Checksum mismatch - the file was corrupted in transit, upload it again')
+
+        with PartFile(path, session.filename, digest) as content:
+            if session.target == 'video_feedback':
+                target = VideoFeedback(**video_fields, **file_identity(content, digest))
+                target.video_file.save(session.filename, content, save=False)
+                target.save()
+                enqueue_video_processing(target)
+            else:
+                target = session.application
+                getattr(target, session.target).save(session.filename, content, save=False)
+                target.save(update_fields=[session.target, 'updated_at'])
+    except BaseException:
+        release_session(session, lease)
+        raise
+
+    discard_upload(session)
+    return target
+
+
+def discard_upload(session):
+    """Delete a session and whatever is left of its part file"""
+    path = part_path(session)
+    if os.path.exists(path):
+        os.unlink(path)
+    session.delete()
+
+
+def prune_uploads(ttl=UPLOAD_SESSION_TTL):
+    """
+    Drop sessions untouched for `ttl`, plus part files older than that with
+    no session (left behind when a user or application was deleted).
+    Returns (sessions, files) removed.
+    """
+    cutoff = timezone.now() - ttl
+    stale = list(UploadSession.objects.filter(updated_at__lt=cutoff))
+    for session in stale:
+        discard_upload(session)
+
+    files = 0
+    directory = default_storage.path(UPLOAD_DIR)
+    if os.path.isdir(directory):
+        live = {str(pk) for pk in UploadSession.objects.values_list('pk', flat=True)}
+        for entry in os.scandir(directory):
+            stem = entry.name.removesuffix('.part')
+            if entry.is_file() and stem not in live and entry.stat().st_mtime < cutoff.timestamp():
+                os.unlink(entry.path)
+                files += 1
+    return len(stale), files
@@ -5,6 +5,7 @@ from . import views
 router = DefaultRouter()
 router.register(r'applications', views.OpenCourtApplicationViewSet)
 router.register(r'video-feedback', views.VideoFeedbackViewSet)  # ⭐ NEW
+router.register(r'uploads', views.UploadSessionViewSet, basename='upload')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -12,7 +13,11 @@ urlpatterns = [
     path('auth/logout/', views.logout_view, name='logout'),
     path('auth/user/', views.current_user, name='current_user'),
     path('upload-excel/', views.upload_excel, name='upload_excel'),
+    path('import-jobs/', views.import_jobs, name='import_jobs'),
+    path('import-jobs/<int:job_id>/', views.import_job_detail, name='import_job_detail'),
     path('dashboard-stats/', views.dashboard_stats, name='dashboard_stats'),
+    path('analytics/', views.analytics, name='analytics'),
+    path('metrics/', views.metrics, name='metrics'),
     path('police-stations/', views.police_stations, name='police_stations'),
     path('categories/', views.categories, name='categories'),
     
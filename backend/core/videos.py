@@ -0,0 +1,292 @@
+# backend/core/videos.py
+"""
+Video feedback processing: duration, poster thumbnail and a low-bitrate
+preview clip, filled in after the upload request has returned.
+
+Same queue as the Excel imports (core/jobs.py) - the VideoFeedback row is
+the job. ffmpeg/ffprobe (FFMPEG_BINARY / FFPROBE_BINARY) do the work when
+installed; without them the duration of MP4/MOV files is read from the
+container header and the thumbnail and preview are skipped.
+"""
+
+import logging
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .cache import bump_data_version_on_commit
+from .models import VideoFeedback
+
+logger = logging.getLogger(__name__)
+
+# Longest any one ffmpeg/ffprobe call may run
+FFMPEG_TIMEOUT = 300
+# Preview clip: first seconds of the video, small and muted
+PREVIEW_SECONDS = 15
+PREVIEW_HEIGHT = 360
+PREVIEW_BITRATE = '300k'
+THUMBNAIL_WIDTH = 480
+
+
+def file_identity(file, digest=None, exclude=None):
+    """
+    content_hash and file_size fields for a newly stored video file, so bulk
+    loads (core/ingest.py) recognise it. content_hash is unique: a second copy
+    of a file another video already holds is stored without one.
+    """
+    digest = digest or getattr(file, 'content_hash', None)
+    holders = VideoFeedback.objects.filter(content_hash=digest)
+    if exclude is not None:
+        holders = holders.exclude(pk=exclude.pk)
+    if not digest or holders.exists():
+        digest = None
+    return {'content_hash': digest, 'file_size': file.size}
+
+
+# =====================================================
+# QUEUE
+# =====================================================
+
+def enqueue_video_processing(video):
+    """(Re)queue a video - on upload or when its file is replaced"""
+    VideoFeedback.objects.filter(pk=video.pk).update(
+        processing_status='QUEUED', processing_error='', processing_attempts=0
+    )
+    bump_data_version_on_commit('videos')
+    if getattr(settings, 'VIDEO_PROCESSING_INLINE_THREAD', False):
+        start_video_thread(video.pk)
+
+
+def claim_video(video_id=None):
+    """
+    Atomically move one QUEUED video to RUNNING and return it (or None).
+
+    Like claim_import_job: a RUNNING video whose heartbeat is older than
+    VIDEO_PROCESSING_STALE_MINUTES lost its thread or worker and is claimed
+    again; after VIDEO_PROCESSING_MAX_ATTEMPTS claims it is marked FAILED.
+    """
+    now = timezone.now()
+    stale = Q(
+        processing_status='RUNNING',
+        processing_heartbeat_at__lt=now - timedelta(minutes=settings.VIDEO_PROCESSING_STALE_MINUTES),
+    )
+    fail_abandoned_videos(stale, now)
+
+    claimable = Q(processing_status='QUEUED') | stale
+    candidates = VideoFeedback.objects.filter(claimable)
+    if video_id is not None:
+        candidates = candidates.filter(pk=video_id)
+
+    for pk in candidates.order_by('submitted_date').values_list('pk', flat=True)[:5]:
+        claimed = VideoFeedback.objects.filter(claimable, pk=pk).update(
+            processing_status='RUNNING', processing_heartbeat_at=now,
+            processing_attempts=F('processing_attempts') + 1,
+        )
+        if claimed:
+            return VideoFeedback.objects.get(pk=pk)
+    return None
+
+
+def fail_abandoned_videos(stale, now):
+    """Give up on stale videos that already lost their worker VIDEO_PROCESSING_MAX_ATTEMPTS times"""
+    abandoned = VideoFeedback.objects.filter(stale, processing_attempts__gte=settings.VIDEO_PROCESSING_MAX_ATTEMPTS)
+    for pk in abandoned.values_list('pk', flat=True):
+        if abandoned.filter(pk=pk).update(
+            processing_status='FAILED', processed_at=now,
+            processing_error=f'Processing stopped responding {settings.VIDEO_PROCESSING_MAX_ATTEMPTS} times',
+        ):
+            logger.error("Video %s abandoned after %s attempts", pk, settings.VIDEO_PROCESSING_MAX_ATTEMPTS)
+            bump_data_version_on_commit('videos')
+
+
+def heartbeat(video):
+    VideoFeedback.objects.filter(pk=video.pk).update(processing_heartbeat_at=timezone.now())
+
+
+# =====================================================
+# PROBING
+# =====================================================
+
+def tool(name):
+    """Path of ffmpeg/ffprobe from settings, or None when not installed"""
+    return shutil.which(getattr(settings, f'{name.upper()}_BINARY', name))
+
+
+def run_tool(args):
+    subprocess.run(args, check=True, capture_output=True, timeout=FFMPEG_TIMEOUT)
+
+
+def probe_duration(path):
+    """Seconds (rounded) via ffprobe, else from the MP4/MOV header, else None"""
+    ffprobe = tool('ffprobe')
+    if ffprobe:
+        result = subprocess.run(
+            [ffprobe, '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=nw=1:nk=1', path],
+            capture_output=True, text=True, timeout=FFMPEG_TIMEOUT,
+        )
+        try:
+            return round(float(result.stdout.strip()))
+        except ValueError:
+            pass
+    return mp4_duration(path)
+
+
+def iter_boxes(handle, end):
+    """(type, payload offset, payload size) of the ISO-BMFF boxes up to `end`"""
+    while handle.tell() + 8 <= end:
+        start = handle.tell()
+        size, kind = struct.unpack('>I4s', handle.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack('>Q', handle.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - start
+        if size < header:
+            return
+        yield kind, start + header, size - header
+        handle.seek(start + size)
+
+
+def mp4_duration(path):
+    """Duration from the moov/mvhd box of an MP4/MOV file, or None"""
+    try:
+        with open(path, 'rb') as handle:
+            end = os.fstat(handle.fileno()).st_size
+            for kind, offset, size in iter_boxes(handle, end):
+                if kind != b'moov':
+                    continue
+                handle.seek(offset)
+                for inner, inner_offset, _ in iter_boxes(handle, offset + size):
+                    if inner != b'mvhd':
+                        continue
+                    handle.seek(inner_offset)
+                    version = handle.read(1)[0]
+                    if version == 1:
+                        handle.seek(inner_offset + 20)
+                        timescale, duration = struct.unpack('>IQ', handle.read(12))
+                    else:
+                        handle.seek(inner_offset + 12)
+                        timescale, duration = struct.unpack('>II', handle.read(8))
+                    return round(duration / timescale) if timescale else None
+    except (OSError, struct.error, IndexError):
+        pass
+    return None
+
+
+@contextmanager
+def local_path(field):
+    """A filesystem path for a FileField - copied to a temp file for remote storage"""
+    try:
+        path = field.path
+    except NotImplementedError:
+        path = None
+    if path is not None:
+        yield path
+        return
+
+    suffix = os.path.splitext(field.name)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix) as copy:
+        with field.open('rb') as source:
+            shutil.copyfileobj(source, copy)
+        copy.flush()
+        yield copy.name
+
+
+# =====================================================
+# ⚡ PROCESSING
+# =====================================================
+
+def process_video(video):
+    """Fill file_size, duration, thumbnail and preview of one video"""
+    video.file_size = video.video_file.size
+    ffmpeg = tool('ffmpeg')
+    stem = os.path.splitext(os.path.basename(video.video_file.name))[0]
+
+    with local_path(video.video_file) as source, tempfile.TemporaryDirectory() as workdir:
+        video.duration = probe_duration(source)
+        if not ffmpeg:
+            return
+
+        heartbeat(video)
+        thumbnail = os.path.join(workdir, f'{stem}.jpg')
+        run_tool([
+            ffmpeg, '-v', 'error', '-y', '-ss', str(min((video.duration or 0) / 10, 5)), '-i', source,
+            '-frames:v', '1', '-vf', f'scale={THUMBNAIL_WIDTH}:-2', thumbnail,
+        ])
+        with open(thumbnail, 'rb') as handle:
+            video.thumbnail.save(f'{stem}.jpg', File(handle), save=False)
+
+        heartbeat(video)
+        preview = os.path.join(workdir, f'{stem}-preview.mp4')
+        try:
+            run_tool([
+                ffmpeg, '-v', 'error', '-y', '-i', source, '-t', str(PREVIEW_SECONDS), '-an',
+                '-vf', f'scale=-2:{PREVIEW_HEIGHT}', '-c:v', 'libx264', '-preset', 'veryfast',
+                '-b:v', PREVIEW_BITRATE, '-movflags', '+faststart', preview,
+            ])
+        except subprocess.CalledProcessError:
+            # ffmpeg builds without libx264 - the poster is still useful on its own
+            logger.warning("No preview for video %s - libx264 encoding failed", video.pk)
+            return
+        with open(preview, 'rb') as handle:
+            video.preview.save(f'{stem}-preview.mp4', File(handle), save=False)
+
+
+def run_video_job(video):
+    """Process a claimed video and record DONE/FAILED on it"""
+    try:
+        process_video(video)
+    except Exception as e:
+        logger.exception("Video %s processing failed", video.pk)
+        VideoFeedback.objects.filter(pk=video.pk).update(
+            processing_status='FAILED', processing_error=str(e), processed_at=timezone.now()
+        )
+        bump_data_version_on_commit('videos')
+    else:
+        video.processing_status = 'DONE'
+        video.processing_error = ''
+        video.processed_at = timezone.now()
+        video.save(update_fields=[
+            'file_size', 'duration', 'thumbnail', 'preview',
+            'processing_status', 'processing_error', 'processed_at',
+        ])
+
+    video.refresh_from_db()
+    return video
+
+
+def process_next_video():
+    """Claim and process the oldest queued video. Returns it, or None if the queue is empty"""
+    video = claim_video()
+    if video is None:
+        return None
+    return run_video_job(video)
+
+
+def start_video_thread(video_id):
+    """Process one video on a daemon thread inside the web process (no worker needed)"""
+    def target():
+        close_old_connections()
+        try:
+            video = claim_video(video_id)
+            if video is not None:
+                run_video_job(video)
+        finally:
+            connection.close()
+
+    def start():
+        threading.Thread(target=target, name=f'video-{video_id}', daemon=True).start()
+
+    transaction.on_commit(start)
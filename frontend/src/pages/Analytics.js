@@ -1,5 +1,5 @@
-import React, { useEffect, useState, useMemo } from 'react';
-import { getApplications } from '../services/api';
+import React, { useCallback, useEffect, useState } from 'react';
+import { getAnalytics } from '../services/api';
 import { 
   BarChart, 
   Bar, 
@@ -36,8 +36,48 @@ import {
 } from 'lucide-react';
 import './Analytics.css';
 
+const EMPTY_METRICS = {
+  total: 0,
+  statusDist: { PENDING: 0, HEARD: 0, REFERRED: 0, CLOSED: 0 },
+  feedbackDist: { POSITIVE: 0, NEGATIVE: 0, PENDING: 0 },
+  monthlyTrend: [],
+  topPS: [],
+  topCategories: [],
+  divisionPerformance: [],
+  resolutionTime: [],
+  statusByPS: [],
+  contactRate: [],
+  topSHOs: [],
+  categoryFeedbackCorrelation: [],
+  dailySubmissions: [],
+  pendingAge: [],
+  monthlyFeedbackTrend: []
+};
+
+// ⚡ Metrics are aggregated by GET /api/analytics/ over the whole table
+const toMetrics = (data) => ({
+  total: data.total,
+  statusDist: data.status_dist,
+  feedbackDist: data.feedback_dist,
+  monthlyTrend: data.monthly_trend,
+  topPS: data.top_police_stations,
+  topCategories: data.top_categories,
+  divisionPerformance: data.division_performance,
+  resolutionTime: data.resolution_time,
+  statusByPS: data.status_by_police_station,
+  contactRate: data.contact_rate,
+  topSHOs: data.top_shos.map(sho => ({
+    ...sho,
+    name: sho.name.length > 20 ? sho.name.substring(0, 20) + '...' : sho.name
+  })),
+  categoryFeedbackCorrelation: data.category_feedback,
+  dailySubmissions: data.daily_submissions,
+  pendingAge: data.pending_age,
+  monthlyFeedbackTrend: data.monthly_feedback_trend
+});
+
 const Analytics = () => {
-  const [applications, setApplications] = useState([]);
+  const [metrics, setMetrics] = useState(EMPTY_METRICS);
   const [loading, setLoading] = useState(true);
   const [refreshing, setRefreshing] = useState(false);
   const [lastUpdate, setLastUpdate] = useState(null);
@@ -46,355 +86,33 @@ const Analytics = () => {
   const [fromDate, setFromDate] = useState('');
   const [toDate, setToDate] = useState('');
 
+  const fetchAllData = useCallback(async () => {
+    setRefreshing(true);
+    try {
+      const params = {};
+      if (fromDate) params.from_date = fromDate;
+      if (toDate) params.to_date = toDate;
+      const data = await getAnalytics(params);
+      setMetrics(toMetrics(data));
+      setLastUpdate(new Date());
+    } catch (error) {
+      console.error('❌ Error fetching analytics:', error);
+    } finally {
+      setLoading(false);
+      setRefreshing(false);
+    }
+  }, [fromDate, toDate]);
+
+  // ⚡ Date filters are applied server-side - refetch when they change
   useEffect(() => {
     fetchAllData();
-  }, []);
-
- // frontend/src/pages/Analytics.js
-
-// Find this section (around line 50-70):
-const fetchAllData = async () => {
-  setRefreshing(true);
-  try {
-    const appsData = await getApplications({});
-    // ⚡ FIX: Handle paginated response
-    setApplications(appsData.results || appsData || []); // Changed this line
-    setLastUpdate(new Date());
-  } catch (error) {
-    console.error('❌ Error fetching analytics:', error);
-  } finally {
-    setLoading(false);
-    setRefreshing(false);
-  }
-};
-  // Filter applications by date range
-  const filteredApplications = useMemo(() => {
-    if (!fromDate && !toDate) return applications;
-
-    return applications.filter(app => {
-      const appDate = new Date(app.date || app.created_at);
-      const from = fromDate ? new Date(fromDate) : null;
-      const to = toDate ? new Date(toDate) : null;
-
-      if (from && to) {
-        return appDate >= from && appDate <= to;
-      } else if (from) {
-        return appDate >= from;
-      } else if (to) {
-        return appDate <= to;
-      }
-      return true;
-    });
-  }, [applications, fromDate, toDate]);
+  }, [fetchAllData]);
 
   const clearFilters = () => {
     setFromDate('');
     setToDate('');
   };
 
-  const metrics = useMemo(() => {
-    if (!filteredApplications || filteredApplications.length === 0) {
-      return {
-        statusDist: { PENDING: 0, HEARD: 0, REFERRED: 0, CLOSED: 0 },
-        feedbackDist: { POSITIVE: 0, NEGATIVE: 0, PENDING: 0 },
-        monthlyTrend: [],
-        topPS: [],
-        topCategories: [],
-        divisionPerformance: [],
-        resolutionTime: [],
-        statusByPS: [],
-        contactRate: [],
-        topSHOs: [],
-        categoryFeedbackCorrelation: [],
-        dailySubmissions: [],
-        pendingAge: [],
-        monthlyFeedbackTrend: []
-      };
-    }
-
-    // 1. STATUS DISTRIBUTION
-    const statusDist = {
-      PENDING: filteredApplications.filter(a => a.status === 'PENDING').length,
-      HEARD: filteredApplications.filter(a => a.status === 'HEARD').length,
-      REFERRED: filteredApplications.filter(a => a.status === 'REFERRED').length,
-      CLOSED: filteredApplications.filter(a => a.status === 'CLOSED').length
-    };
-
-    // 2. FEEDBACK DISTRIBUTION
-    const feedbackDist = {
-      POSITIVE: filteredApplications.filter(a => a.feedback === 'POSITIVE').length,
-      NEGATIVE: filteredApplications.filter(a => a.feedback === 'NEGATIVE').length,
-      PENDING: filteredApplications.filter(a => a.feedback === 'PENDING').length
-    };
-
-    // 3. MONTHLY TREND
-    const monthlyData = {};
-    const monthYearMap = {};
-    
-    filteredApplications.forEach(app => {
-      if (app.date) {
-        try {
-          const date = new Date(app.date);
-          if (!isNaN(date.getTime())) {
-            const monthKey = date.toLocaleDateString('en-US', { month: 'short', year: 'numeric' });
-            const sortKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-            
-            monthlyData[monthKey] = (monthlyData[monthKey] || 0) + 1;
-            monthYearMap[monthKey] = sortKey;
-          }
-        } catch (e) {
-          console.error('Invalid date:', app.date);
-        }
-      }
-    });
-
-    const monthlyTrend = Object.entries(monthlyData)
-      .map(([month, applications]) => ({
-        month,
-        applications,
-        sortKey: monthYearMap[month]
-      }))
-      .sort((a, b) => a.sortKey.localeCompare(b.sortKey))
-      .slice(-12)
-      .map(({ month, applications }) => ({ month, applications }));
-
-    // 4. TOP 10 POLICE STATIONS
-    const psCount = {};
-    filteredApplications.forEach(app => {
-      if (app.police_station) {
-        if (!psCount[app.police_station]) {
-          psCount[app.police_station] = { pending: 0, resolved: 0 };
-        }
-        if (app.status === 'PENDING') {
-          psCount[app.police_station].pending++;
-        } else {
-          psCount[app.police_station].resolved++;
-        }
-      }
-    });
-
-    const topPS = Object.entries(psCount)
-      .map(([name, data]) => ({
-        name,
-        pending: data.pending,
-        resolved: data.resolved,
-        total: data.pending + data.resolved
-      }))
-      .sort((a, b) => b.total - a.total)
-      .slice(0, 10);
-
-    // 5. TOP 10 CATEGORIES
-    const catCount = {};
-    filteredApplications.forEach(app => {
-      if (app.category) {
-        const normalized = app.category.trim();
-        const titleCase = normalized.charAt(0).toUpperCase() + normalized.slice(1).toLowerCase();
-        catCount[titleCase] = (catCount[titleCase] || 0) + 1;
-      }
-    });
-    const topCategories = Object.entries(catCount)
-      .sort((a, b) => b[1] - a[1])
-      .slice(0, 10)
-      .map(([name, count]) => ({ name, count }));
-
-    // 6. DIVISION PERFORMANCE
-    const divisionData = {};
-    filteredApplications.forEach(app => {
-      if (app.division) {
-        if (!divisionData[app.division]) {
-          divisionData[app.division] = { name: app.division, total: 0, pending: 0, resolved: 0 };
-        }
-        divisionData[app.division].total++;
-        if (app.status === 'PENDING') {
-          divisionData[app.division].pending++;
-        } else {
-          divisionData[app.division].resolved++;
-        }
-      }
-    });
-    const divisionPerformance = Object.values(divisionData)
-      .sort((a, b) => b.total - a.total)
-      .slice(0, 8);
-
-    // 7. RESOLUTION TIME BY STATUS
-    const calculateAvgDays = (status) => {
-      const filtered = filteredApplications.filter(a => a.status === status && a.days);
-      if (filtered.length === 0) return 0;
-      const sum = filtered.reduce((acc, a) => acc + (a.days || 0), 0);
-      return Math.round(sum / filtered.length);
-    };
-
-    const resolutionTime = [
-      { status: 'Pending', days: calculateAvgDays('PENDING') },
-      { status: 'Heard', days: calculateAvgDays('HEARD') },
-      { status: 'Referred', days: calculateAvgDays('REFERRED') },
-      { status: 'Closed', days: calculateAvgDays('CLOSED') }
-    ];
-
-    // 8. STATUS BY POLICE STATION
-    const psStatusData = {};
-    filteredApplications.forEach(app => {
-      if (app.police_station) {
-        if (!psStatusData[app.police_station]) {
-          psStatusData[app.police_station] = { 
-            name: app.police_station, 
-            PENDING: 0, 
-            HEARD: 0, 
-            REFERRED: 0, 
-            CLOSED: 0 
-          };
-        }
-        psStatusData[app.police_station][app.status]++;
-      }
-    });
-    const statusByPS = Object.values(psStatusData)
-      .sort((a, b) => (b.PENDING + b.HEARD + b.REFERRED + b.CLOSED) - (a.PENDING + a.HEARD + a.REFERRED + a.CLOSED))
-      .slice(0, 8);
-
-    // ============= NEW ANALYTICS =============
-
-    // 9. CONTACT RATE ANALYSIS
-    const withContact = filteredApplications.filter(a => a.contact && a.contact.trim() !== '').length;
-    const withoutContact = filteredApplications.length - withContact;
-    const contactRate = [
-      { name: 'With Contact', value: withContact, percentage: ((withContact / filteredApplications.length) * 100).toFixed(1) },
-      { name: 'Without Contact', value: withoutContact, percentage: ((withoutContact / filteredApplications.length) * 100).toFixed(1) }
-    ];
-
-    // 10. TOP 10 SHOs (MARKED TO)
-    const shoCount = {};
-    filteredApplications.forEach(app => {
-      if (app.marked_to && app.marked_to.trim() !== '') {
-        const sho = app.marked_to.trim();
-        if (!shoCount[sho]) {
-          shoCount[sho] = { total: 0, resolved: 0, pending: 0 };
-        }
-        shoCount[sho].total++;
-        if (app.status === 'CLOSED' || app.status === 'HEARD') {
-          shoCount[sho].resolved++;
-        } else {
-          shoCount[sho].pending++;
-        }
-      }
-    });
-    const topSHOs = Object.entries(shoCount)
-      .map(([name, data]) => ({
-        name: name.length > 20 ? name.substring(0, 20) + '...' : name,
-        total: data.total,
-        resolved: data.resolved,
-        pending: data.pending,
-        efficiency: data.total > 0 ? ((data.resolved / data.total) * 100).toFixed(0) : 0
-      }))
-      .sort((a, b) => b.total - a.total)
-      .slice(0, 10);
-
-    // 11. CATEGORY VS FEEDBACK CORRELATION
-    const catFeedbackData = {};
-    filteredApplications.forEach(app => {
-      if (app.category) {
-        const normalized = app.category.trim();
-        const titleCase = normalized.charAt(0).toUpperCase() + normalized.slice(1).toLowerCase();
-        if (!catFeedbackData[titleCase]) {
-          catFeedbackData[titleCase] = { positive: 0, negative: 0, pending: 0 };
-        }
-        if (app.feedback === 'POSITIVE') catFeedbackData[titleCase].positive++;
-        if (app.feedback === 'NEGATIVE') catFeedbackData[titleCase].negative++;
-        if (app.feedback === 'PENDING') catFeedbackData[titleCase].pending++;
-      }
-    });
-    const categoryFeedbackCorrelation = Object.entries(catFeedbackData)
-      .map(([name, data]) => ({
-        name,
-        positive: data.positive,
-        negative: data.negative,
-        total: data.positive + data.negative + data.pending,
-        satisfaction: data.positive + data.negative > 0 ? 
-          ((data.positive / (data.positive + data.negative)) * 100).toFixed(0) : 0
-      }))
-      .sort((a, b) => b.total - a.total)
-      .slice(0, 8);
-
-    // 12. DAILY SUBMISSIONS (Day of Week Analysis)
-    const dayOfWeekData = { Sun: 0, Mon: 0, Tue: 0, Wed: 0, Thu: 0, Fri: 0, Sat: 0 };
-    const dayNames = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
-    filteredApplications.forEach(app => {
-      if (app.date) {
-        const date = new Date(app.date);
-        if (!isNaN(date.getTime())) {
-          const dayName = dayNames[date.getDay()];
-          dayOfWeekData[dayName]++;
-        }
-      }
-    });
-    const dailySubmissions = dayNames.map(day => ({
-      day,
-      count: dayOfWeekData[day]
-    }));
-
-    // 13. PENDING APPLICATIONS AGE DISTRIBUTION
-    const today = new Date();
-    const pendingApps = filteredApplications.filter(a => a.status === 'PENDING' && a.date);
-    const ageGroups = { '0-7 days': 0, '8-15 days': 0, '16-30 days': 0, '31-60 days': 0, '60+ days': 0 };
-    
-    pendingApps.forEach(app => {
-      const appDate = new Date(app.date);
-      const daysDiff = Math.floor((today - appDate) / (1000 * 60 * 60 * 24));
-      
-      if (daysDiff <= 7) ageGroups['0-7 days']++;
-      else if (daysDiff <= 15) ageGroups['8-15 days']++;
-      else if (daysDiff <= 30) ageGroups['16-30 days']++;
-      else if (daysDiff <= 60) ageGroups['31-60 days']++;
-      else ageGroups['60+ days']++;
-    });
-    
-    const pendingAge = Object.entries(ageGroups).map(([range, count]) => ({ range, count }));
-
-    // 14. MONTHLY FEEDBACK TREND
-    const monthlyFeedbackData = {};
-    filteredApplications.forEach(app => {
-      if (app.date && app.feedback !== 'PENDING') {
-        const date = new Date(app.date);
-        const monthKey = date.toLocaleDateString('en-US', { month: 'short', year: 'numeric' });
-        const sortKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-        
-        if (!monthlyFeedbackData[monthKey]) {
-          monthlyFeedbackData[monthKey] = { positive: 0, negative: 0, sortKey };
-        }
-        if (app.feedback === 'POSITIVE') monthlyFeedbackData[monthKey].positive++;
-        if (app.feedback === 'NEGATIVE') monthlyFeedbackData[monthKey].negative++;
-      }
-    });
-    
-    const monthlyFeedbackTrend = Object.entries(monthlyFeedbackData)
-      .map(([month, data]) => ({
-        month,
-        positive: data.positive,
-        negative: data.negative,
-        satisfaction: data.positive + data.negative > 0 ?
-          ((data.positive / (data.positive + data.negative)) * 100).toFixed(0) : 0,
-        sortKey: data.sortKey
-      }))
-      .sort((a, b) => a.sortKey.localeCompare(b.sortKey))
-      .slice(-6);
-
-    return {
-      statusDist,
-      feedbackDist,
-      monthlyTrend,
-      topPS,
-      topCategories,
-      divisionPerformance,
-      resolutionTime,
-      statusByPS,
-      contactRate,
-      topSHOs,
-      categoryFeedbackCorrelation,
-      dailySubmissions,
-      pendingAge,
-      monthlyFeedbackTrend
-    };
-  }, [filteredApplications]);
-
   const COLORS = {
     status: {
       PENDING: '#F59E0B',
@@ -415,7 +133,7 @@ const fetchAllData = async () => {
     const timestamp = new Date().toLocaleString();
     const csvContent = `Analytics Report - Generated: ${timestamp}\n\n` +
       `Date Range: ${fromDate || 'All'} to ${toDate || 'All'}\n` +
-      `Total Applications: ${filteredApplications.length}\n` +
+      `Total Applications: ${metrics.total}\n` +
       `Pending: ${metrics.statusDist.PENDING}\n` +
       `Heard: ${metrics.statusDist.HEARD}\n` +
       `Referred: ${metrics.statusDist.REFERRED}\n` +
@@ -442,7 +160,7 @@ const fetchAllData = async () => {
     );
   }
 
-  const totalApps = filteredApplications.length;
+  const totalApps = metrics.total;
   const resolutionRate = totalApps > 0 ? ((metrics.statusDist.CLOSED / totalApps) * 100).toFixed(1) : '0';
   const totalFeedback = metrics.feedbackDist.POSITIVE + metrics.feedbackDist.NEGATIVE;
   const positiveFeedbackRate = totalFeedback > 0 ? ((metrics.feedbackDist.POSITIVE / totalFeedback) * 100).toFixed(1) : '0';
@@ -492,7 +210,7 @@ const fetchAllData = async () => {
           </button>
         )}
         <span className="filter-count">
-          {filteredApplications.length} of {applications.length} records
+          {metrics.total.toLocaleString()} records
         </span>
       </div>
 
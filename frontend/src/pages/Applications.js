@@ -4,6 +4,8 @@ import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { 
   getApplications,
+  getApplicationById,
+  APPLICATION_TABLE_FIELDS,
   exportApplications,  // ⚡ ADD THIS
   getPoliceStations, 
   getCategories,
@@ -132,7 +134,8 @@ const Applications = () => {
         feedback: feedbackFilter,
         from_date: fromDate,
         to_date: toDate,
-        ordering
+        ordering,
+        fields: APPLICATION_TABLE_FIELDS
       });
       
       // ⚡ SET PAGINATED DATA
@@ -203,9 +206,15 @@ const Applications = () => {
   };
 
   // ⭐ View Details in Modal
-  const handleViewDetails = (app) => {
+  // (list rows only carry the table columns - load the full record)
+  const handleViewDetails = async (app) => {
     setSelectedApplication(app);
     setShowDetailModal(true);
+    try {
+      setSelectedApplication(await getApplicationById(app.id));
+    } catch (error) {
+      console.error('Error loading application details:', error);
+    }
   };
 
   // ⭐ Close Modal
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
 import { 
   Search, 
   Filter, 
@@ -15,11 +15,13 @@ import {
 } from 'lucide-react';
 import { useAuth } from '../context/AuthContext';
 import { 
-  getApplications, 
+  getApplicationChanges, 
+  APPLICATION_TABLE_FIELDS,
   getPoliceStations, 
   getCategories,
   updateApplicationStatus,
-  updateApplicationFeedback 
+  updateApplicationFeedback,
+  downloadApplicationsExport
 } from '../services/api';
 import './DataTablePage.css';
 const getUniqueValues = (array) => {
@@ -71,23 +73,60 @@ const DataTablePage = () => {
   const [currentPage, setCurrentPage] = useState(1);
   const [itemsPerPage, setItemsPerPage] = useState(50);
 
+  // ⚡ Delta sync: the token says how far allData has been synced, so a
+  // refresh only downloads rows changed (and ids deleted) since then
+  const syncTokenRef = useRef(null);
+  const rowsByIdRef = useRef(new Map());
+
   // Fetch data
   useEffect(() => {
     fetchAllData();
   }, []);
 
+  const syncApplications = async () => {
+    const rows = rowsByIdRef.current;
+    let data;
+    do {
+      try {
+        data = await getApplicationChanges(syncTokenRef.current, { fields: APPLICATION_TABLE_FIELDS });
+      } catch (error) {
+        if (error.response?.status !== 410 || !syncTokenRef.current) throw error;
+        // Token too old - start again from a full sync
+        syncTokenRef.current = null;
+        rows.clear();
+        data = null;
+        continue;
+      }
+      data.changed.forEach(row => rows.set(row.id, row));
+      data.deleted.forEach(id => rows.delete(id));
+      syncTokenRef.current = data.token;
+    } while (!data || data.has_more);
+
+    const applications = Array.from(rows.values());
+    setAllData(applications);
+    
+    // ✅ FIX: Extract unique divisions
+    const divisionValues = applications.map(a => a.division).filter(Boolean);
+    const uniqueDivisions = getUniqueValues(divisionValues);
+    setDivisions(uniqueDivisions);
+    
+    // ✅ FIX: Extract unique SHOs
+    const shoValues = applications.map(a => a.marked_to).filter(Boolean);
+    const uniqueSHOs = getUniqueValues(shoValues);
+    setShos(uniqueSHOs);
+  };
+
   const fetchAllData = async () => {
   setLoading(true);
   try {
-    const [apps, ps, cat] = await Promise.all([
-      getApplications({}),
+    syncTokenRef.current = null;
+    rowsByIdRef.current.clear();
+    const [, ps, cat] = await Promise.all([
+      syncApplications(),
       getPoliceStations(),
       getCategories()
     ]);
     
-    const applications = apps.results || apps;
-    setAllData(applications);
-    
     // ✅ FIX: Deduplicate police stations
     const uniquePS = getUniqueValues(ps);
     setPoliceStations(uniquePS);
@@ -96,16 +135,6 @@ const DataTablePage = () => {
     const uniqueCat = getUniqueValues(cat);
     setCategories(uniqueCat);
     
-    // ✅ FIX: Extract unique divisions
-    const divisionValues = applications.map(a => a.division).filter(Boolean);
-    const uniqueDivisions = getUniqueValues(divisionValues);
-    setDivisions(uniqueDivisions);
-    
-    // ✅ FIX: Extract unique SHOs
-    const shoValues = applications.map(a => a.marked_to).filter(Boolean);
-    const uniqueSHOs = getUniqueValues(shoValues);
-    setShos(uniqueSHOs);
-    
   } catch (error) {
     console.error('Error fetching data:', error);
   } finally {
@@ -115,8 +144,13 @@ const DataTablePage = () => {
 
   const handleRefresh = async () => {
     setRefreshing(true);
-    await fetchAllData();
-    setRefreshing(false);
+    try {
+      await syncApplications();
+    } catch (error) {
+      console.error('Error refreshing data:', error);
+    } finally {
+      setRefreshing(false);
+    }
   };
 
   // Filter and sort data
@@ -199,35 +233,23 @@ const DataTablePage = () => {
     });
   };
 
-  const exportToCSV = () => {
-    const headers = ['Sr. No', 'Dairy No', 'Name', 'Contact', 'PS', 'Division', 'Category', 'Marked To', 'Status', 'Feedback', 'Date', 'Days'];
-    const rows = filteredAndSortedData.map(item => [
-      item.sr_no,
-      item.dairy_no,
-      item.name,
-      item.contact,
-      item. police_station,
-      item. division,
-      item.category,
-      item.marked_to || '',
-      item.status,
-      item.feedback,
-      item.date || '',
-      item.days || ''
-    ]);
-
-    const csv = [headers, ...rows].map(row => row.map(cell => `"${cell}"`).join(',')).join('\n');
-    const blob = new Blob([csv], { type: 'text/csv' });
-    const url = URL. createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `applications_${new Date().toISOString().split('T')[0]}.csv`;
-    a.click();
+  const exportToCSV = async () => {
+    try {
+      await downloadApplicationsExport({
+        ...filters,
+        search: searchTerm,
+        ordering: sortDirection === 'desc' ? `-${sortField}` : sortField
+      }, 'csv');
+    } catch (error) {
+      alert('Failed to export data');
+    }
   };
 
   const handleStatusUpdate = async (id, status) => {
     try {
-      await updateApplicationStatus(id, status);
+      const updated = await updateApplicationStatus(id, status);
+      // Show the edit now - the sync only serves it once it has settled
+      rowsByIdRef.current.set(id, { ...rowsByIdRef.current.get(id), status: updated.status });
       await handleRefresh();
     } catch (error) {
       alert('Failed to update status');
@@ -236,7 +258,8 @@ const DataTablePage = () => {
 
   const handleFeedbackUpdate = async (id, feedback) => {
     try {
-      await updateApplicationFeedback(id, feedback, '');
+      const updated = await updateApplicationFeedback(id, feedback, '');
+      rowsByIdRef.current.set(id, { ...rowsByIdRef.current.get(id), feedback: updated.feedback });
       await handleRefresh();
     } catch (error) {
       alert('Failed to update feedback');
@@ -6,6 +6,7 @@ const UploadExcel = () => {
   const [file, setFile] = useState(null);
   const [uploading, setUploading] = useState(false);
   const [result, setResult] = useState(null);
+  const [progress, setProgress] = useState(null);
 
   const handleFileChange = (e) => {
     const selectedFile = e.target. files[0];
@@ -23,9 +24,10 @@ const UploadExcel = () => {
 
     setUploading(true);
     setResult(null);
+    setProgress(null);
 
     try {
-      const data = await uploadExcel(file);
+      const data = await uploadExcel(file, setProgress);
       setResult(data);
       setFile(null);
       // Reset file input
@@ -36,6 +38,7 @@ const UploadExcel = () => {
       });
     } finally {
       setUploading(false);
+      setProgress(null);
     }
   };
 
@@ -75,7 +78,9 @@ const UploadExcel = () => {
               className="upload-btn"
               disabled={uploading}
             >
-              {uploading ? 'Uploading...' : 'Upload File'}
+              {uploading
+                ? (progress ? `Processing... ${progress.rows_processed} rows` : 'Uploading...')
+                : 'Upload File'}
             </button>
           )}
         </div>
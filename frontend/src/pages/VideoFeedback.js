@@ -18,7 +18,7 @@ import {
   AlertCircle,
   Search
 } from 'lucide-react';
-import { getAllVideoFeedback, submitVideoFeedback, getVideoFeedbackStats } from '../services/api';
+import { getAllVideoFeedback, submitVideoFeedback, getVideoFeedbackStats, getVideoStreamURL } from '../services/api';
 import { useAuth } from '../context/AuthContext';
 import './VideoFeedback.css';
 
@@ -43,30 +43,8 @@ const VideoFeedback = () => {
   const [currentTime, setCurrentTime] = useState(0);
   const [duration, setDuration] = useState(0);
 
-  // ✅ Helper function to construct video URL
-  // ✅ Helper function to construct video URL - handles both cases
-const getVideoURL = (videoFile) => {
-  if (!videoFile) {
-    console.error('❌ No video file provided');
-    return '';
-  }
-  
-  // If videoFile already contains full URL, return it as-is
-  if (videoFile.startsWith('http://') || videoFile.startsWith('https://')) {
-    console.log('🎬 Video file is already a full URL:', videoFile);
-    return videoFile;
-  }
-  
-  // Otherwise, construct the URL
-  const cleanPath = videoFile.replace(/^\/+/, '');
-  const url = `http://localhost:8000/media/${cleanPath}`;
-  
-  console.log('🎬 Constructing video URL:');
-  console.log('   Input:', videoFile);
-  console.log('   Final URL:', url);
-  
-  return url;
-};
+  // ⚡ Authenticated, seekable stream (HTTP Range) instead of the raw /media/ file
+  const getVideoURL = (video, variant) => getVideoStreamURL(video, variant);
 
   useEffect(() => {
     fetchData();
@@ -340,14 +318,16 @@ const getVideoURL = (videoFile) => {
         ) : (
           currentVideos.map((video) => {
             const badge = getStatusBadge(video.admin_feedback);
-            const videoURL = getVideoURL(video.video_file);
+            // ⚡ Cards use the poster + low-bitrate preview once the worker has made them
+            const videoURL = video.preview ? getVideoURL(video, 'preview') : getVideoURL(video);
             
             return (
               <div key={video.id} className="video-card" onClick={() => handleVideoClick(video)}>
                 <div className="video-thumbnail">
                   <video 
                     src={videoURL}
-                    preload="metadata"
+                    poster={video.thumbnail || undefined}
+                    preload={video.thumbnail ? 'none' : 'metadata'}
                     onError={(e) => {
                       console.error('❌ Video load error:', videoURL);
                       console.error('Video file path:', video.video_file);
@@ -439,12 +419,12 @@ const getVideoURL = (videoFile) => {
                 <div className="video-player-wrapper">
                   <video
                     ref={videoRef}
-                    src={getVideoURL(selectedVideo.video_file)}
+                    src={getVideoURL(selectedVideo)}
                     onTimeUpdate={handleTimeUpdate}
                     onLoadedMetadata={handleTimeUpdate}
                     onEnded={() => setIsPlaying(false)}
                     onError={(e) => {
-                      console.error('❌ Modal video error:', getVideoURL(selectedVideo.video_file));
+                      console.error('❌ Modal video error:', getVideoURL(selectedVideo));
                     }}
                     className="video-player"
                   />
@@ -80,6 +80,13 @@ export const getCurrentUser = async () => {
 // ⚡ OPTIMIZED APPLICATIONS APIs WITH PAGINATION
 // ==========================================
 
+// Columns the application tables render - sent as ?fields= so list pages
+// skip remarks, file URLs and the rest of the full record
+export const APPLICATION_TABLE_FIELDS = [
+  'id', 'sr_no', 'dairy_no', 'name', 'contact', 'marked_to', 'date',
+  'police_station', 'division', 'category', 'status', 'days', 'feedback',
+];
+
 export const getApplications = async (params = {}) => {
   try {
     console.time('⚡ Fetch Applications');
@@ -105,9 +112,14 @@ export const getApplications = async (params = {}) => {
     // Ordering
     if (params.ordering) queryParams.append('ordering', params.ordering);
     
+    // Field projection
+    if (params.fields) queryParams.append('fields', params.fields.join(','));
+    
     const response = await api.get(`/applications/?${queryParams.toString()}`);
     
     console.timeEnd('⚡ Fetch Applications');
+    // db / render / total on the server - the rest of the time above is network
+    console.log(`🗄️ Server timing: ${response.headers['server-timing']}`);
     console.log(`✅ Fetched page ${params.page || 1}: ${response.data.results?.length || 0} items`);
     console.log(`📊 Total: ${response.data.count} applications`);
     
@@ -119,6 +131,23 @@ export const getApplications = async (params = {}) => {
   }
 };
 
+// GET - Rows changed / ids deleted since a sync token (omit it for the first sync)
+// Returns { changed, deleted, token, has_more }; a 410 means start over without a token
+export const getApplicationChanges = async (since, params = {}) => {
+  try {
+    const queryParams = new URLSearchParams();
+    if (since) queryParams.append('since', since);
+    if (params.fields) queryParams.append('fields', params.fields.join(','));
+    if (params.limit) queryParams.append('limit', params.limit);
+    
+    const response = await api.get(`/applications/changes/?${queryParams.toString()}`);
+    return response.data;
+  } catch (error) {
+    console.error('❌ Error syncing applications:', error);
+    throw error;
+  }
+};
+
 // GET - Fetch single application by ID
 export const getApplicationById = async (id) => {
   try {
@@ -204,6 +233,29 @@ export const updateApplicationFeedback = async (id, feedback, remarks = '') => {
   }
 };
 
+// POST - Update many applications in one request. `selection` is either
+// { ids: [...] } or { filter: { status: 'HEARD', ... } } (list filter params).
+// Returns { updated_count, results: [{ id, result: 'updated'|'unchanged'|'not_found' }] }
+export const bulkUpdateApplicationStatus = async (selection, status) => {
+  try {
+    const response = await api.post('/applications/bulk_update_status/', { ...selection, status });
+    return response.data;
+  } catch (error) {
+    console.error('❌ Error bulk updating status:', error);
+    throw error;
+  }
+};
+
+export const bulkUpdateApplicationFeedback = async (selection, feedback, remarks = '') => {
+  try {
+    const response = await api.post('/applications/bulk_update_feedback/', { ...selection, feedback, remarks });
+    return response.data;
+  } catch (error) {
+    console.error('❌ Error bulk updating feedback:', error);
+    throw error;
+  }
+};
+
 // ==========================================
 // DASHBOARD APIs
 // ==========================================
@@ -218,6 +270,17 @@ export const getDashboardStats = async () => {
   }
 };
 
+// ⚡ All Analytics page metrics, aggregated server-side
+export const getAnalytics = async (params = {}) => {
+  try {
+    const response = await api.get('/analytics/', { params });
+    return response.data;
+  } catch (error) {
+    console.error('❌ Error fetching analytics:', error);
+    throw error;
+  }
+};
+
 // ==========================================
 // METADATA APIs
 // ==========================================
@@ -275,25 +338,79 @@ export const exportApplications = async (params = {}) => {
     throw error;
   }
 };
+
+// ⚡ STREAMED EXPORT FILE (format: csv | ndjson | xlsx) - the server writes
+// the file row by row, the browser only saves it
+export const downloadApplicationsExport = async (params = {}, format = 'csv') => {
+  try {
+    const queryParams = { format };
+    Object.entries(params).forEach(([key, value]) => {
+      if (value) queryParams[key] = value;
+    });
+
+    const response = await api.get('/export-applications/', {
+      params: queryParams,
+      responseType: 'blob'
+    });
+
+    const url = window.URL.createObjectURL(response.data);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = `applications_${new Date().toISOString().split('T')[0]}.${format}`;
+    a.click();
+    window.URL.revokeObjectURL(url);
+  } catch (error) {
+    console.error('❌ Error downloading export:', error);
+    throw error;
+  }
+};
 // ==========================================
 // EXCEL UPLOAD API
 // ==========================================
 
-export const uploadExcel = async (file) => {
+// ⚡ Uploads are processed by a background import job; poll it until it finishes
+export const createImportJob = async (file) => {
+  const formData = new FormData();
+  formData.append('file', file);
+
+  const response = await api.post('/import-jobs/', formData, {
+    headers: {
+      'Content-Type': 'multipart/form-data',
+    },
+  });
+  return response.data;
+};
+
+export const getImportJob = async (id) => {
+  const response = await api.get(`/import-jobs/${id}/`);
+  return response.data;
+};
+
+export const uploadExcel = async (file, onProgress = null) => {
   try {
     console.log('📤 Uploading Excel file:', file.name);
-    
-    const formData = new FormData();
-    formData.append('file', file);
 
-    const response = await api.post('/upload-excel/', formData, {
-      headers: {
-        'Content-Type': 'multipart/form-data',
-      },
-    });
+    let job = await createImportJob(file);
 
-    console.log('✅ Excel file uploaded successfully');
-    return response.data;
+    while (job.status === 'QUEUED' || job.status === 'RUNNING') {
+      if (onProgress) onProgress(job);
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+      job = await getImportJob(job.id);
+    }
+
+    if (job.status === 'FAILED') {
+      const error = new Error(job.error_message);
+      error.response = { data: { error: `Error processing file: ${job.error_message}` } };
+      throw error;
+    }
+
+    console.log('✅ Excel file processed successfully');
+    return {
+      message: 'Excel file processed successfully',
+      created: job.created_count,
+      updated: job.updated_count,
+      errors: job.errors,
+    };
   } catch (error) {
     console.error('❌ Error uploading Excel file:', error);
     throw error;
@@ -355,6 +472,15 @@ export const getVideoFeedbackById = async (id) => {
   }
 };
 
+// ⚡ Range-capable stream for <video src> - a media element can't send the
+// Authorization header, so the video's own short-lived stream_token (from the
+// video-feedback list/detail response) rides in the query string
+export const getVideoStreamURL = (video, variant) => {
+  const params = new URLSearchParams({ token: video.stream_token || '' });
+  if (variant) params.set('variant', variant);
+  return `${API_BASE_URL}/video-feedback/${video.id}/stream/?${params}`;
+};
+
 export const submitVideoFeedback = async (id, feedback, remarks = '') => {
   try {
     console.log(`📝 Submitting feedback for video ${id}: ${feedback}`);
@@ -370,6 +496,68 @@ export const submitVideoFeedback = async (id, feedback, remarks = '') => {
   }
 };
 
+// ==========================================
+// ⚡ RESUMABLE UPLOADS (large videos / documents)
+// ==========================================
+
+const UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024;
+
+const toBase64 = (buffer) => btoa(String.fromCharCode(...new Uint8Array(buffer)));
+
+// Sends `file` in chunks; an interrupted upload of the same file (even after a
+// reload) continues from the server's offset instead of starting over.
+// target: 'video_feedback' (fields: user_name, title, description) or
+// 'video_response' / 'supporting_documents' (with applicationId)
+export const uploadResumable = async (file, { target, applicationId = null, fields = {}, onProgress = null }) => {
+  const key = `upload:${target}:${applicationId || ''}:${file.name}:${file.size}:${file.lastModified}`;
+  let session = null;
+
+  const saved = localStorage.getItem(key);
+  if (saved) {
+    try {
+      session = (await api.get(`/uploads/${saved}/`)).data;
+    } catch (error) {
+      localStorage.removeItem(key);  // expired or finished elsewhere
+    }
+  }
+  if (!session) {
+    session = (await api.post('/uploads/', {
+      filename: file.name, size: file.size, target, application: applicationId,
+    })).data;
+    localStorage.setItem(key, session.id);
+  }
+
+  let offset = session.offset;
+  while (offset < file.size) {
+    const chunk = await file.slice(offset, offset + UPLOAD_CHUNK_SIZE).arrayBuffer();
+    const digest = await crypto.subtle.digest('SHA-256', chunk);
+    try {
+      const response = await api.patch(`/uploads/${session.id}/`, chunk, {
+        headers: {
+          'Content-Type': 'application/offset+octet-stream',
+          'Upload-Offset': String(offset),
+          'Upload-Checksum': `sha256 ${toBase64(digest)}`,
+        },
+      });
+      offset = Number(response.headers['upload-offset']);
+    } catch (error) {
+      if (error.response?.status === 423) {
+        // An earlier, timed-out try of this chunk is still being received - wait for it
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        offset = Number(error.response.headers['upload-offset']);
+        continue;
+      }
+      if (error.response?.status !== 409) throw error;
+      offset = error.response.data.offset;  // server is elsewhere - continue from there
+    }
+    if (onProgress) onProgress(offset / file.size);
+  }
+
+  const response = await api.post(`/uploads/${session.id}/finalize/`, fields);
+  localStorage.removeItem(key);
+  return response.data;
+};
+
 export const getVideoFeedbackStats = async () => {
   try {
     const response = await api.get('/video-feedback-stats/');